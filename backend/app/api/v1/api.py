@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from .endpoints import (
+    apuracao,
     auth,
     candidatos_sp,
     candidatos_sp_22_24,
@@ -16,3 +17,4 @@ api_router.include_router(candidatos_sp.router)
 api_router.include_router(candidatos_sp_22_24.router)
 api_router.include_router(federais_nao_eleitos_sp.router)
 api_router.include_router(estaduais_nao_eleitos_sp.router)
+api_router.include_router(apuracao.router)
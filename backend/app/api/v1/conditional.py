@@ -0,0 +1,70 @@
+"""
+GET condicional (ETag / If-None-Match) nas rotas de leitura.
+
+A ETag de uma resposta é o hash do caminho, dos parâmetros da query, do
+formato negociado e das versões de cache das tabelas que a rota lê (as mesmas
+que invalidam o cache de respostas). Como as versões mudam a cada escrita, a
+ETag muda junto, e a comparação não precisa da resposta: com ``If-None-Match`` igual, a dependência
+responde 304 antes de abrir a sessão do banco.
+
+Sem versões confiáveis (cache desligado ou barramento ainda sincronizando), a
+rota responde normalmente, sem ETag.
+"""
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from ...core.cache import get_cache
+from ...core.compression import ENCODING_SUFFIXES
+from ...core.config import settings
+from ...core.serialization import negotiate_format
+
+
+def cache_control() -> str:
+    return f"public, max-age={settings.http_cache_max_age}, must-revalidate"
+
+
+def compute_etag(request: Request, stamp: str) -> str:
+    params = "&".join(
+        f"{name}={value}" for name, value in sorted(request.query_params.multi_items()) if value != ""
+    )
+    # O formato também pode vir do Accept, que não aparece na query.
+    fmt = negotiate_format(request.query_params.get("format"), request.headers.get("accept", ""))
+    digest = hashlib.blake2b(f"{request.url.path}|{stamp}|{params}|{fmt}".encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def _representation(tag: str) -> str:
+    """ETag sem o prefixo fraco (W/) e sem o sufixo da compressão (``-gzip``)."""
+    tag = tag.strip().removeprefix("W/")
+    for suffix in ENCODING_SUFFIXES:
+        if tag.endswith(f'{suffix}"'):
+            return f'{tag[: -len(suffix) - 1]}"'
+    return tag
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = [_representation(candidate) for candidate in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def conditional_get(*tables: str) -> Any:
+    """Dependência para ``dependencies=[...]`` de uma rota GET que lê ``tables``."""
+
+    def check(request: Request, response: Response) -> None:
+        response.headers["Cache-Control"] = cache_control()
+        stamp = get_cache().version_stamp(tables)
+        if stamp is None:
+            return
+        etag = compute_etag(request, stamp)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": cache_control()},
+            )
+        response.headers["ETag"] = etag
+
+    return Depends(check)
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from ....db.session import get_db
+from ....schemas.apuracao import ApuracaoStatusRead
+from ....services.apuracao_service import ApuracaoService
+from ..conditional import conditional_get
+
+router = APIRouter(tags=["apuracao"])
+
+
+@router.get(
+    "/apuracao",
+    response_model=ApuracaoStatusRead,
+    dependencies=[conditional_get(*ApuracaoService.TABLES)],
+)
+def status_apuracao(
+    db: Session = Depends(get_db),
+    desde: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Retorna apenas os totais de cargos alterados após esta sequência",
+    ),
+) -> ApuracaoStatusRead:
+    service = ApuracaoService(db)
+    return service.get_status(desde=desde)
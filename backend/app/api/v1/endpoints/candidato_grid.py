@@ -1,8 +1,9 @@
-from typing import List
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from ....core.serialization import encoded_response, field_selection, response_format
 from ....db.session import get_db
 from ....schemas.candidato_grid import (
     CandidatoGridCreate,
@@ -10,6 +11,7 @@ from ....schemas.candidato_grid import (
     CandidatoGridUpdate,
 )
 from ....services.candidato_grid_service import CandidatoGridService
+from ..conditional import conditional_get
 
 router = APIRouter(tags=["candidatos-grid"])
 
@@ -46,10 +48,34 @@ def atualizar_candidato(
         raise HTTPException(status_code=status_code, detail=str(exc)) from exc
 
 
-@router.get("/candidatos", response_model=List[CandidatoGridRead])
-def listar_candidatos(db: Session = Depends(get_db)) -> List[CandidatoGridRead]:
+@router.get(
+    "/candidatos",
+    response_model=List[CandidatoGridRead],
+    dependencies=[conditional_get(*CandidatoGridService.TABLES)],
+)
+def listar_candidatos(
+    response: Response,
+    db: Session = Depends(get_db),
+    formato: str = Depends(response_format),
+    campos: Optional[Tuple[str, ...]] = Depends(field_selection(CandidatoGridRead)),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=1000,
+        description="Número máximo de registros retornados (padrão: todos)",
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor da página seguinte, do cabeçalho X-Next-Cursor da resposta anterior",
+        min_length=1,
+    ),
+) -> Response:
     service = CandidatoGridService(db)
-    return service.list_candidatos()
+    try:
+        page = service.list_candidatos(formato, campos, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return encoded_response(page.body, response, formato, page.next_cursor)
 
 
 
@@ -1,18 +1,27 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from ....core.serialization import encoded_response, field_selection, response_format
 from ....db.session import get_db
 from ....schemas.candidato import CandidatoSPRead, CandidatoSPUpdate
 from ....services.candidato_service import CandidatoService
+from ..conditional import conditional_get
 
 router = APIRouter(tags=["candidatos"])
 
 
-@router.get("/candidatos2022sp", response_model=List[CandidatoSPRead])
+@router.get(
+    "/candidatos2022sp",
+    response_model=List[CandidatoSPRead],
+    dependencies=[conditional_get(*CandidatoService.TABLES)],
+)
 def listar_candidatos_sp(
+    response: Response,
     db: Session = Depends(get_db),
+    formato: str = Depends(response_format),
+    campos: Optional[Tuple[str, ...]] = Depends(field_selection(CandidatoSPRead)),
     nome_candidato: Optional[str] = Query(
         None,
         alias="nome_candidato",
@@ -31,16 +40,28 @@ def listar_candidatos_sp(
         le=100,
         description="Número máximo de registros retornados",
     ),
-) -> List[CandidatoSPRead]:
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor da página seguinte, do cabeçalho X-Next-Cursor da resposta anterior",
+        min_length=1,
+    ),
+) -> Response:
     filtro = nome_candidato or q
     service = CandidatoService(db)
-    return service.list_candidatos_sp(nome_candidato=filtro, limit=limit)
+    try:
+        page = service.list_candidatos_sp(
+            nome_candidato=filtro, limit=limit, formato=formato, campos=campos, cursor=cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return encoded_response(page.body, response, formato, page.next_cursor)
 
 
 @router.get(
     "/candidatos2022sp/{candidato_id}",
     response_model=CandidatoSPRead,
     status_code=status.HTTP_200_OK,
+    dependencies=[conditional_get(*CandidatoService.TABLES)],
 )
 def obter_candidato_sp(candidato_id: int, db: Session = Depends(get_db)) -> CandidatoSPRead:
     service = CandidatoService(db)
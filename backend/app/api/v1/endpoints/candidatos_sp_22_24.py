@@ -1,18 +1,27 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from ....core.serialization import encoded_response, field_selection, response_format
 from ....db.session import get_db
 from ....schemas.candidatos_sp_22_24 import CandidatosSP2224Read
 from ....services.candidatos_sp_22_24_service import CandidatosSP2224Service
+from ..conditional import conditional_get
 
 router = APIRouter(tags=["candidatos-sp-22-24"])
 
 
-@router.get("/candidatos-sp-22-24", response_model=List[CandidatosSP2224Read])
+@router.get(
+    "/candidatos-sp-22-24",
+    response_model=List[CandidatosSP2224Read],
+    dependencies=[conditional_get(*CandidatosSP2224Service.TABLES)],
+)
 def listar_candidatos_sp_22_24(
+    response: Response,
     db: Session = Depends(get_db),
+    formato: str = Depends(response_format),
+    campos: Optional[Tuple[str, ...]] = Depends(field_selection(CandidatosSP2224Read)),
     nome: Optional[str] = Query(
         None,
         alias="nome",
@@ -48,24 +57,37 @@ def listar_candidatos_sp_22_24(
         le=1000,
         description="Número máximo de registros retornados",
     ),
-) -> List[CandidatosSP2224Read]:
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor da página seguinte, do cabeçalho X-Next-Cursor da resposta anterior",
+        min_length=1,
+    ),
+) -> Response:
     """
     Lista os candidatos de SP das eleições de 2022 e 2024.
     """
     service = CandidatosSP2224Service(db)
-    return service.list_candidatos(
-        nome=nome,
-        partido=partido,
-        genero=genero,
-        ano=ano,
-        resultado_agregado=resultado_agregado,
-        limit=limit,
-    )
+    try:
+        page = service.list_candidatos(
+            nome=nome,
+            partido=partido,
+            genero=genero,
+            ano=ano,
+            resultado_agregado=resultado_agregado,
+            limit=limit,
+            formato=formato,
+            campos=campos,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return encoded_response(page.body, response, formato, page.next_cursor)
 
 
 @router.get(
     "/candidatos-sp-22-24/stats/count",
     status_code=status.HTTP_200_OK,
+    dependencies=[conditional_get(*CandidatosSP2224Service.TABLES)],
 )
 def contar_candidatos_sp_22_24(
     db: Session = Depends(get_db),
@@ -82,6 +104,7 @@ def contar_candidatos_sp_22_24(
     "/candidatos-sp-22-24/{registro_id}",
     response_model=CandidatosSP2224Read,
     status_code=status.HTTP_200_OK,
+    dependencies=[conditional_get(*CandidatosSP2224Service.TABLES)],
 )
 def obter_candidato_sp_22_24(
     registro_id: int,
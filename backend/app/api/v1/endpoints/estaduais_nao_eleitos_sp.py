@@ -1,18 +1,27 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from ....core.serialization import encoded_response, field_selection, response_format
 from ....db.session import get_db
 from ....schemas.estaduais_nao_eleitos_sp import EstaduaisNaoEleitosSPRead
 from ....services.estaduais_nao_eleitos_sp_service import EstaduaisNaoEleitosSPService
+from ..conditional import conditional_get
 
 router = APIRouter(tags=["estaduais-nao-eleitos-sp"])
 
 
-@router.get("/estaduais-nao-eleitos-sp", response_model=List[EstaduaisNaoEleitosSPRead])
+@router.get(
+    "/estaduais-nao-eleitos-sp",
+    response_model=List[EstaduaisNaoEleitosSPRead],
+    dependencies=[conditional_get(*EstaduaisNaoEleitosSPService.TABLES)],
+)
 def listar_estaduais_nao_eleitos_sp(
+    response: Response,
     db: Session = Depends(get_db),
+    formato: str = Depends(response_format),
+    campos: Optional[Tuple[str, ...]] = Depends(field_selection(EstaduaisNaoEleitosSPRead)),
     nome_candidato: Optional[str] = Query(
         None,
         alias="nome_candidato",
@@ -37,23 +46,36 @@ def listar_estaduais_nao_eleitos_sp(
         le=500,
         description="Número máximo de registros retornados",
     ),
-) -> List[EstaduaisNaoEleitosSPRead]:
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor da página seguinte, do cabeçalho X-Next-Cursor da resposta anterior",
+        min_length=1,
+    ),
+) -> Response:
     """
     Lista os deputados estaduais não eleitos de São Paulo.
     """
     service = EstaduaisNaoEleitosSPService(db)
-    return service.list_estaduais_nao_eleitos_sp(
-        nome_candidato=nome_candidato,
-        partido=partido,
-        situacao=situacao,
-        limit=limit,
-    )
+    try:
+        page = service.list_estaduais_nao_eleitos_sp(
+            nome_candidato=nome_candidato,
+            partido=partido,
+            situacao=situacao,
+            limit=limit,
+            formato=formato,
+            campos=campos,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return encoded_response(page.body, response, formato, page.next_cursor)
 
 
 @router.get(
     "/estaduais-nao-eleitos-sp/{registro_id}",
     response_model=EstaduaisNaoEleitosSPRead,
     status_code=status.HTTP_200_OK,
+    dependencies=[conditional_get(*EstaduaisNaoEleitosSPService.TABLES)],
 )
 def obter_estaduais_nao_eleitos_sp(
     registro_id: int,
@@ -72,6 +94,7 @@ def obter_estaduais_nao_eleitos_sp(
 @router.get(
     "/estaduais-nao-eleitos-sp/stats/count",
     status_code=status.HTTP_200_OK,
+    dependencies=[conditional_get(*EstaduaisNaoEleitosSPService.TABLES)],
 )
 def contar_estaduais_nao_eleitos_sp(
     db: Session = Depends(get_db),
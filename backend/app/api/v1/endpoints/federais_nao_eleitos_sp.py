@@ -1,18 +1,27 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from ....core.serialization import encoded_response, field_selection, response_format
 from ....db.session import get_db
 from ....schemas.federais_nao_eleitos_sp import FederaisNaoEleitosSPRead
 from ....services.federais_nao_eleitos_sp_service import FederaisNaoEleitosSPService
+from ..conditional import conditional_get
 
 router = APIRouter(tags=["federais-nao-eleitos-sp"])
 
 
-@router.get("/federais-nao-eleitos-sp", response_model=List[FederaisNaoEleitosSPRead])
+@router.get(
+    "/federais-nao-eleitos-sp",
+    response_model=List[FederaisNaoEleitosSPRead],
+    dependencies=[conditional_get(*FederaisNaoEleitosSPService.TABLES)],
+)
 def listar_federais_nao_eleitos_sp(
+    response: Response,
     db: Session = Depends(get_db),
+    formato: str = Depends(response_format),
+    campos: Optional[Tuple[str, ...]] = Depends(field_selection(FederaisNaoEleitosSPRead)),
     nome_candidato: Optional[str] = Query(
         None,
         alias="nome_candidato",
@@ -37,7 +46,12 @@ def listar_federais_nao_eleitos_sp(
         le=500,
         description="Número máximo de registros retornados",
     ),
-) -> List[FederaisNaoEleitosSPRead]:
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor da página seguinte, do cabeçalho X-Next-Cursor da resposta anterior",
+        min_length=1,
+    ),
+) -> Response:
     """
     Lista os deputados federais não eleitos de São Paulo em 2022.
     
@@ -45,18 +59,26 @@ def listar_federais_nao_eleitos_sp(
     ordenados por histórico de votos (maior para menor).
     """
     service = FederaisNaoEleitosSPService(db)
-    return service.list_federais_nao_eleitos_sp(
-        nome_candidato=nome_candidato,
-        partido=partido,
-        situacao=situacao,
-        limit=limit
-    )
+    try:
+        page = service.list_federais_nao_eleitos_sp(
+            nome_candidato=nome_candidato,
+            partido=partido,
+            situacao=situacao,
+            limit=limit,
+            formato=formato,
+            campos=campos,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return encoded_response(page.body, response, formato, page.next_cursor)
 
 
 @router.get(
     "/federais-nao-eleitos-sp/{registro_id}",
     response_model=FederaisNaoEleitosSPRead,
     status_code=status.HTTP_200_OK,
+    dependencies=[conditional_get(*FederaisNaoEleitosSPService.TABLES)],
 )
 def obter_federais_nao_eleitos_sp(
     registro_id: int, 
@@ -75,6 +97,7 @@ def obter_federais_nao_eleitos_sp(
 @router.get(
     "/federais-nao-eleitos-sp/stats/count",
     status_code=status.HTTP_200_OK,
+    dependencies=[conditional_get(*FederaisNaoEleitosSPService.TABLES)],
 )
 def contar_federais_nao_eleitos_sp(
     db: Session = Depends(get_db)
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Response, status
+from sqlalchemy import text
+
+from ....core.cache import get_cache
+from ....core.startup import DONE, state
+from ....db.session import get_engine
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live", status_code=status.HTTP_200_OK)
+def live() -> dict:
+    """
+    O processo está de pé e atendendo requisições.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/ready", status_code=status.HTTP_200_OK)
+def ready(response: Response) -> dict:
+    """
+    O worker pode receber tráfego: banco acessível e seeds concluídos.
+    """
+    from ....ingest.snapshot import default_snapshot_dir, snapshot_status
+
+    startup = state.as_dict()
+    database_ok = False
+    if state.database == DONE:
+        try:
+            with get_engine().connect() as connection:
+                connection.execute(text("SELECT 1"))
+            database_ok = True
+        except Exception as exc:  # noqa: BLE001 - qualquer falha torna o worker não pronto
+            startup["error"] = str(exc)
+
+    is_ready = database_ok and state.ready
+    if not is_ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {
+        "status": "ready" if is_ready else "starting",
+        "database": {"status": startup["database"], "reachable": database_ok},
+        "seed": {"status": startup["seed"]},
+        "cache": {
+            "snapshots": snapshot_status(default_snapshot_dir()),
+            "responses": get_cache().stats(),
+        },
+        "startup": startup,
+    }
@@ -0,0 +1,416 @@
+"""
+Cache de leitura das listagens, no nível dos serviços.
+
+Cada entrada é o corpo da resposta (JSON ou um dos formatos colunares), os
+mesmos bytes que o endpoint devolve (nas listagens paginadas, precedidos do
+cursor da página seguinte), guardado sob uma chave formada pelo nome
+da consulta, pelo formato, pelas versões das tabelas que ela lê e pelos
+filtros normalizados. Escritas (seeds, cargas, edições do grid) incrementam a
+versão da tabela: as chaves antigas deixam de ser lidas e saem pelo LRU ou
+pelo TTL, sem varredura.
+
+Backends (CACHE_BACKEND):
+
+* ``memory``: LRU no processo, limitado por número de entradas e por bytes;
+* ``redis``: qualquer servidor que fale o protocolo do Redis (CACHE_URL). Os
+  contadores de versão ficam no servidor e valem para todos os workers; o
+  limite de memória é o ``maxmemory`` do servidor, e valores maiores que
+  CACHE_MAX_BYTES não são gravados;
+* ``none``: desliga o cache.
+
+Com o backend ``memory``, os incrementos passam pelo barramento de
+``invalidation.py`` (CACHE_BUS) para chegar aos outros workers. Com o
+``redis`` o barramento não é usado: os contadores do servidor já são comuns.
+
+Em uma falta de cache, consultas idênticas simultâneas são executadas uma
+vez só (``singleflight.py``, SINGLE_FLIGHT), inclusive com o cache desligado.
+
+Falhas do backend nunca derrubam uma leitura: viram falta de cache.
+"""
+import logging
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from .config import settings
+from .pagination import Page, pack_page, unpack_page
+from .serialization import JSON, encode_rows
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MEMORY = "memory"
+REDIS = "redis"
+DISABLED = "none"
+
+
+class MemoryBackend:
+    """LRU em memória limitado por ``max_entries`` e ``max_bytes``."""
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            value, expires = item
+            if expires <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def incr(self, name: str) -> int:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+            return self._counters[name]
+
+    def counters(self, names: Sequence[str]) -> List[int]:
+        with self._lock:
+            return [self._counters.get(name, 0) for name in names]
+
+    def set_counters(self, versions: Mapping[str, int]) -> None:
+        with self._lock:
+            self._counters.update(versions)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+
+class RespBackend:
+    """Cache em um servidor com protocolo do Redis; chaves com prefixo ``prefix``."""
+
+    def __init__(self, url: str, max_bytes: int = 64 * 1024 * 1024, prefix: str = "painel:") -> None:
+        from .resp import RespClient
+
+        self.client = RespClient.from_url(url)
+        self.max_bytes = max_bytes
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(f"{self.prefix}cache:{key}")
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) <= self.max_bytes:
+            self.client.set(f"{self.prefix}cache:{key}", value, ex=max(int(ttl), 1))
+
+    def clear(self) -> None:
+        self.client.flushdb()
+
+    def incr(self, name: str) -> int:
+        return self.client.incr(f"{self.prefix}version:{name}")
+
+    def counters(self, names: Sequence[str]) -> List[int]:
+        values = self.client.mget([f"{self.prefix}version:{name}" for name in names])
+        return [int(value) if value else 0 for value in values]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"server": f"{self.client.host}:{self.client.port}/{self.client.db}"}
+
+
+def normalize_params(params: Mapping[str, Any]) -> str:
+    """
+    Filtros em forma canônica: sem valores vazios, em ordem alfabética e texto
+    em minúsculas (os filtros de texto usam ILIKE). Só entra aqui o que a
+    consulta também ignora: espaços nas pontas, por exemplo, mudam o ``LIKE``
+    e ficam na chave. Os valores vão com ``repr``, para que um ``&`` dentro
+    de um filtro não se confunda com a separação entre filtros.
+    """
+    parts = []
+    for name in sorted(params):
+        value = params[name]
+        if value is None or value == "":
+            continue
+        if isinstance(value, str):
+            value = value.lower()
+        parts.append(f"{name}={value!r}")
+    return "&".join(parts)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        backend: Optional[Any],
+        ttl: float = 300.0,
+        bus: Optional[Any] = None,
+        flights: Optional[SingleFlight] = None,
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.bus = bus
+        self.flights = flights
+        # Sem barramento, os contadores em memória recomeçam do zero a cada
+        # reinício: o marcador distingue versões de processos diferentes.
+        self._epoch = secrets.token_hex(4) if isinstance(backend, MemoryBackend) and bus is None else ""
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.bytes_hits = 0
+        self.bytes_misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def key(self, namespace: str, tables: Sequence[str], params: Mapping[str, Any]) -> str:
+        versions = self.backend.counters(list(tables))
+        stamp = ",".join(f"{table}@{version}" for table, version in zip(tables, versions))
+        return f"{namespace}|{stamp}|{normalize_params(params)}"
+
+    def version_stamp(self, tables: Sequence[str]) -> Optional[str]:
+        """
+        Versões atuais de ``tables`` para validação condicional (ETag), ou
+        ``None`` quando não há contadores confiáveis: cache desligado, backend
+        fora do ar ou barramento ainda sem a primeira leitura do banco.
+        """
+        if self.backend is None or (self.bus is not None and not self.bus.synced):
+            return None
+        try:
+            versions = self.backend.counters(list(tables))
+        except Exception:  # noqa: BLE001
+            self._failed("leitura de versões")
+            return None
+        stamp = ",".join(f"{table}@{version}" for table, version in zip(tables, versions))
+        return f"{self._epoch}:{stamp}" if self._epoch else stamp
+
+    def fetch_body(
+        self,
+        namespace: str,
+        tables: Sequence[str],
+        params: Mapping[str, Any],
+        load: Callable[[], Iterable[Any]],
+        kind: Any,
+        fmt: str = JSON,
+        dictionary: Sequence[str] = (),
+    ) -> bytes:
+        """
+        Corpo da resposta em cache, ou o das linhas de ``load`` serializadas
+        como ``kind`` no formato ``fmt`` (``serialization.encode_rows``).
+        """
+        if fmt != JSON:
+            namespace = f"{namespace}.{fmt}"
+        return self._fetch(
+            namespace, tables, params, lambda: encode_rows(kind, load(), fmt, dictionary)
+        )
+
+    def fetch_page(
+        self,
+        namespace: str,
+        tables: Sequence[str],
+        params: Mapping[str, Any],
+        load: Callable[[], Tuple[Iterable[Any], Optional[str]]],
+        kind: Any,
+        fmt: str = JSON,
+        dictionary: Sequence[str] = (),
+    ) -> Page:
+        """
+        Como ``fetch_body``, para listagens paginadas: ``load`` devolve as
+        linhas e o cursor da página seguinte, guardados juntos no cache.
+        """
+        namespace = f"{namespace}.page" if fmt == JSON else f"{namespace}.{fmt}.page"
+
+        def load_page() -> bytes:
+            rows, next_cursor = load()
+            return pack_page(encode_rows(kind, rows, fmt, dictionary), next_cursor)
+
+        return unpack_page(self._fetch(namespace, tables, params, load_page))
+
+    def _fetch(
+        self,
+        namespace: str,
+        tables: Sequence[str],
+        params: Mapping[str, Any],
+        load_body: Callable[[], bytes],
+    ) -> bytes:
+        if self.backend is None:
+            return self._load(f"{namespace}|{normalize_params(params)}", namespace, load_body)
+        try:
+            key = self.key(namespace, tables, params)
+            raw = self.backend.get(key)
+        except Exception:  # noqa: BLE001 - cache indisponível vira leitura direta
+            self._failed("leitura")
+            return self._load(f"{namespace}|{normalize_params(params)}", namespace, load_body)
+        if raw is not None:
+            self.hits += 1
+            return raw
+
+        self.misses += 1
+
+        def load_and_store() -> bytes:
+            value = load_body()
+            try:
+                self.backend.set(key, value, self.ttl)
+            except Exception:  # noqa: BLE001
+                self._failed("gravação")
+            return value
+
+        return self._load(key, namespace, load_and_store)
+
+    def fetch_bytes(self, key: str, build: Callable[[], bytes]) -> bytes:
+        """
+        Bytes prontos (por exemplo uma resposta comprimida) guardados sob
+        ``key``, que deve mudar junto com as versões das tabelas.
+        """
+        if self.backend is None:
+            return build()
+        try:
+            raw = self.backend.get(key)
+        except Exception:  # noqa: BLE001
+            self._failed("leitura")
+            return build()
+        if raw is not None:
+            self.bytes_hits += 1
+            return raw
+        self.bytes_misses += 1
+        value = build()
+        try:
+            self.backend.set(key, value, self.ttl)
+        except Exception:  # noqa: BLE001
+            self._failed("gravação")
+        return value
+
+    def _load(self, key: str, namespace: str, load: Callable[[], T]) -> T:
+        """Executa ``load``; chamadas simultâneas com a mesma chave esperam a primeira."""
+        if self.flights is None:
+            return load()
+        value, _ = self.flights.do(key, load, label=namespace)
+        return value
+
+    def bump(self, *tables: str) -> None:
+        if self.backend is None or not tables:
+            return
+        if self.bus is not None:
+            try:
+                self.bus.publish(tables, self.backend.set_counters)
+                return
+            except Exception:  # noqa: BLE001 - ao menos este processo fica coerente
+                self._failed("publicação de versões")
+        for table in tables:
+            try:
+                self.backend.incr(table)
+            except Exception:  # noqa: BLE001
+                self._failed("invalidação")
+
+    def start_bus(self) -> None:
+        """Passa a adotar as versões publicadas pelos outros processos."""
+        if self.bus is not None and self.backend is not None:
+            self.bus.start(self.backend.set_counters)
+
+    def stop_bus(self) -> None:
+        if self.bus is not None:
+            self.bus.stop()
+
+    def _failed(self, operation: str) -> None:
+        self.errors += 1
+        logger.warning("Falha na %s do cache de respostas.", operation, exc_info=True)
+
+    def stats(self) -> Dict[str, Any]:
+        info: Dict[str, Any] = {
+            "backend": type(self.backend).__name__ if self.backend else DISABLED,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "bytes_hits": self.bytes_hits,
+            "bytes_misses": self.bytes_misses,
+        }
+        if self.backend is not None:
+            try:
+                info.update(self.backend.stats())
+            except Exception:  # noqa: BLE001
+                info["reachable"] = False
+        if self.bus is not None:
+            info["bus"] = self.bus.stats()
+        if self.flights is not None:
+            info["single_flight"] = self.flights.stats()
+        return info
+
+
+def build_cache() -> ResponseCache:
+    kind = settings.cache_backend.lower()
+    if kind == DISABLED:
+        backend = None
+    elif kind == REDIS:
+        backend = RespBackend(settings.cache_url, max_bytes=settings.cache_max_bytes)
+    elif kind == MEMORY:
+        backend = MemoryBackend(settings.cache_max_entries, settings.cache_max_bytes)
+    else:
+        raise ValueError(f"CACHE_BACKEND desconhecido: {settings.cache_backend}")
+
+    bus = None
+    bus_kind = settings.cache_bus.lower()
+    if bus_kind == "database" and kind == REDIS:
+        # Os contadores já ficam no servidor, compartilhados por todos os workers.
+        logger.warning("CACHE_BUS=database ignorado com CACHE_BACKEND=redis.")
+    elif bus_kind == "database" or (bus_kind == "auto" and kind == MEMORY):
+        from .invalidation import DatabaseVersionBus
+
+        bus = DatabaseVersionBus(interval=settings.cache_bus_interval)
+    elif bus_kind not in {"auto", DISABLED}:
+        raise ValueError(f"CACHE_BUS desconhecido: {settings.cache_bus}")
+    flights = SingleFlight() if settings.single_flight else None
+    return ResponseCache(backend, ttl=settings.cache_ttl, bus=bus, flights=flights)
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = build_cache()
+    return _cache
+
+
+def set_cache(cache: ResponseCache) -> None:
+    """Troca o cache do processo (por exemplo por um apontando para o servidor RESP local)."""
+    global _cache
+    _cache = cache
+
+
+def bump_table_versions(tables: Iterable[str]) -> None:
+    """Invalida as listagens que leem ``tables``; chamado depois de cada escrita."""
+    get_cache().bump(*tables)
@@ -0,0 +1,153 @@
+"""
+Compressão das respostas (brotli e gzip), negociada pelo ``Accept-Encoding``.
+
+Só são comprimidas respostas 200 de JSON, MessagePack ou texto com pelo menos
+COMPRESS_MIN_SIZE bytes, no nível COMPRESS_LEVEL (gzip vai de 1 a 9; brotli,
+de 0 a 11). Respostas com ETag têm os bytes comprimidos guardados no cache de
+respostas sob a própria ETag, que já carrega as versões das tabelas: um acerto
+não comprime de novo, e uma escrita invalida a variante comprimida junto com
+a ETag. A ETag da variante comprimida ganha o sufixo da codificação
+(``"…-gzip"``), que ``conditional.py`` ignora ao comparar.
+"""
+import gzip
+from typing import Callable, Dict, List, Optional, Tuple
+
+import brotli
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .cache import get_cache
+
+COMPRESSIBLE_TYPES = ("application/json", "application/msgpack", "text/")
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    return gzip.compress(data, compresslevel=max(1, min(level, 9)), mtime=0)
+
+
+def _brotli(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=max(0, min(level, 11)))
+
+
+# Brotli é preferido quando o cliente aceita os dois com o mesmo peso.
+ENCODERS: Dict[str, Callable[[bytes, int], bytes]] = {"br": _brotli, "gzip": _gzip}
+ENCODING_SUFFIXES = tuple(f"-{name}" for name in ENCODERS)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """A codificação disponível de maior peso em ``Accept-Encoding``, ou ``None``."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    wildcard = weights.get("*", 0.0)
+    candidates = [
+        (weights.get(name, wildcard), -position, name)
+        for position, name in enumerate(ENCODERS)
+        if weights.get(name, wildcard) > 0
+    ]
+    return max(candidates)[2] if candidates else None
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, level: int = 6) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = negotiate(request_headers.get("accept-encoding"))
+        responder = _CompressingResponder(self, encoding, request_headers.get("if-none-match", ""), send)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, body: bytes, encoding: str, etag: Optional[str]) -> bytes:
+        """Bytes comprimidos, reaproveitados do cache de respostas quando há ETag."""
+        encoder = ENCODERS[encoding]
+        if etag is None:
+            return encoder(body, self.level)
+        return get_cache().fetch_bytes(f"http|{encoding}|{etag}", lambda: encoder(body, self.level))
+
+
+class _CompressingResponder:
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: Optional[str], if_none_match: str, send: Send
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.if_none_match = if_none_match
+        self.downstream = send
+        self.start: Optional[Message] = None
+        self.chunks: List[bytes] = []
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self.downstream(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(scope=message)
+            compressible = headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+            if self.encoding is None:
+                self.passthrough = True
+                await self.downstream(message)
+                return
+            if message["status"] == 304:
+                self._echo_encoded_etag(headers)
+            if message["status"] != 200 or not compressible or "content-encoding" in headers:
+                self.passthrough = True
+                await self.downstream(message)
+                return
+            self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.start is None:
+            await self.downstream(message)
+            return
+
+        self.chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+
+        body = b"".join(self.chunks)
+        headers = MutableHeaders(scope=self.start)
+        if len(body) >= self.middleware.minimum_size:
+            etag = headers.get("etag")
+            body, etag = await run_in_threadpool(self._compress, body, etag)
+            headers["Content-Encoding"] = self.encoding
+            headers["Content-Length"] = str(len(body))
+            if etag is not None:
+                headers["ETag"] = etag
+        await self.downstream(self.start)
+        await self.downstream({"type": "http.response.body", "body": body})
+
+    def _compress(self, body: bytes, etag: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        compressed = self.middleware.compress(body, self.encoding, etag)
+        return compressed, encoded_etag(etag, self.encoding) if etag else None
+
+    def _echo_encoded_etag(self, headers: MutableHeaders) -> None:
+        """No 304, devolve a ETag na forma que o cliente guardou (com ou sem sufixo)."""
+        etag = headers.get("etag")
+        if etag and encoded_etag(etag, self.encoding) in self.if_none_match:
+            headers["ETag"] = encoded_etag(etag, self.encoding)
+
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -12,6 +14,34 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = Field(
         default=60, validation_alias="ACCESS_TOKEN_EXPIRE_MINUTES"
     )
+    seed_batch_size: int = Field(default=1000, validation_alias="SEED_BATCH_SIZE")
+    seed_loader: str = Field(default="batch", validation_alias="SEED_LOADER")
+    seed_strategy: str = Field(default="shadow", validation_alias="SEED_STRATEGY")
+    seed_parallelism: int = Field(default=4, validation_alias="SEED_PARALLELISM")
+    snapshot_enabled: bool = Field(default=True, validation_alias="SNAPSHOT_ENABLED")
+    snapshot_dir: Optional[str] = Field(default=None, validation_alias="SNAPSHOT_DIR")
+    startup_db_max_attempts: int = Field(default=0, validation_alias="STARTUP_DB_MAX_ATTEMPTS")
+    startup_backoff_initial: float = Field(
+        default=0.5, validation_alias="STARTUP_BACKOFF_INITIAL"
+    )
+    startup_backoff_max: float = Field(default=30.0, validation_alias="STARTUP_BACKOFF_MAX")
+    live_results_dir: Optional[str] = Field(default=None, validation_alias="LIVE_RESULTS_DIR")
+    live_results_interval: float = Field(default=2.0, validation_alias="LIVE_RESULTS_INTERVAL")
+    cache_backend: str = Field(default="memory", validation_alias="CACHE_BACKEND")
+    cache_url: str = Field(default="redis://127.0.0.1:6379/0", validation_alias="CACHE_URL")
+    cache_ttl: float = Field(default=300.0, validation_alias="CACHE_TTL")
+    cache_max_entries: int = Field(default=512, validation_alias="CACHE_MAX_ENTRIES")
+    cache_max_bytes: int = Field(default=64 * 1024 * 1024, validation_alias="CACHE_MAX_BYTES")
+    cache_bus: str = Field(default="auto", validation_alias="CACHE_BUS")
+    cache_bus_interval: float = Field(default=0.25, validation_alias="CACHE_BUS_INTERVAL")
+    single_flight: bool = Field(default=True, validation_alias="SINGLE_FLIGHT")
+    compress_min_size: int = Field(default=1024, validation_alias="COMPRESS_MIN_SIZE")
+    compress_level: int = Field(default=6, validation_alias="COMPRESS_LEVEL")
+    http_cache_max_age: int = Field(default=0, validation_alias="HTTP_CACHE_MAX_AGE")
+    migration_backfill_chunk: int = Field(default=5000, validation_alias="MIGRATION_BACKFILL_CHUNK")
+    migration_backfill_pause: float = Field(
+        default=0.05, validation_alias="MIGRATION_BACKFILL_PAUSE"
+    )
 
     model_config = {
         "env_file": ".env",
@@ -0,0 +1,120 @@
+"""
+Invalidação do cache de respostas entre processos.
+
+Com o backend ``memory`` cada worker tem seus próprios contadores de versão.
+Para que uma escrita feita em um processo (outro worker do uvicorn, a CLI de
+ingestão, o acompanhamento da apuração) invalide o cache de todos, os
+incrementos passam pela tabela ``cache_versions``: quem escreve incrementa a
+linha da tabela e já adota a versão nova; os demais workers leem a tabela
+inteira (poucas linhas, uma consulta pela chave primária) a cada
+CACHE_BUS_INTERVAL segundos e adotam as versões que mudaram.
+
+As versões só avançam: uma leitura feita antes de uma publicação local não
+traz de volta a versão anterior. A comparação com ``seen`` e a atualização dos
+contadores acontecem juntas, sob um lock.
+
+Com o backend ``redis`` os contadores já são compartilhados e o barramento
+não é usado.
+"""
+import logging
+import threading
+from typing import Callable, Dict, Iterable, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseVersionBus:
+    def __init__(self, interval: float = 0.25) -> None:
+        self.interval = interval
+        self.seen: Dict[str, int] = {}
+        self.polls = 0
+        self.received = 0
+        # Até a primeira leitura, as versões locais podem estar atrás das do banco.
+        self.synced = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _table():
+        from ..db.models import CacheVersion
+
+        return CacheVersion.__table__
+
+    @staticmethod
+    def _engine():
+        from ..db.session import get_engine
+
+        return get_engine()
+
+    def _adopt(self, versions: Dict[str, int], apply: Callable[[Dict[str, int]], None]) -> Dict[str, int]:
+        """Aplica as versões de ``versions`` mais novas que as conhecidas e as devolve."""
+        with self._lock:
+            newer = {name: version for name, version in versions.items() if version > self.seen.get(name, 0)}
+            if newer:
+                self.seen.update(newer)
+                apply(newer)
+            return newer
+
+    def publish(self, tables: Iterable[str], apply: Callable[[Dict[str, int]], None]) -> Dict[str, int]:
+        """Incrementa as versões no banco, aplica as novas com ``apply`` e as devolve."""
+        table = self._table()
+        versions: Dict[str, int] = {}
+        with self._engine().begin() as connection:
+            for name in tables:
+                result = connection.execute(
+                    update(table).where(table.c.table_name == name).values(version=table.c.version + 1)
+                )
+                if not result.rowcount:
+                    try:
+                        with connection.begin_nested():
+                            connection.execute(table.insert().values(table_name=name, version=1))
+                    except IntegrityError:
+                        # Outro processo criou a linha entre o UPDATE e o INSERT.
+                        connection.execute(
+                            update(table).where(table.c.table_name == name).values(version=table.c.version + 1)
+                        )
+                versions[name] = connection.execute(
+                    select(table.c.version).where(table.c.table_name == name)
+                ).scalar_one()
+        self._adopt(versions, apply)
+        return versions
+
+    def poll(self, apply: Callable[[Dict[str, int]], None]) -> Dict[str, int]:
+        """Aplica com ``apply`` as versões que avançaram desde a última leitura."""
+        table = self._table()
+        with self._engine().connect() as connection:
+            current = dict(connection.execute(select(table.c.table_name, table.c.version)).all())
+        changed = self._adopt(current, apply)
+        self.polls += 1
+        self.received += len(changed)
+        return changed
+
+    def run(self, apply: Callable[[Dict[str, int]], None]) -> None:
+        while not self._stop.is_set():
+            try:
+                changed = self.poll(apply)
+                if changed:
+                    logger.debug("Versões de cache recebidas: %s", changed)
+                self.synced = True
+            except Exception:  # noqa: BLE001 - banco fora do ar: tenta na próxima leitura
+                logger.warning("Falha ao ler cache_versions.", exc_info=True)
+            self._stop.wait(self.interval)
+
+    def start(self, apply: Callable[[Dict[str, int]], None]) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, args=(apply,), name="cache-bus", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
+
+    def stats(self) -> Dict[str, int]:
+        return {"polls": self.polls, "received": self.received, "tables": len(self.seen), "synced": self.synced}
@@ -0,0 +1,105 @@
+"""
+Paginação por cursor (keyset) das listagens.
+
+Cada listagem ordena por uma coluna e desempata por ``id`` crescente (por
+exemplo ``votos DESC, id``), a mesma ordem das listagens por ``OFFSET``. A
+página seguinte começa logo depois da última linha da anterior (``WHERE`` sobre
+a coluna e o ``id``), em vez de ``OFFSET``: o banco desce direto ao ponto pelo
+índice ``(coluna, id)``, ``(coluna DESC, id)`` nas ordenações decrescentes, e
+uma página funda custa o mesmo que a primeira.
+
+O cursor é opaco para o cliente: o valor da coluna e o ``id`` da última linha,
+em JSON e base64url. Chega no cabeçalho ``X-Next-Cursor`` e volta em
+``?cursor=``; sem o cabeçalho, não há mais páginas.
+
+NULL ordena como o menor valor, como no MySQL e no SQLite.
+"""
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import Column, Table, and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+Position = Tuple[Any, int]
+
+
+class Page(NamedTuple):
+    body: bytes
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """Ordenação de ``table`` por ``column`` (decrescente se ``descending``) e ``id``."""
+
+    table: Table
+    column: str
+    descending: bool = False
+
+    @property
+    def sort(self) -> Column:
+        return self.table.c[self.column]
+
+    def columns(self, names: Optional[Sequence[str]] = None) -> List[Column]:
+        """Colunas do ``SELECT``; com projeção, inclui as da ordenação, que o cursor usa."""
+        if not names:
+            return list(self.table.columns)
+        return [self.table.c[name] for name in dict.fromkeys([*names, self.column, "id"])]
+
+    def order_by(self) -> List[Any]:
+        return [self.sort.desc() if self.descending else self.sort.asc(), self.table.c.id.asc()]
+
+    def after(self, position: Position) -> ColumnElement:
+        """Condição das linhas que vêm depois de ``position`` na ordenação."""
+        value, last_id = position
+        sort, key = self.sort, self.table.c.id
+        if self.descending:
+            if value is None:
+                return and_(sort.is_(None), key > last_id)
+            condition = or_(sort < value, and_(sort == value, key > last_id))
+            return or_(condition, sort.is_(None)) if sort.nullable else condition
+        if value is None:
+            return or_(sort.isnot(None), and_(sort.is_(None), key > last_id))
+        return or_(sort > value, and_(sort == value, key > last_id))
+
+    def encode(self, row: Any) -> str:
+        raw = json.dumps([row[self.column], row["id"]], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    def decode(self, cursor: str) -> Position:
+        """Posição do cursor; ``ValueError`` se ele não veio desta listagem."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            value, last_id = json.loads(raw)
+        except (ValueError, TypeError) as exc:
+            raise ValueError("Cursor inválido.") from exc
+        valid_value = (value is None and self.sort.nullable) or (
+            isinstance(value, self.sort.type.python_type) and not isinstance(value, bool)
+        )
+        if not valid_value or not isinstance(last_id, int) or isinstance(last_id, bool):
+            raise ValueError("Cursor inválido.")
+        return value, last_id
+
+    def page(self, rows: Sequence[Any], limit: Optional[int]) -> Tuple[Sequence[Any], Optional[str]]:
+        """
+        Corta ``rows``, lidas com ``limit + 1``, em ``limit`` linhas. A linha a
+        mais só indica que há outra página, e então o cursor aponta a última.
+        """
+        if limit is None or len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, self.encode(rows[-1])
+
+
+def pack_page(body: bytes, next_cursor: Optional[str]) -> bytes:
+    """Página em um só valor para o cache: cursor (ASCII), quebra de linha e corpo."""
+    return (next_cursor or "").encode("ascii") + b"\n" + body
+
+
+def unpack_page(raw: bytes) -> Page:
+    cursor, _, body = raw.partition(b"\n")
+    return Page(body, cursor.decode("ascii") or None)
@@ -0,0 +1,250 @@
+"""
+Cliente mínimo do protocolo do Redis (RESP2) e um servidor local que fala o
+mesmo protocolo, para desenvolvimento e testes sem um Redis de verdade.
+
+O servidor entende apenas os comandos usados pelo cache: PING, GET, SET (com
+EX/PX), DEL, EXISTS, INCR, MGET, FLUSHDB e DBSIZE.
+
+    python -m app.core.resp --port 6390
+"""
+import argparse
+import socket
+import socketserver
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
+
+Value = Union[bytes, str, int, float]
+
+
+class RespError(Exception):
+    """Erro devolvido pelo servidor (linha ``-ERR ...``)."""
+
+
+def _encode_command(args: Sequence[Value]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, bytes):
+            data = arg
+        elif isinstance(arg, str):
+            data = arg.encode("utf-8")
+        else:
+            data = str(arg).encode("ascii")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def _read_reply(stream) -> Any:
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Conexão encerrada pelo servidor")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        raise RespError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        size = int(payload)
+        if size < 0:
+            return None
+        data = stream.read(size + 2)
+        return data[:-2]
+    if kind == b"*":
+        size = int(payload)
+        if size < 0:
+            return None
+        return [_read_reply(stream) for _ in range(size)]
+    raise RespError(f"Resposta inesperada: {line!r}")
+
+
+class RespClient:
+    """Conexão única, protegida por lock; reconecta uma vez quando a conexão cai."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0, timeout: float = 1.0) -> None:
+        self.host, self.port, self.db, self.timeout = host, port, db, timeout
+        self._lock = threading.Lock()
+        self._socket: Optional[socket.socket] = None
+        self._stream = None
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 1.0) -> "RespClient":
+        parsed = urlparse(url)
+        db = int(parsed.path.strip("/") or 0)
+        return cls(parsed.hostname or "127.0.0.1", parsed.port or 6379, db, timeout)
+
+    def _connect(self) -> None:
+        self._socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._stream = self._socket.makefile("rb")
+        if self.db:
+            self._socket.sendall(_encode_command(["SELECT", self.db]))
+            _read_reply(self._stream)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._socket is not None:
+            try:
+                self._stream.close()
+                self._socket.close()
+            finally:
+                self._socket = self._stream = None
+
+    def execute(self, *args: Value) -> Any:
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    if self._socket is None:
+                        self._connect()
+                    self._socket.sendall(_encode_command(args))
+                    return _read_reply(self._stream)
+                except (OSError, ConnectionError):
+                    self._close()
+                    if attempt == 2:
+                        raise
+
+    def ping(self) -> bool:
+        return self.execute("PING") == "PONG"
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.execute("GET", key)
+
+    def set(self, key: str, value: Value, ex: Optional[int] = None) -> None:
+        if ex:
+            self.execute("SET", key, value, "EX", int(ex))
+        else:
+            self.execute("SET", key, value)
+
+    def delete(self, *keys: str) -> int:
+        return self.execute("DEL", *keys) if keys else 0
+
+    def incr(self, key: str) -> int:
+        return self.execute("INCR", key)
+
+    def mget(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return self.execute("MGET", *keys) if keys else []
+
+    def flushdb(self) -> None:
+        self.execute("FLUSHDB")
+
+
+class _Store:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+
+    def _alive(self, key: bytes) -> Optional[bytes]:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expires = item
+        if expires is not None and expires <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def handle(self, command: List[bytes]) -> Any:
+        name = command[0].upper()
+        args = command[1:]
+        with self.lock:
+            if name == b"PING":
+                return "PONG"
+            if name == b"SELECT":
+                return "OK"
+            if name == b"GET":
+                return self._alive(args[0])
+            if name == b"MGET":
+                return [self._alive(key) for key in args]
+            if name == b"SET":
+                expires = None
+                options = [arg.upper() for arg in args[2:]]
+                if b"EX" in options:
+                    expires = time.monotonic() + int(args[2 + options.index(b"EX") + 1])
+                elif b"PX" in options:
+                    expires = time.monotonic() + int(args[2 + options.index(b"PX") + 1]) / 1000
+                self.data[args[0]] = (args[1], expires)
+                return "OK"
+            if name == b"DEL":
+                return sum(self.data.pop(key, None) is not None for key in args)
+            if name == b"EXISTS":
+                return sum(self._alive(key) is not None for key in args)
+            if name == b"INCR":
+                value = int(self._alive(args[0]) or 0) + 1
+                self.data[args[0]] = (str(value).encode(), None)
+                return value
+            if name == b"FLUSHDB":
+                self.data.clear()
+                return "OK"
+            if name == b"DBSIZE":
+                return len(self.data)
+        return RespError(f"ERR unknown command '{name.decode(errors='replace')}'")
+
+
+def _encode_reply(value: Any) -> bytes:
+    if isinstance(value, RespError):
+        return b"-%s\r\n" % str(value).encode()
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode()
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    return b"*%d\r\n" % len(value) + b"".join(_encode_reply(item) for item in value)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        while True:
+            try:
+                command = _read_reply(self.rfile)
+            except (ConnectionError, OSError):
+                return
+            if not isinstance(command, list) or not command:
+                return
+            self.wfile.write(_encode_reply(self.server.store.handle(command)))
+
+
+class LocalRespServer(socketserver.ThreadingTCPServer):
+    """Servidor RESP em memória, em uma thread; ``port=0`` escolhe uma porta livre."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), _Handler)
+        self.store = _Store()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self) -> "LocalRespServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="resp-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor RESP local para o cache")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6390)
+    arguments = parser.parse_args()
+    server = LocalRespServer(arguments.host, arguments.port)
+    print(f"Servidor RESP em {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
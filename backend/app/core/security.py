@@ -1,25 +1,36 @@
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-
-from jose import jwt
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+# python-jose e passlib/bcrypt são importados só quando usados: a maior parte
+# das requisições não passa pela autenticação e o worker sobe mais rápido.
+
+
+@lru_cache
+def get_pwd_context() -> "CryptContext":
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def create_access_token(
     subject: Dict[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
+    from jose import jwt
+
     to_encode = subject.copy()
     expire_delta = expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
     expire = datetime.utcnow() + expire_delta
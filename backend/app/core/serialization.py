@@ -0,0 +1,168 @@
+"""
+Serialização das listagens direto para os bytes da resposta.
+
+As linhas são os mapeamentos das consultas dos repositórios, cujas colunas
+já têm os tipos dos campos do schema de leitura: não há validação por linha.
+Cada linha vira um ``dict`` com os campos do schema, na ordem dele, e o JSON
+sai do ``orjson``. O endpoint devolve os bytes em uma ``Response``, e o
+FastAPI não repete a validação do ``response_model`` nem passa pelo ``json``
+da biblioteca padrão. O ``response_model`` continua na rota para a
+documentação.
+
+Formatos (``?format=`` ou ``Accept: application/msgpack``):
+
+* ``json``: lista de objetos, o padrão;
+* ``columnar``: JSON com um array por campo. Campos de poucos valores
+  distintos (partido, gênero, ...) vêm codificados por dicionário: o array
+  traz o índice de cada valor em ``dictionaries[campo]``;
+* ``msgpack``: o mesmo payload colunar em MessagePack.
+
+Com ``?fields=a,b`` só os campos pedidos (mais ``id``) são lidos e
+serializados: o schema de leitura é reduzido a uma variante com esses campos,
+criada uma vez por combinação.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+
+import msgpack
+import orjson
+from fastapi import HTTPException, Query, Request, Response, status
+from pydantic import BaseModel, ConfigDict, create_model
+
+from .pagination import NEXT_CURSOR_HEADER
+
+JSON = "json"
+COLUMNAR = "columnar"
+MSGPACK = "msgpack"
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MEDIA_TYPES = {JSON: JSON_MEDIA_TYPE, COLUMNAR: JSON_MEDIA_TYPE, MSGPACK: MSGPACK_MEDIA_TYPE}
+
+
+@lru_cache(maxsize=None)
+def projected_schema(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """Variante de ``schema`` só com ``fields``, na ordem do schema original."""
+    return create_model(
+        f"{schema.__name__}[{','.join(fields)}]",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields},
+    )
+
+
+def list_kind(schema: Type[BaseModel], fields: Optional[Sequence[str]] = None) -> Any:
+    """``List[schema]``, ou da variante com ``fields`` quando há seleção de campos."""
+    return List[projected_schema(schema, tuple(fields))] if fields else List[schema]
+
+
+def field_selection(schema: Type[BaseModel]) -> Callable[..., Optional[Tuple[str, ...]]]:
+    """
+    Dependência para ``?fields=``: os campos pedidos, validados contra
+    ``schema``, na ordem dele e sempre com ``id``; ``None`` para todos.
+    """
+    available = tuple(schema.model_fields)
+
+    def dependency(
+        campos: Optional[str] = Query(
+            None,
+            alias="fields",
+            description=f"Campos da resposta, separados por vírgula: {', '.join(available)}",
+        ),
+    ) -> Optional[Tuple[str, ...]]:
+        if not campos:
+            return None
+        requested = {name.strip() for name in campos.split(",") if name.strip()}
+        unknown = requested.difference(available)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Campos desconhecidos: {', '.join(sorted(unknown))}.",
+            )
+        requested.add("id")
+        selected = tuple(name for name in available if name in requested)
+        return None if len(selected) == len(available) else selected
+
+    return dependency
+
+
+def schema_fields(kind: Any) -> Tuple[str, ...]:
+    """Campos do schema de ``kind`` (``List[schema]``), na ordem da resposta."""
+    (model,) = kind.__args__
+    return tuple(model.model_fields)
+
+
+def to_records(kind: Any, rows: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """``rows`` como dicionários só com os campos de ``kind``; colunas a mais (do cursor) ficam de fora."""
+    fields = schema_fields(kind)
+    return [{name: row[name] for name in fields} for row in rows]
+
+
+def dump_rows(kind: Any, rows: Iterable[Mapping[str, Any]]) -> bytes:
+    """JSON de ``rows`` no formato de ``kind`` (por exemplo ``List[CandidatoGridRead]``)."""
+    return orjson.dumps(to_records(kind, rows))
+
+
+def to_columns(
+    kind: Any, rows: Iterable[Mapping[str, Any]], dictionary: Sequence[str] = ()
+) -> Dict[str, Any]:
+    """Payload colunar de ``rows``, com os campos de ``dictionary`` codificados por dicionário."""
+    rows = list(rows)
+    fields = list(schema_fields(kind))
+    columns: Dict[str, List[Any]] = {name: [row[name] for row in rows] for name in fields}
+    dictionaries: Dict[str, List[Any]] = {}
+    for name in dictionary:
+        if name not in columns:
+            continue
+        values: Dict[Any, int] = {}
+        codes = [None if value is None else values.setdefault(value, len(values)) for value in columns[name]]
+        columns[name] = codes
+        dictionaries[name] = list(values)
+    return {"count": len(rows), "fields": fields, "columns": columns, "dictionaries": dictionaries}
+
+
+def encode_rows(kind: Any, rows: Iterable[Any], fmt: str = JSON, dictionary: Sequence[str] = ()) -> bytes:
+    if fmt == JSON:
+        return dump_rows(kind, rows)
+    payload = to_columns(kind, rows, dictionary)
+    return msgpack.packb(payload) if fmt == MSGPACK else orjson.dumps(payload)
+
+
+def negotiate_format(requested: Optional[str], accept: str) -> str:
+    if requested:
+        return requested
+    return MSGPACK if MSGPACK_MEDIA_TYPE in accept else JSON
+
+
+def response_format(
+    request: Request,
+    formato: Optional[str] = Query(
+        None,
+        alias="format",
+        description="Formato da resposta: json (padrão), columnar ou msgpack",
+        pattern=f"^({JSON}|{COLUMNAR}|{MSGPACK})$",
+    ),
+) -> str:
+    """Dependência: formato pedido em ``?format=`` ou, na falta dele, pelo ``Accept``."""
+    return negotiate_format(formato, request.headers.get("accept", ""))
+
+
+def encoded_response(
+    body: bytes,
+    response: Optional[Response] = None,
+    fmt: str = JSON,
+    next_cursor: Optional[str] = None,
+) -> Response:
+    """
+    Resposta com os bytes de ``body``. ``response`` é a resposta parcial que
+    o FastAPI injeta no endpoint: os cabeçalhos postos pelas dependências
+    (ETag, Cache-Control) só chegam ao cliente se forem copiados dela.
+    ``next_cursor`` vai no cabeçalho ``X-Next-Cursor`` (``pagination.py``).
+    """
+    result = Response(content=body, media_type=MEDIA_TYPES[fmt])
+    if response is not None:
+        result.headers.update(response.headers)
+    if next_cursor:
+        result.headers[NEXT_CURSOR_HEADER] = next_cursor
+    # O formato pode vir do Accept: caches intermediários precisam separar as variantes.
+    result.headers["Vary"] = "Accept"
+    return result
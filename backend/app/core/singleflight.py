@@ -0,0 +1,83 @@
+"""
+Coalescência de consultas idênticas simultâneas ("single flight").
+
+Quando várias requisições pedem a mesma consulta ao mesmo tempo, só a
+primeira vai ao banco; as demais esperam por ela e recebem o mesmo resultado
+(ou a mesma exceção). Quem chega depois que a consulta terminou dispara uma
+nova execução: nada é guardado aqui, isso é papel do cache.
+"""
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.executions: Counter = Counter()
+        self.coalesced: Counter = Counter()
+        self.max_waiters = 0
+
+    def do(self, key: str, fn: Callable[[], T], label: Optional[str] = None) -> Tuple[T, bool]:
+        """
+        Executa ``fn`` uma vez por ``key`` entre chamadas simultâneas. Devolve
+        o resultado e se esta chamada aproveitou a execução de outra.
+        """
+        label = label or key
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced[label] += 1
+                self.max_waiters = max(self.max_waiters, call.waiters)
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executions[label] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            executions = sum(self.executions.values())
+            coalesced = sum(self.coalesced.values())
+            return {
+                "executions": executions,
+                "coalesced": coalesced,
+                "coalesced_ratio": round(coalesced / (executions + coalesced), 4) if executions else 0.0,
+                "in_flight": len(self._calls),
+                "max_waiters": self.max_waiters,
+                "by_query": {
+                    label: {"executions": self.executions[label], "coalesced": self.coalesced[label]}
+                    for label in sorted(set(self.executions) | set(self.coalesced))
+                },
+            }
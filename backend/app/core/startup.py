@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sqlalchemy.exc import OperationalError
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class StartupState:
+    """Estado das tarefas de inicialização, consultado pelos endpoints de saúde."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.database = PENDING
+        self.seed = PENDING
+        self.db_attempts = 0
+        self.error: Optional[str] = None
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    def update(self, **changes: Any) -> None:
+        with self._lock:
+            for name, value in changes.items():
+                setattr(self, name, value)
+
+    @property
+    def ready(self) -> bool:
+        return self.database == DONE and self.seed == DONE
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "database": self.database,
+                "seed": self.seed,
+                "db_attempts": self.db_attempts,
+                "error": self.error,
+                "started_at": self.started_at.isoformat() if self.started_at else None,
+                "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            }
+
+
+state = StartupState()
+_thread: Optional[threading.Thread] = None
+_watcher = None
+
+
+def create_tables_with_backoff() -> None:
+    """
+    Aplica as migrações pendentes, tentando novamente com espera exponencial
+    enquanto o banco estiver indisponível. ``STARTUP_DB_MAX_ATTEMPTS=0`` tenta
+    indefinidamente.
+    """
+    from ..db.migrations import run_migrations
+    from ..db.session import get_engine
+
+    delay = settings.startup_backoff_initial
+    attempt = 1
+    while True:
+        state.update(db_attempts=attempt)
+        try:
+            run_migrations(get_engine())
+            return
+        except OperationalError:
+            max_attempts = settings.startup_db_max_attempts
+            if max_attempts and attempt >= max_attempts:
+                logger.exception("Falha ao conectar ao banco de dados após %s tentativas.", attempt)
+                raise
+            logger.warning(
+                "Banco de dados indisponível. Tentando novamente em %.1f segundos (tentativa %s).",
+                delay,
+                attempt,
+            )
+            time.sleep(delay)
+            delay = min(delay * 2, settings.startup_backoff_max)
+            attempt += 1
+
+
+def run_startup_tasks() -> None:
+    from ..db.seeders.runner import seed_all
+
+    state.update(started_at=datetime.now(timezone.utc), database=RUNNING, error=None)
+    try:
+        create_tables_with_backoff()
+    except Exception as exc:  # noqa: BLE001 - o estado é exposto em /health/ready
+        state.update(database=FAILED, error=str(exc), finished_at=datetime.now(timezone.utc))
+        return
+    state.update(database=DONE, seed=RUNNING)
+    try:
+        start_cache_bus()
+    except Exception:  # noqa: BLE001 - sem o barramento o cache só deixa de ver outros workers
+        logger.exception("Erro ao iniciar o barramento de invalidação do cache")
+
+    try:
+        seed_all()
+    except Exception as exc:  # noqa: BLE001 - o estado é exposto em /health/ready
+        logger.exception("Erro ao executar os seeders na inicialização")
+        state.update(seed=FAILED, error=str(exc), finished_at=datetime.now(timezone.utc))
+        return
+    state.update(seed=DONE, finished_at=datetime.now(timezone.utc))
+    logger.info("Inicialização concluída: banco e seeds prontos.")
+
+    if settings.live_results_dir:
+        start_live_results()
+
+
+def start_cache_bus() -> None:
+    """Adota as versões de cache publicadas por outros workers e pela CLI."""
+    from .cache import get_cache
+
+    get_cache().start_bus()
+
+
+def start_live_results() -> None:
+    """Começa a acompanhar o diretório de apuração parcial (LIVE_RESULTS_DIR)."""
+    global _watcher
+    from ..ingest.live import LiveResultsWatcher
+
+    if _watcher is not None:
+        return
+    _watcher = LiveResultsWatcher(
+        Path(settings.live_results_dir), interval=settings.live_results_interval
+    )
+    _watcher.start()
+
+
+def start_background_startup() -> None:
+    """Dispara as tarefas de inicialização sem segurar o servidor."""
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+    _thread = threading.Thread(target=run_startup_tasks, name="startup-tasks", daemon=True)
+    _thread.start()
@@ -0,0 +1,134 @@
+"""
+Tabelas derivadas de ``candidatos_sp_22_24``.
+
+``federais_nao_eleitos_sp`` e ``estaduais_nao_eleitos_sp`` guardam os
+candidatos não eleitos mais votados de um cargo, ano e UF. Cada uma é
+recalculada com um único INSERT … SELECT, já na ordem de votos, e o DELETE e
+o INSERT ficam na mesma transação: quem lê vê a versão anterior até o commit.
+Cada linha leva o ``id`` da sua linha de origem, que a carga de
+``candidatos_sp_22_24`` preserva: o mesmo candidato mantém o ``id`` entre
+recálculos, e com ele os links por ``id`` e os cursores de paginação.
+
+Enquanto ``candidatos_sp_22_24`` não tiver linhas do recorte, a tabela
+derivada fica como está (carregada pelo arquivo de seed, se houver).
+"""
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Type
+
+from sqlalchemy import Integer, cast, func, literal, select
+from sqlalchemy.engine import Connection, Engine
+
+from ..core.cache import bump_table_versions
+from .models import CandidatosSP2224, EstaduaisNaoEleitosSP, FederaisNaoEleitosSP
+from .session import get_engine
+
+logger = logging.getLogger(__name__)
+
+SOURCE_TABLE = CandidatosSP2224.__tablename__
+NAO_ELEITO = "NÃO ELEITO"
+
+
+@dataclass(frozen=True)
+class DerivedTable:
+    model: Type
+    cargo: str
+    label: str
+    ano: int
+    uf: str = "SÃO PAULO"
+    limit: int = 40
+
+    @property
+    def name(self) -> str:
+        return self.model.__tablename__
+
+    def source_filter(self):
+        source = CandidatosSP2224.__table__
+        return (
+            source.c.ano == self.ano,
+            func.upper(source.c.cargo) == self.cargo,
+            source.c.resultado_agregado == NAO_ELEITO,
+            source.c.votos.isnot(None),
+        )
+
+    def select_rows(self):
+        """Os ``limit`` não eleitos mais votados, nas colunas da tabela derivada."""
+        source = CandidatosSP2224.__table__
+        return (
+            select(
+                source.c.id.label("id"),
+                literal(self.uf).label("uf"),
+                func.coalesce(source.c.nome_urna, source.c.nome).label("candidato"),
+                source.c.votos.label("historico_de_votos"),
+                literal(self.label).label("cargo"),
+                cast(func.round(source.c.fundo_especial), Integer).label("historico_de_fefc"),
+                func.coalesce(source.c.partido, "").label("partido"),
+                source.c.genero.label("genero"),
+                source.c.resultado.label("situacao"),
+            )
+            .where(*self.source_filter())
+            .order_by(source.c.votos.desc(), source.c.id)
+            .limit(self.limit)
+        )
+
+    def expected_rows(self, connection: Connection) -> int:
+        source = CandidatosSP2224.__table__
+        available = connection.execute(
+            select(func.count()).select_from(source).where(*self.source_filter())
+        ).scalar_one()
+        return min(available, self.limit)
+
+
+DERIVED_TABLES: Dict[str, DerivedTable] = {
+    table.name: table
+    for table in (
+        DerivedTable(FederaisNaoEleitosSP, "DEPUTADO FEDERAL", "Deputado Federal", 2022),
+        DerivedTable(EstaduaisNaoEleitosSP, "DEPUTADO ESTADUAL", "Deputado Estadual", 2022),
+    )
+}
+
+
+def refresh_table(connection: Connection, derived: DerivedTable) -> Optional[int]:
+    """Recalcula ``derived`` na transação de ``connection``; ``None`` se não houver origem."""
+    if not derived.expected_rows(connection):
+        logger.info("%s: nenhuma linha de origem em %s, mantendo a tabela.", derived.name, SOURCE_TABLE)
+        return None
+    target = derived.model.__table__
+    query = derived.select_rows()
+    connection.execute(target.delete())
+    result = connection.execute(
+        target.insert().from_select([column.name for column in query.selected_columns], query)
+    )
+    logger.info("%s recalculada a partir de %s: %s linhas.", derived.name, SOURCE_TABLE, result.rowcount)
+    return result.rowcount
+
+
+def refresh_derived(
+    engine: Optional[Engine] = None, names: Optional[Iterable[str]] = None
+) -> Dict[str, Optional[int]]:
+    """Recalcula as tabelas derivadas informadas (todas por padrão), cada uma em sua transação."""
+    engine = engine or get_engine()
+    selected = list(names) if names is not None else list(DERIVED_TABLES)
+    refreshed = {}
+    for name in selected:
+        with engine.begin() as connection:
+            refreshed[name] = refresh_table(connection, DERIVED_TABLES[name])
+    bump_table_versions([name for name, rows in refreshed.items() if rows is not None])
+    return refreshed
+
+
+def refresh_after_load(table_name: str, engine: Optional[Engine] = None) -> Dict[str, Optional[int]]:
+    """
+    Chamado depois de cada carga: uma mudança em ``candidatos_sp_22_24``
+    recalcula todas as derivadas; a carga de uma derivada pelo arquivo de seed
+    é substituída pelo cálculo, quando há origem. A versão de cache da tabela
+    carregada é incrementada (``refresh_derived`` cuida das recalculadas).
+    """
+    if table_name == SOURCE_TABLE:
+        refreshed = refresh_derived(engine)
+    elif table_name in DERIVED_TABLES:
+        refreshed = refresh_derived(engine, [table_name])
+    else:
+        refreshed = {}
+    bump_table_versions([table_name])
+    return refreshed
@@ -0,0 +1,29 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy.engine import Engine
+
+
+class LockTimeout(RuntimeError):
+    """O bloqueio nomeado não foi obtido no prazo."""
+
+
+@contextmanager
+def named_lock(engine: Engine, name: str, timeout: int, message: str) -> Iterator[None]:
+    """
+    Bloqueio nomeado entre processos (GET_LOCK no MySQL), mantido por uma
+    conexão própria durante todo o bloco. Nos demais bancos não há disputa
+    entre processos a evitar e o bloco roda direto. ``message`` é o erro
+    quando o bloqueio não sai em ``timeout`` segundos.
+    """
+    if engine.dialect.name not in {"mysql", "mariadb"}:
+        yield
+        return
+    with engine.connect() as connection:
+        acquired = connection.exec_driver_sql("SELECT GET_LOCK(%s, %s)", (name, timeout)).scalar()
+        if not acquired:
+            raise LockTimeout(message)
+        try:
+            yield
+        finally:
+            connection.exec_driver_sql("SELECT RELEASE_LOCK(%s)", (name,))
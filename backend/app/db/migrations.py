@@ -0,0 +1,259 @@
+"""
+Migrações versionadas do esquema.
+
+As versões aplicadas ficam em ``schema_migrations``; com tudo aplicado, a
+inicialização faz uma única consulta e não reflete o esquema. Colunas e
+índices novos usam DDL online no MySQL (ver ``schema.add_column``) e o
+preenchimento de colunas novas percorre a tabela em faixas de chave primária,
+com um commit e uma pausa curta por faixa, em vez de recarregar a tabela.
+
+Para uma mudança nova, acrescente uma ``Migration`` ao fim de ``MIGRATIONS``
+com a próxima versão. Cada passo deve ser idempotente: um banco novo já nasce
+com as colunas dos modelos pela migração base.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Sequence
+
+from sqlalchemy import Table, bindparam, func, inspect, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from ..core.config import settings
+from .base import Base
+from .models import (
+    CacheVersion,
+    CandidatoSP,
+    CandidatosSP2224,
+    EstaduaisNaoEleitosSP,
+    FederaisNaoEleitosSP,
+    SchemaMigration,
+)
+from .locks import named_lock
+from .schema import create_index, drop_index, sync_schema
+
+logger = logging.getLogger(__name__)
+
+LOCK_NAME = "schema_migrations"
+LOCK_TIMEOUT = 600
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Engine], None]
+
+
+def backfill(
+    engine: Engine,
+    table: Table,
+    columns: Sequence[str],
+    compute: Callable[[List[Any]], List[Dict[str, Any]]],
+    where=None,
+    chunk_size: Optional[int] = None,
+    pause: Optional[float] = None,
+) -> int:
+    """
+    Percorre ``table`` em faixas de ``chunk_size`` ids. Para cada faixa,
+    ``compute`` recebe as linhas (id e ``columns``, filtradas por ``where``) e
+    devolve os valores novos como dicionários com ``_id``. Cada faixa é uma
+    transação curta, seguida de ``pause`` segundos, para não segurar
+    bloqueios nem saturar a replicação.
+    """
+    chunk_size = chunk_size or settings.migration_backfill_chunk
+    pause = settings.migration_backfill_pause if pause is None else pause
+    primary_key = table.c.id
+    with engine.connect() as connection:
+        low, high = connection.execute(select(func.min(primary_key), func.max(primary_key))).one()
+    if low is None:
+        return 0
+
+    query = select(primary_key, *(table.c[name] for name in columns))
+    if where is not None:
+        query = query.where(where)
+    statement = table.update().where(primary_key == bindparam("_id"))
+    written = 0
+    for start in range(low, high + 1, chunk_size):
+        with engine.begin() as connection:
+            rows = connection.execute(
+                query.where(primary_key >= start, primary_key < start + chunk_size)
+            ).all()
+            updates = compute(rows) if rows else []
+            if updates:
+                connection.execute(statement, updates)
+        written += len(updates)
+        logger.debug("%s: faixa %s-%s, %s linhas.", table.name, start, start + chunk_size - 1, len(updates))
+        if pause and updates:
+            time.sleep(pause)
+    logger.info("%s: %s linhas preenchidas.", table.name, written)
+    return written
+
+
+def _baseline(engine: Engine) -> None:
+    sync_schema(engine)
+
+
+def _backfill_cargo(engine: Engine) -> None:
+    """Preenche ``candidatos_sp_22_24.cargo`` a partir do arquivo, sem recarregar a tabela."""
+    from .seeders.candidatos_sp_22_24_seeder import DEFINITION
+    from .seeders.sync import file_checksum
+
+    table = CandidatosSP2224.__table__
+    with engine.connect() as connection:
+        pending = connection.execute(
+            select(func.count()).select_from(table).where(table.c.cargo.is_(None))
+        ).scalar_one()
+    if not pending:
+        return
+    path = DEFINITION.find_file()
+    if path is None:
+        logger.warning("Arquivo de %s não encontrado; cargo fica para a próxima carga.", DEFINITION.name)
+        return
+    key = DEFINITION.natural_key
+    cargos = {
+        tuple(record[name] for name in key): record["cargo"]
+        for record in DEFINITION.read_records(path, file_checksum(path))
+    }
+
+    def compute(rows: List[Any]) -> List[Dict[str, Any]]:
+        updates = []
+        for row in rows:
+            cargo = cargos.get(tuple(row[1:]))
+            if cargo is not None:
+                updates.append({"_id": row[0], "cargo": cargo})
+        return updates
+
+    backfill(engine, table, key, compute, where=table.c.cargo.is_(None))
+
+
+def _add_derived_index(engine: Engine) -> None:
+    table = CandidatosSP2224.__table__
+    existing = {index["name"] for index in inspect(engine).get_indexes(table.name)}
+    with engine.begin() as connection:
+        for index in table.indexes:
+            if index.name == "ix_candidatos_sp_22_24_resultado_votos" and index.name not in existing:
+                create_index(connection, index)
+
+
+def _create_indexes(engine: Engine, models: Sequence[Any], suffix: str) -> None:
+    """Cria os índices dos modelos terminados em ``suffix`` que ainda não existem."""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for model in models:
+            table = model.__table__
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name.endswith(suffix) and index.name not in existing:
+                    create_index(connection, index)
+
+
+def _add_keyset_indexes(engine: Engine) -> None:
+    """Índices (ordenação, id) da paginação por cursor; trocados pela migração 7."""
+    _create_indexes(
+        engine, (CandidatosSP2224, FederaisNaoEleitosSP, EstaduaisNaoEleitosSP), "_votos_id"
+    )
+
+
+def _add_natural_key_indexes(engine: Engine) -> None:
+    """Índices das chaves naturais, consultadas lote a lote pelo seed."""
+    _create_indexes(
+        engine,
+        (CandidatoSP, CandidatosSP2224, FederaisNaoEleitosSP, EstaduaisNaoEleitosSP),
+        "_natural_key",
+    )
+
+
+def _descending_keyset_indexes(engine: Engine) -> None:
+    """
+    Troca os índices (votos, id) da migração 5 por (votos DESC, id): a listagem
+    ordena por ``votos DESC, id`` e o índice precisa ter as duas direções.
+    """
+    models = (CandidatosSP2224, FederaisNaoEleitosSP, EstaduaisNaoEleitosSP)
+    _create_indexes(engine, models, "_votos_desc_id")
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for model in models:
+            table = model.__table__
+            previous = f"ix_{table.name}_votos_id"
+            if previous in {index["name"] for index in inspector.get_indexes(table.name)}:
+                drop_index(connection, table, previous)
+
+
+def _create_cache_versions(engine: Engine) -> None:
+    Base.metadata.create_all(bind=engine, tables=[CacheVersion.__table__])
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "esquema base: tabelas, colunas e índices dos modelos", _baseline),
+    Migration(2, "preenche candidatos_sp_22_24.cargo", _backfill_cargo),
+    Migration(3, "índice de candidatos_sp_22_24 para as tabelas derivadas", _add_derived_index),
+    Migration(4, "tabela cache_versions para invalidar o cache entre workers", _create_cache_versions),
+    Migration(5, "índices (votos, id) para a paginação por cursor", _add_keyset_indexes),
+    Migration(6, "índices das chaves naturais para o seed em lotes", _add_natural_key_indexes),
+    Migration(7, "índices (votos DESC, id) para a paginação por cursor", _descending_keyset_indexes),
+]
+
+
+def applied_versions(engine: Engine) -> Dict[int, Any]:
+    table = SchemaMigration.__table__
+    with engine.connect() as connection:
+        return {row.version: row for row in connection.execute(select(table))}
+
+
+def _migration_lock(engine: Engine) -> ContextManager[None]:
+    """Impede que vários workers migrem ao mesmo tempo (GET_LOCK no MySQL)."""
+    return named_lock(
+        engine, LOCK_NAME, LOCK_TIMEOUT, "Tempo esgotado esperando outra migração terminar"
+    )
+
+
+def _pending(engine: Engine) -> List[Migration]:
+    applied = applied_versions(engine)
+    return [migration for migration in MIGRATIONS if migration.version not in applied]
+
+
+def run_migrations(engine: Engine) -> List[Migration]:
+    """Aplica, em ordem, as migrações ainda não registradas. Devolve as aplicadas."""
+    table = SchemaMigration.__table__
+    try:
+        pending = _pending(engine)
+    except DBAPIError:
+        # Banco sem schema_migrations (novo ou anterior às migrações versionadas).
+        Base.metadata.create_all(bind=engine, tables=[table])
+        pending = MIGRATIONS
+    if not pending:
+        return []
+
+    done: List[Migration] = []
+    with _migration_lock(engine):
+        # Outro worker pode ter aplicado tudo enquanto esperávamos o bloqueio.
+        for migration in _pending(engine):
+            started = time.perf_counter()
+            logger.info("Aplicando migração %s: %s", migration.version, migration.name)
+            migration.upgrade(engine)
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            with engine.begin() as connection:
+                connection.execute(
+                    table.insert().values(
+                        version=migration.version, name=migration.name, elapsed_ms=elapsed_ms
+                    )
+                )
+            logger.info("Migração %s aplicada em %s ms.", migration.version, elapsed_ms)
+            done.append(migration)
+    return done
+
+
+def migration_status(engine: Engine) -> List[Dict[str, Any]]:
+    table = SchemaMigration.__table__
+    applied = applied_versions(engine) if inspect(engine).has_table(table.name) else {}
+    return [
+        {
+            "version": migration.version,
+            "name": migration.name,
+            "applied_at": applied[migration.version].applied_at if migration.version in applied else None,
+            "elapsed_ms": applied[migration.version].elapsed_ms if migration.version in applied else None,
+        }
+        for migration in MIGRATIONS
+    ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, func
+from sqlalchemy import Boolean, Column, DateTime, Float, Index, Integer, String, UniqueConstraint, desc, func
 
 from .session import Base
 
@@ -18,6 +18,8 @@ class User(Base):
 
 class CandidatoSP(Base):
     __tablename__ = "candidatos_sp"
+    # Chave natural do seed (db/seeders/sync.py consulta as linhas por lote).
+    __table_args__ = (Index("ix_candidatos_sp_natural_key", "uf", "ano", "cargo", "candidato"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     uf = Column(String(50), nullable=False, index=True)
@@ -56,6 +58,10 @@ class CandidatoGrid(Base):
 
 class FederaisNaoEleitosSP(Base):
     __tablename__ = "federais_nao_eleitos_sp"
+    __table_args__ = (
+        Index("ix_federais_nao_eleitos_sp_votos_desc_id", desc("historico_de_votos"), "id"),
+        Index("ix_federais_nao_eleitos_sp_natural_key", "uf", "cargo", "candidato"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     uf = Column(String(50), nullable=False, index=True)
@@ -70,6 +76,10 @@ class FederaisNaoEleitosSP(Base):
 
 class EstaduaisNaoEleitosSP(Base):
     __tablename__ = "estaduais_nao_eleitos_sp"
+    __table_args__ = (
+        Index("ix_estaduais_nao_eleitos_sp_votos_desc_id", desc("historico_de_votos"), "id"),
+        Index("ix_estaduais_nao_eleitos_sp_natural_key", "uf", "cargo", "candidato"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     uf = Column(String(50), nullable=False, index=True)
@@ -84,6 +94,13 @@ class EstaduaisNaoEleitosSP(Base):
 
 class CandidatosSP2224(Base):
     __tablename__ = "candidatos_sp_22_24"
+    # Recorte das tabelas derivadas de não eleitos (ver db/derived.py).
+    __table_args__ = (
+        Index("ix_candidatos_sp_22_24_resultado_votos", "ano", "resultado_agregado", "votos"),
+        # Ordenação e cursor da listagem (core/pagination.py).
+        Index("ix_candidatos_sp_22_24_votos_desc_id", desc("votos"), "id"),
+        Index("ix_candidatos_sp_22_24_natural_key", "ano", "sequencial_candidato", "ordem"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     sequencial_restultado = Column(String(50), nullable=True)
@@ -104,3 +121,62 @@ class CandidatosSP2224(Base):
     fundo_partidario = Column(Float, nullable=True)
     fundo_total = Column(Float, nullable=True)
     ordem = Column(Integer, nullable=True)
+
+
+class SeedState(Base):
+    __tablename__ = "seed_state"
+
+    dataset = Column(String(100), primary_key=True)
+    checksum = Column(String(64), nullable=False)
+    row_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class SchemaMigration(Base):
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String(255), nullable=False)
+    elapsed_ms = Column(Integer, nullable=False, default=0)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+
+    table_name = Column(String(100), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class LiveResultState(Base):
+    __tablename__ = "live_result_state"
+
+    source = Column(String(255), primary_key=True)
+    sequence = Column(Integer, nullable=False, default=0)
+    source_file = Column(String(255), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class LiveResultTotal(Base):
+    __tablename__ = "live_result_totals"
+    __table_args__ = (UniqueConstraint("ano", "uf", "cargo", name="uq_live_result_totals_cargo"),)
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    ano = Column(Integer, nullable=False)
+    uf = Column(String(50), nullable=False)
+    cargo = Column(String(255), nullable=False)
+    total_votos = Column(Integer, nullable=False, default=0)
+    candidatos = Column(Integer, nullable=False, default=0)
+    lider = Column(String(255), nullable=True)
+    secoes_totalizadas_pct = Column(Float, nullable=True)
+    sequence = Column(Integer, nullable=False, default=0, index=True)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
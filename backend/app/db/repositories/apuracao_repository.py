@@ -0,0 +1,23 @@
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..models import LiveResultState, LiveResultTotal
+
+
+class ApuracaoRepository:
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def get_latest_state(self) -> Optional[LiveResultState]:
+        return (
+            self.db.query(LiveResultState)
+            .order_by(LiveResultState.sequence.desc())
+            .first()
+        )
+
+    def list_totals(self, desde: Optional[int] = None) -> List[LiveResultTotal]:
+        query = self.db.query(LiveResultTotal)
+        if desde is not None:
+            query = query.filter(LiveResultTotal.sequence > desde)
+        return query.order_by(LiveResultTotal.ano, LiveResultTotal.cargo).all()
@@ -1,11 +1,16 @@
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Sequence
 
+from sqlalchemy import RowMapping, select
 from sqlalchemy.orm import Session
 
+from ...core.cache import bump_table_versions
+from ...core.pagination import Keyset, Position
 from ..models import CandidatoGrid
 
 
 class CandidatoGridRepository:
+    KEYSET = Keyset(CandidatoGrid.__table__, "posicao_candidato")
+
     def __init__(self, db: Session) -> None:
         self.db = db
 
@@ -13,15 +18,23 @@ class CandidatoGridRepository:
         candidato = CandidatoGrid(**candidato_data)
         self.db.add(candidato)
         self.db.commit()
+        bump_table_versions([CandidatoGrid.__tablename__])
         self.db.refresh(candidato)
         return candidato
 
-    def list_all(self) -> List[CandidatoGrid]:
-        return (
-            self.db.query(CandidatoGrid)
-            .order_by(CandidatoGrid.posicao_candidato.asc())
-            .all()
-        )
+    def list_all(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        after: Optional[Position] = None,
+    ) -> Sequence[RowMapping]:
+        query = select(*self.KEYSET.columns(columns))
+        if after is not None:
+            query = query.where(self.KEYSET.after(after))
+        query = query.order_by(*self.KEYSET.order_by())
+        if limit is not None:
+            query = query.limit(max(limit, 1))
+        return self.db.execute(query).mappings().all()
 
     def get_by_id(self, candidato_id: int) -> Optional[CandidatoGrid]:
         return (
@@ -40,6 +53,7 @@ class CandidatoGridRepository:
 
         self.db.add(candidato)
         self.db.commit()
+        bump_table_versions([CandidatoGrid.__tablename__])
         self.db.refresh(candidato)
         return candidato
 
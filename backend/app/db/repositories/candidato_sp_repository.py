@@ -1,23 +1,34 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from ...core.cache import bump_table_versions
+from ...core.pagination import Keyset, Position
 from ..models import CandidatoSP
 
 
 class CandidatoSPRepository:
+    KEYSET = Keyset(CandidatoSP.__table__, "candidato")
+
     def __init__(self, db: Session) -> None:
         self.db = db
 
-    def list_all(self, nome_candidato=None, limit: int = 10):
-        query = self.db.query(CandidatoSP)
+    def list_all(
+        self,
+        nome_candidato=None,
+        limit: int = 10,
+        columns: Optional[Sequence[str]] = None,
+        after: Optional[Position] = None,
+    ):
+        table = CandidatoSP.__table__
+        query = select(*self.KEYSET.columns(columns))
         if nome_candidato:
-            query = query.filter(CandidatoSP.candidato.ilike(f"%{nome_candidato}%"))
-        return (
-            query.order_by(CandidatoSP.candidato)
-            .limit(max(limit, 1))
-            .all()
-        )
+            query = query.where(table.c.candidato.ilike(f"%{nome_candidato}%"))
+        if after is not None:
+            query = query.where(self.KEYSET.after(after))
+        query = query.order_by(*self.KEYSET.order_by()).limit(max(limit, 1))
+        return self.db.execute(query).mappings().all()
 
     def get_by_id(self, candidato_id: int):
         return self.db.query(CandidatoSP).filter(CandidatoSP.id == candidato_id).first()
@@ -32,5 +43,6 @@ class CandidatoSPRepository:
 
         self.db.add(candidato)
         self.db.commit()
+        bump_table_versions([CandidatoSP.__tablename__])
         self.db.refresh(candidato)
         return candidato
@@ -1,11 +1,15 @@
-from typing import Optional
+from typing import Optional, Sequence
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from ...core.pagination import Keyset, Position
 from ..models import CandidatosSP2224
 
 
 class CandidatosSP2224Repository:
+    KEYSET = Keyset(CandidatosSP2224.__table__, "votos", descending=True)
+
     def __init__(self, db: Session) -> None:
         self.db = db
 
@@ -17,33 +21,36 @@ class CandidatosSP2224Repository:
         ano: Optional[int] = None,
         resultado_agregado: Optional[str] = None,
         limit: int = 100,
+        columns: Optional[Sequence[str]] = None,
+        after: Optional[Position] = None,
     ):
-        query = self.db.query(CandidatosSP2224)
-        
+        table = CandidatosSP2224.__table__
+        query = select(*self.KEYSET.columns(columns))
+
         # Condições fixas: ordem = 1 e fundo_partidario is not null
-        query = query.filter(CandidatosSP2224.ordem == 1)
-        query = query.filter(CandidatosSP2224.fundo_partidario.isnot(None))
+        query = query.where(table.c.ordem == 1)
+        query = query.where(table.c.fundo_partidario.isnot(None))
 
         if nome:
-            query = query.filter(CandidatosSP2224.nome.ilike(f"%{nome}%"))
+            query = query.where(table.c.nome.ilike(f"%{nome}%"))
 
         if partido:
-            query = query.filter(CandidatosSP2224.partido.ilike(f"%{partido}%"))
+            query = query.where(table.c.partido.ilike(f"%{partido}%"))
 
         if genero:
-            query = query.filter(CandidatosSP2224.genero.ilike(f"%{genero}%"))
+            query = query.where(table.c.genero.ilike(f"%{genero}%"))
 
         if ano:
-            query = query.filter(CandidatosSP2224.ano == ano)
+            query = query.where(table.c.ano == ano)
 
         if resultado_agregado:
-            query = query.filter(CandidatosSP2224.resultado_agregado.ilike(f"%{resultado_agregado}%"))
+            query = query.where(table.c.resultado_agregado.ilike(f"%{resultado_agregado}%"))
 
-        return (
-            query.order_by(CandidatosSP2224.votos.desc())
-            .limit(max(limit, 1))
-            .all()
-        )
+        if after is not None:
+            query = query.where(self.KEYSET.after(after))
+
+        query = query.order_by(*self.KEYSET.order_by()).limit(max(limit, 1))
+        return self.db.execute(query).mappings().all()
 
     def get_by_id(self, registro_id: int):
         return (
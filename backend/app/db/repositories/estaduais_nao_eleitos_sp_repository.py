@@ -1,11 +1,15 @@
-from typing import Optional
+from typing import Optional, Sequence
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from ...core.pagination import Keyset, Position
 from ..models import EstaduaisNaoEleitosSP
 
 
 class EstaduaisNaoEleitosSPRepository:
+    KEYSET = Keyset(EstaduaisNaoEleitosSP.__table__, "historico_de_votos", descending=True)
+
     def __init__(self, db: Session) -> None:
         self.db = db
 
@@ -15,23 +19,26 @@ class EstaduaisNaoEleitosSPRepository:
         partido: Optional[str] = None,
         situacao: Optional[str] = None,
         limit: int = 100,
+        columns: Optional[Sequence[str]] = None,
+        after: Optional[Position] = None,
     ):
-        query = self.db.query(EstaduaisNaoEleitosSP)
+        table = EstaduaisNaoEleitosSP.__table__
+        query = select(*self.KEYSET.columns(columns))
 
         if nome_candidato:
-            query = query.filter(EstaduaisNaoEleitosSP.candidato.ilike(f"%{nome_candidato}%"))
+            query = query.where(table.c.candidato.ilike(f"%{nome_candidato}%"))
 
         if partido:
-            query = query.filter(EstaduaisNaoEleitosSP.partido.ilike(f"%{partido}%"))
+            query = query.where(table.c.partido.ilike(f"%{partido}%"))
 
         if situacao:
-            query = query.filter(EstaduaisNaoEleitosSP.situacao.ilike(f"%{situacao}%"))
+            query = query.where(table.c.situacao.ilike(f"%{situacao}%"))
 
-        return (
-            query.order_by(EstaduaisNaoEleitosSP.historico_de_votos.desc())
-            .limit(max(limit, 1))
-            .all()
-        )
+        if after is not None:
+            query = query.where(self.KEYSET.after(after))
+
+        query = query.order_by(*self.KEYSET.order_by()).limit(max(limit, 1))
+        return self.db.execute(query).mappings().all()
 
     def get_by_id(self, registro_id: int):
         return (
@@ -1,32 +1,38 @@
-from typing import Optional
+from typing import Optional, Sequence
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from ...core.pagination import Keyset, Position
 from ..models import FederaisNaoEleitosSP
 
 
 class FederaisNaoEleitosSPRepository:
+    KEYSET = Keyset(FederaisNaoEleitosSP.__table__, "historico_de_votos", descending=True)
+
     def __init__(self, db: Session) -> None:
         self.db = db
 
     def list_all(self, nome_candidato: Optional[str] = None, partido: Optional[str] = None, 
-                 situacao: Optional[str] = None, limit: int = 100):
-        query = self.db.query(FederaisNaoEleitosSP)
-        
+                 situacao: Optional[str] = None, limit: int = 100,
+                 columns: Optional[Sequence[str]] = None, after: Optional[Position] = None):
+        table = FederaisNaoEleitosSP.__table__
+        query = select(*self.KEYSET.columns(columns))
+
         if nome_candidato:
-            query = query.filter(FederaisNaoEleitosSP.candidato.ilike(f"%{nome_candidato}%"))
-        
+            query = query.where(table.c.candidato.ilike(f"%{nome_candidato}%"))
+
         if partido:
-            query = query.filter(FederaisNaoEleitosSP.partido.ilike(f"%{partido}%"))
-        
+            query = query.where(table.c.partido.ilike(f"%{partido}%"))
+
         if situacao:
-            query = query.filter(FederaisNaoEleitosSP.situacao.ilike(f"%{situacao}%"))
-        
-        return (
-            query.order_by(FederaisNaoEleitosSP.historico_de_votos.desc())
-            .limit(max(limit, 1))
-            .all()
-        )
+            query = query.where(table.c.situacao.ilike(f"%{situacao}%"))
+
+        if after is not None:
+            query = query.where(self.KEYSET.after(after))
+
+        query = query.order_by(*self.KEYSET.order_by()).limit(max(limit, 1))
+        return self.db.execute(query).mappings().all()
 
     def get_by_id(self, registro_id: int):
         return self.db.query(FederaisNaoEleitosSP).filter(
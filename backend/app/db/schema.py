@@ -0,0 +1,105 @@
+import logging
+from typing import List
+
+from sqlalchemy import Column, Index, Table, inspect
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateColumn, CreateIndex
+
+from .base import Base
+
+logger = logging.getLogger(__name__)
+
+# No MySQL, cada ALTER tenta primeiro o algoritmo que não copia a tabela nem
+# bloqueia escritas; quando o servidor recusa, passa para o seguinte.
+COLUMN_ALGORITHMS = ("ALGORITHM=INSTANT", "ALGORITHM=INPLACE, LOCK=NONE", "")
+INDEX_ALGORITHMS = ("ALGORITHM=INPLACE LOCK=NONE", "")
+
+
+def _is_mysql(connection: Connection) -> bool:
+    return connection.dialect.name in {"mysql", "mariadb"}
+
+
+def _execute_online(connection: Connection, statement: str, algorithms, separator: str) -> None:
+    options = algorithms if _is_mysql(connection) else ("",)
+    for position, option in enumerate(options):
+        try:
+            connection.exec_driver_sql(f"{statement}{separator}{option}" if option else statement)
+            if option:
+                logger.debug("%s executado com %s.", statement, option)
+            return
+        except DBAPIError:
+            if position == len(options) - 1:
+                raise
+            logger.info("%s não aceito para: %s", option, statement)
+
+
+def add_column(connection: Connection, table: Table, column: Column) -> None:
+    """ALTER TABLE ... ADD COLUMN, online no MySQL (INSTANT, depois INPLACE)."""
+    preparer = connection.dialect.identifier_preparer
+    definition = CreateColumn(column).compile(dialect=connection.dialect)
+    _execute_online(
+        connection,
+        f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {definition}",
+        COLUMN_ALGORITHMS,
+        ", ",
+    )
+    logger.info("Coluna %s.%s adicionada.", table.name, column.name)
+
+
+def create_index(connection: Connection, index: Index) -> None:
+    """CREATE INDEX, sem bloquear escritas no MySQL (INPLACE, LOCK=NONE)."""
+    statement = str(CreateIndex(index).compile(dialect=connection.dialect)).strip()
+    _execute_online(connection, statement, INDEX_ALGORITHMS, " ")
+    logger.info("Índice %s criado em %s.", index.name, index.table.name)
+
+
+def drop_index(connection: Connection, table: Table, name: str) -> None:
+    """DROP INDEX, sem bloquear escritas no MySQL."""
+    preparer = connection.dialect.identifier_preparer
+    if _is_mysql(connection):
+        statement = f"ALTER TABLE {preparer.format_table(table)} DROP INDEX {preparer.quote(name)}"
+        _execute_online(connection, statement, ("ALGORITHM=INPLACE, LOCK=NONE", ""), ", ")
+    else:
+        connection.exec_driver_sql(f"DROP INDEX {preparer.quote(name)}")
+    logger.info("Índice %s removido de %s.", name, table.name)
+
+
+def sync_schema(engine: Engine) -> List[str]:
+    """
+    Aproxima o banco dos modelos: cria tabelas ausentes e adiciona colunas e
+    índices que existem nos modelos mas não no banco (por exemplo a coluna
+    ``cargo`` de candidatos_sp_22_24). Nunca remove nem altera colunas.
+    Devolve os nomes das tabelas que mudaram.
+    """
+    changed: List[str] = []
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing_tables]
+    if missing:
+        Base.metadata.create_all(bind=engine, tables=missing)
+        for table in missing:
+            logger.info("Tabela %s criada.", table.name)
+            changed.append(table.name)
+
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            columns = {column["name"] for column in inspector.get_columns(table.name)}
+            indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            added = False
+            for column in table.columns:
+                if column.name in columns:
+                    continue
+                add_column(connection, table, column)
+                added = True
+            for index in table.indexes:
+                if index.name in indexes:
+                    continue
+                create_index(connection, index)
+                added = True
+            if added:
+                changed.append(table.name)
+    return changed
@@ -0,0 +1,118 @@
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from ...core.config import settings
+from ...ingest.conversion import RecordSchema
+from ...ingest.snapshot import cached_records
+from ..derived import refresh_after_load
+from ..session import SessionLocal
+from .sync import (
+    SyncResult,
+    file_checksum,
+    get_stored_checksum,
+    newer_source,
+    store_checksum,
+    sync_records,
+)
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).resolve().parents[3] / "data"
+
+RecordReader = Callable[[Path, str], Iterable[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    Descrição de um conjunto de dados carregado a partir de um arquivo: tabela
+    de destino, conversão das colunas, chave natural e onde procurar o arquivo.
+    """
+
+    name: str
+    label: str
+    model: Any
+    schema: RecordSchema
+    natural_key: Tuple[str, ...]
+    paths: Sequence[Path]
+
+    def find_file(self) -> Optional[Path]:
+        for path in self.paths:
+            logger.debug("Procurando arquivo de %s em: %s", self.name, path)
+            if path.exists():
+                return path
+        return None
+
+    def read_records(self, path: Path, checksum: str) -> Iterable[Dict[str, Any]]:
+        return cached_records(path, self.schema, self.name, checksum)
+
+
+def seed_dataset(
+    dataset: Dataset,
+    force: bool = False,
+    batch_size: Optional[int] = None,
+    loader_mode: Optional[str] = None,
+    data_path: Optional[Path] = None,
+    reader: Optional[RecordReader] = None,
+) -> Optional[SyncResult]:
+    """
+    Sincroniza a tabela do conjunto com o arquivo de origem. A carga é pulada
+    quando o arquivo não existe, quando seu checksum é o mesmo da última
+    carga ou quando outra fonte carregou a tabela depois dele
+    (``sync.newer_source``), a menos que ``force`` seja verdadeiro. ``reader`` permite trocar a
+    leitura padrão (snapshot ou CSV) por outra fonte dos mesmos registros.
+    """
+    data_path = data_path or dataset.find_file()
+    if data_path is None or not data_path.exists():
+        logger.info("Arquivo de seed de %s não encontrado. Pulando execução.", dataset.label)
+        return None
+
+    checksum = file_checksum(data_path)
+    session: Session = SessionLocal()
+    try:
+        if not force and get_stored_checksum(session, dataset.name) == checksum:
+            logger.info("Arquivo de seed de %s inalterado. Pulando.", dataset.label)
+            return None
+        source = None if force else newer_source(session, dataset.name)
+        if source is not None:
+            # Ex.: candidatos_sp_22_24 importada dos zips do TSE; o arquivo não a substitui.
+            logger.info("%s foi carregada de %s depois do arquivo de seed. Pulando.", dataset.name, source)
+            return None
+
+        logger.info("Sincronizando %s a partir de %s...", dataset.name, data_path)
+        records = (reader or dataset.read_records)(data_path, checksum)
+        result = sync_records(
+            session,
+            dataset.model,
+            records,
+            dataset.natural_key,
+            batch_size=batch_size or settings.seed_batch_size,
+            loader_mode=loader_mode or settings.seed_loader,
+            strategy=settings.seed_strategy,
+        )
+        if result.total == 0:
+            logger.warning("Nenhum registro encontrado no arquivo %s", data_path)
+            return result
+
+        store_checksum(session, dataset.name, checksum, result.total)
+        session.commit()
+        logger.info(
+            "Seed de %s concluída: %s inseridos, %s atualizados, %s removidos, %s inalterados.",
+            dataset.label,
+            result.inserted,
+            result.updated,
+            result.deleted,
+            result.unchanged,
+        )
+        refresh_after_load(dataset.model.__tablename__)
+        return result
+    except Exception:
+        session.rollback()
+        logger.exception("Erro ao executar seed de %s", dataset.label)
+        raise
+    finally:
+        session.close()
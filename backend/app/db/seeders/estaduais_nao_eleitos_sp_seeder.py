@@ -0,0 +1,50 @@
+from pathlib import Path
+from typing import Optional
+
+from ...ingest.conversion import RecordSchema, integer, text
+from ..models import EstaduaisNaoEleitosSP
+from .dataset import DATA_DIR, Dataset, seed_dataset
+from .sync import SyncResult
+
+SCHEMA = RecordSchema(
+    {
+        "uf": text,
+        "candidato": text,
+        "historico_de_votos": integer,
+        "cargo": text,
+        "historico_de_fefc": integer,
+        "partido": text,
+        "genero": text,
+        "situacao": text,
+    }
+)
+
+DATASET = "estaduais_nao_eleitos_sp"
+NATURAL_KEY = ("uf", "cargo", "candidato")
+
+_FILE_NAME = "SÃO PAULO_TOP_40_ESTADUAIS_NAO_ELEITOS_2022.csv"
+
+# O diretório data do backend tem prioridade; depois o volume do container
+# (/app/data, com o nome alternativo estaduais.csv), a raiz do projeto e /workspace.
+PATHS = (
+    DATA_DIR / _FILE_NAME,
+    Path("/app/data") / _FILE_NAME,
+    Path("/app/data/estaduais.csv"),
+    DATA_DIR.parents[1] / _FILE_NAME,
+    Path("/workspace") / _FILE_NAME,
+)
+
+DEFINITION = Dataset(
+    name=DATASET,
+    label="estaduais não eleitos SP",
+    model=EstaduaisNaoEleitosSP,
+    schema=SCHEMA,
+    natural_key=NATURAL_KEY,
+    paths=PATHS,
+)
+
+
+def seed_estaduais_nao_eleitos_sp(
+    force: bool = False, batch_size: Optional[int] = None, loader_mode: Optional[str] = None
+) -> Optional[SyncResult]:
+    return seed_dataset(DEFINITION, force=force, batch_size=batch_size, loader_mode=loader_mode)
@@ -0,0 +1,141 @@
+import logging
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+BATCH_LOADER = "batch"
+NATIVE_LOADER = "native"
+
+NATIVE_FLUSH_ROWS = 100_000
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+
+
+class BatchInsertLoader:
+    """Insere cada lote com um único executemany do SQLAlchemy Core."""
+
+    mode = BATCH_LOADER
+
+    def __init__(self, session: Session, table: Table) -> None:
+        self.session = session
+        self.table = table
+        self.rows_loaded = 0
+
+    def add(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        self.session.execute(self.table.insert(), rows)
+        self.rows_loaded += len(rows)
+
+    def finish(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+class LoadDataLoader:
+    """
+    Acumula as linhas em um TSV temporário e as envia ao MySQL com
+    ``LOAD DATA LOCAL INFILE``, o carregador nativo do servidor.
+
+    O arquivo é descarregado a cada ``flush_rows`` linhas, mantendo o uso de
+    disco e o tamanho de cada transação limitados.
+    """
+
+    mode = NATIVE_LOADER
+
+    def __init__(
+        self, session: Session, table: Table, flush_rows: int = NATIVE_FLUSH_ROWS
+    ) -> None:
+        self.session = session
+        self.table = table
+        self.flush_rows = flush_rows
+        self.rows_loaded = 0
+        self._columns: Optional[Sequence[str]] = None
+        self._file = None
+        self._pending = 0
+
+    def add(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        if self._columns is None:
+            self._columns = list(rows[0].keys())
+        if self._file is None:
+            self._file = tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", newline="", suffix=".tsv", delete=False
+            )
+
+        columns = self._columns
+        write = self._file.write
+        for row in rows:
+            write("\t".join(_tsv_value(row.get(column)) for column in columns))
+            write("\n")
+        self._pending += len(rows)
+
+        if self._pending >= self.flush_rows:
+            self._flush()
+
+    def finish(self) -> None:
+        self._flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            os.unlink(self._file.name)
+            self._file = None
+
+    def _flush(self) -> None:
+        if self._file is None or not self._pending:
+            return
+        self._file.close()
+        path = self._file.name.replace("\\", "/").replace("'", "\\'")
+        column_list = ", ".join(f"`{column}`" for column in self._columns)
+        statement = (
+            f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE `{self.table.name}` "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+            "LINES TERMINATED BY '\\n' "
+            f"({column_list})"
+        )
+        try:
+            self.session.connection().exec_driver_sql(statement)
+            self.session.commit()
+        finally:
+            os.unlink(self._file.name)
+            self._file = None
+        self.rows_loaded += self._pending
+        logger.info("%s: %s linhas carregadas via LOAD DATA.", self.table.name, self._pending)
+        self._pending = 0
+
+
+def create_loader(session: Session, table: Table, mode: str):
+    """
+    Escolhe o carregador de inserções. O modo nativo só existe no MySQL/MariaDB;
+    nos demais bancos (ex.: SQLite em desenvolvimento) cai para o executemany.
+    """
+    if mode == NATIVE_LOADER:
+        if session.get_bind().dialect.name in {"mysql", "mariadb"}:
+            return LoadDataLoader(session, table)
+        logger.info(
+            "Carregador nativo indisponível para %s. Usando inserção em lotes.",
+            session.get_bind().dialect.name,
+        )
+    elif mode != BATCH_LOADER:
+        raise ValueError(f"Modo de carga desconhecido: {mode}")
+    return BatchInsertLoader(session, table)
+
+
+def _tsv_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        return repr(value)
+    return str(value).translate(_TSV_ESCAPES)
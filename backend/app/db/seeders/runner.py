@@ -0,0 +1,105 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ...core.config import settings
+from ..derived import DERIVED_TABLES, SOURCE_TABLE
+from ..session import get_engine
+from . import (
+    candidato_sp_seeder,
+    candidatos_sp_22_24_seeder,
+    estaduais_nao_eleitos_sp_seeder,
+    federais_nao_eleitos_sp_seeder,
+)
+from .candidato_sp_seeder import seed_candidatos_sp
+from .candidatos_sp_22_24_seeder import seed_candidatos_sp_22_24
+from .dataset import Dataset
+from .estaduais_nao_eleitos_sp_seeder import seed_estaduais_nao_eleitos_sp
+from .federais_nao_eleitos_sp_seeder import seed_federais_nao_eleitos_sp
+
+logger = logging.getLogger(__name__)
+
+# Tabelas independentes entre si: podem ser carregadas em paralelo. As
+# derivadas (``derived.DERIVED_TABLES``) esperam a carga das demais.
+SEEDERS: Dict[str, Callable[..., None]] = {
+    "candidatos_sp": seed_candidatos_sp,
+    "candidatos_sp_22_24": seed_candidatos_sp_22_24,
+    "federais_nao_eleitos_sp": seed_federais_nao_eleitos_sp,
+    "estaduais_nao_eleitos_sp": seed_estaduais_nao_eleitos_sp,
+}
+
+# Definição de cada conjunto (arquivo, conversão, chave), usada pela CLI de ingestão.
+DATASETS: Dict[str, Dataset] = {
+    "candidatos_sp": candidato_sp_seeder.DEFINITION,
+    "candidatos_sp_22_24": candidatos_sp_22_24_seeder.DEFINITION,
+    "federais_nao_eleitos_sp": federais_nao_eleitos_sp_seeder.DEFINITION,
+    "estaduais_nao_eleitos_sp": estaduais_nao_eleitos_sp_seeder.DEFINITION,
+}
+
+
+def seed_all(
+    force: bool = False,
+    tables: Optional[Iterable[str]] = None,
+    parallelism: Optional[int] = None,
+    loader_mode: Optional[str] = None,
+) -> None:
+    """
+    Executa os seeders das tabelas informadas (todas por padrão), cada um em
+    sua própria sessão. No SQLite as escritas são serializadas pelo próprio
+    banco, então os seeders rodam em sequência.
+
+    As tabelas derivadas rodam depois das demais. Se ``candidatos_sp_22_24``
+    tem linhas do recorte, a carga dela já as recalculou e o arquivo de seed
+    não é lido.
+    """
+    names = list(tables) if tables is not None else list(SEEDERS)
+    unknown = set(names).difference(SEEDERS)
+    if unknown:
+        raise ValueError(f"Seeders desconhecidos: {', '.join(sorted(unknown))}")
+
+    workers = parallelism or settings.seed_parallelism
+    if get_engine().dialect.name == "sqlite":
+        workers = 1
+
+    errors = _run([name for name in names if name not in DERIVED_TABLES], workers, force, loader_mode)
+    derived = []
+    for name in names:
+        if name not in DERIVED_TABLES:
+            continue
+        if _has_source_rows(name):
+            logger.info("%s é calculada a partir de %s. Arquivo de seed não usado.", name, SOURCE_TABLE)
+        else:
+            derived.append(name)
+    errors += _run(derived, workers, force, loader_mode)
+
+    if errors:
+        failed = ", ".join(name for name, _ in errors)
+        raise RuntimeError(f"Falha ao executar os seeders: {failed}") from errors[0][1]
+
+
+def _has_source_rows(name: str) -> bool:
+    with get_engine().connect() as connection:
+        return bool(DERIVED_TABLES[name].expected_rows(connection))
+
+
+def _run(
+    names: List[str], workers: int, force: bool, loader_mode: Optional[str]
+) -> List[Tuple[str, Exception]]:
+    workers = max(1, min(workers, len(names)))
+    if workers == 1:
+        for name in names:
+            SEEDERS[name](force=force, loader_mode=loader_mode)
+        return []
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seeder") as executor:
+        futures = {
+            executor.submit(SEEDERS[name], force=force, loader_mode=loader_mode): name
+            for name in names
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:  # noqa: BLE001 - cada seeder já registra o erro
+                errors.append((futures[future], exc))
+    return errors
@@ -0,0 +1,120 @@
+import logging
+from contextlib import contextmanager
+from typing import ContextManager, Dict, Iterator, List, Sequence
+
+from sqlalchemy import MetaData, Table, inspect
+from sqlalchemy.orm import Session
+
+from ..locks import named_lock
+
+logger = logging.getLogger(__name__)
+
+SHADOW_SUFFIX = "__shadow"
+OLD_SUFFIX = "__old"
+SEED_LOCK_TIMEOUT = 3600
+
+# Tabelas que a própria aplicação altera (PUT /candidatos2022sp, edições do
+# grid, apuração ao vivo). Uma escrita entre a cópia para a sombra e o RENAME
+# se perderia, então elas são sempre sincronizadas no lugar.
+APP_WRITTEN_TABLES = frozenset({"candidatos_sp", "candidatos_grid"})
+
+
+def supports_shadow_swap(session: Session, live: Table) -> bool:
+    """
+    A troca atômica de várias tabelas com RENAME TABLE só existe no
+    MySQL/MariaDB, e só é segura em tabelas que a aplicação não altera.
+    """
+    return (
+        session.get_bind().dialect.name in {"mysql", "mariadb"}
+        and live.name not in APP_WRITTEN_TABLES
+    )
+
+
+def seed_lock(session: Session, live: Table) -> ContextManager[None]:
+    """Uma carga por vez em ``live`` (GET_LOCK ``seed:<tabela>`` no MySQL)."""
+    return named_lock(
+        session.get_bind(),
+        f"seed:{live.name}",
+        SEED_LOCK_TIMEOUT,
+        f"Tempo esgotado esperando outra carga de {live.name} terminar",
+    )
+
+
+@contextmanager
+def shadow_table(
+    session: Session, live: Table, copy_rows: bool = True, keep_indexes: Sequence[str] = ()
+) -> Iterator[Table]:
+    """
+    Prepara uma cópia da tabela ``live`` para receber a carga e, ao final do
+    bloco, a coloca no lugar da original com um único ``RENAME TABLE``.
+
+    A cópia é criada com ``CREATE TABLE ... LIKE`` (mesmas colunas e ids), sem
+    os índices secundários, que só são construídos depois da carga (menos os
+    de ``keep_indexes``, que a própria carga consulta). Leitores da
+    tabela original nunca esperam nem enxergam dados pela metade. Se o bloco
+    falhar, a cópia é descartada e a tabela original permanece intacta.
+
+    Os nomes da sombra são fixos: o bloqueio ``seed:<tabela>`` (GET_LOCK),
+    mantido da criação da cópia até a troca, impede que duas cargas da mesma
+    tabela (vários workers, ou a CLI com a API subindo) descartem a sombra uma
+    da outra.
+    """
+    with seed_lock(session, live):
+        yield from _swap(session, live, copy_rows, keep_indexes)
+
+
+def _swap(
+    session: Session, live: Table, copy_rows: bool, keep_indexes: Sequence[str]
+) -> Iterator[Table]:
+    shadow_name = f"{live.name}{SHADOW_SUFFIX}"
+    old_name = f"{live.name}{OLD_SUFFIX}"
+    connection = session.connection()
+    indexes = [
+        index
+        for index in _secondary_indexes(connection, live.name)
+        if index["name"] not in keep_indexes
+    ]
+
+    connection.exec_driver_sql(f"DROP TABLE IF EXISTS `{shadow_name}`, `{old_name}`")
+    connection.exec_driver_sql(f"CREATE TABLE `{shadow_name}` LIKE `{live.name}`")
+    if indexes:
+        drops = ", ".join(f"DROP INDEX `{index['name']}`" for index in indexes)
+        connection.exec_driver_sql(f"ALTER TABLE `{shadow_name}` {drops}")
+    if copy_rows:
+        connection.exec_driver_sql(f"INSERT INTO `{shadow_name}` SELECT * FROM `{live.name}`")
+    session.commit()
+
+    shadow = live.to_metadata(MetaData(), name=shadow_name)
+    try:
+        yield shadow
+
+        connection = session.connection()
+        if indexes:
+            logger.info("%s: construindo %s índices na tabela sombra.", live.name, len(indexes))
+            adds = ", ".join(_index_clause(index) for index in indexes)
+            connection.exec_driver_sql(f"ALTER TABLE `{shadow_name}` {adds}")
+        connection.exec_driver_sql(
+            f"RENAME TABLE `{live.name}` TO `{old_name}`, `{shadow_name}` TO `{live.name}`"
+        )
+        connection.exec_driver_sql(f"DROP TABLE `{old_name}`")
+        session.commit()
+        logger.info("%s: tabela sombra promovida.", live.name)
+    except Exception:
+        session.rollback()
+        session.connection().exec_driver_sql(f"DROP TABLE IF EXISTS `{shadow_name}`")
+        session.commit()
+        raise
+
+
+def _secondary_indexes(connection, table_name: str) -> List[Dict]:
+    return [
+        index
+        for index in inspect(connection).get_indexes(table_name)
+        if index.get("name") and index.get("column_names")
+    ]
+
+
+def _index_clause(index: Dict) -> str:
+    columns = ", ".join(f"`{column}`" for column in index["column_names"])
+    kind = "UNIQUE INDEX" if index.get("unique") else "INDEX"
+    return f"ADD {kind} `{index['name']}` ({columns})"
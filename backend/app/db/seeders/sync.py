@@ -0,0 +1,359 @@
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Column, Index, MetaData, Table, and_, bindparam, exists, func, or_, select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.orm import Session
+
+from ...core.cache import bump_table_versions
+from ..models import SeedState
+from .loaders import BATCH_LOADER, create_loader
+from .pipeline import batched
+from .shadow import seed_lock, shadow_table, supports_shadow_swap
+
+logger = logging.getLogger(__name__)
+
+DIFF_STRATEGY = "diff"
+SHADOW_STRATEGY = "shadow"
+STAGING_SUFFIX = "__seed_keys"
+SOURCE_SEPARATOR = ":"
+
+
+@dataclass
+class SyncResult:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+
+def file_checksum(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Calcula o SHA-256 do arquivo de seed sem carregá-lo inteiro na memória."""
+    digest = hashlib.sha256()
+    with path.open("rb") as source:
+        for chunk in iter(lambda: source.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_stored_checksum(session: Session, dataset: str) -> Optional[str]:
+    state = session.get(SeedState, dataset)
+    return state.checksum if state else None
+
+
+def store_checksum(session: Session, dataset: str, checksum: str, row_count: int) -> None:
+    state = session.get(SeedState, dataset)
+    if state is None:
+        state = SeedState(dataset=dataset)
+    state.checksum = checksum
+    state.row_count = row_count
+    # Atualizado mesmo sem mudança de checksum: ``newer_source`` compara as datas.
+    state.updated_at = func.now()
+    session.add(state)
+
+
+def source_key(dataset: str, source: str) -> str:
+    """Chave em ``seed_state`` das cargas de ``dataset`` feitas por outra fonte (ex.: ``tse``)."""
+    return f"{dataset}{SOURCE_SEPARATOR}{source}"
+
+
+def newer_source(session: Session, dataset: str) -> Optional[str]:
+    """
+    Fonte cuja carga de ``dataset`` (registrada com ``source_key``) é mais
+    recente que a do arquivo de seed, ou ``None`` se a última carga veio do
+    arquivo. A tabela então não corresponde ao arquivo, mesmo com o checksum
+    dele inalterado.
+    """
+    own = session.get(SeedState, dataset)
+    query = select(SeedState).where(SeedState.dataset.startswith(f"{dataset}{SOURCE_SEPARATOR}"))
+    if own is not None:
+        query = query.where(SeedState.updated_at > own.updated_at)
+    state = session.execute(query.order_by(SeedState.updated_at.desc()).limit(1)).scalar_one_or_none()
+    return state.dataset.split(SOURCE_SEPARATOR, 1)[1] if state is not None else None
+
+
+def sync_records(
+    session: Session,
+    model,
+    records: Iterable[Dict[str, Any]],
+    key_fields: Sequence[str],
+    batch_size: int = 1000,
+    progress: Optional[Callable[[SyncResult], None]] = None,
+    loader_mode: str = BATCH_LOADER,
+    strategy: str = DIFF_STRATEGY,
+) -> SyncResult:
+    """
+    Sincroniza a tabela do modelo com os registros informados.
+
+    Os registros são comparados pela chave natural ``key_fields``: linhas novas
+    são inseridas, linhas alteradas são atualizadas e linhas que sumiram do
+    arquivo são removidas. Linhas idênticas não geram escrita alguma.
+
+    ``records`` é consumido em lotes de ``batch_size`` e cada lote é gravado
+    em sua própria transação. As linhas atuais são lidas por lote e as chaves
+    já vistas ficam no banco, de modo que apenas um lote fica em memória.
+    As inserções passam pelo carregador escolhido em ``loader_mode``.
+
+    Se a sincronização falha no meio, os lotes já gravados ficam e a versão
+    de cache da tabela é incrementada.
+
+    Com ``strategy="shadow"`` (MySQL) a sincronização acontece em uma cópia da
+    tabela, trocada pela original ao final com ``RENAME TABLE``; nos demais
+    bancos, e nas tabelas que a aplicação também altera
+    (``shadow.APP_WRITTEN_TABLES``), a tabela é sincronizada no lugar.
+    """
+    if strategy not in {DIFF_STRATEGY, SHADOW_STRATEGY}:
+        raise ValueError(f"Estratégia de seed desconhecida: {strategy}")
+
+    options = dict(
+        key_fields=key_fields, batch_size=batch_size, progress=progress, loader_mode=loader_mode
+    )
+    live = model.__table__
+    if strategy == SHADOW_STRATEGY and supports_shadow_swap(session, live):
+        records = _PeekableRecords(records)
+        if records.empty():
+            return SyncResult()
+        keep = [index.name for index in live.indexes if _covers_key(index, key_fields)]
+        with shadow_table(session, live, keep_indexes=keep) as shadow:
+            return _sync_table(session, shadow, records, **options)
+
+    if strategy == SHADOW_STRATEGY:
+        logger.info(
+            "Troca por tabela sombra indisponível para %s (%s). Sincronizando no lugar.",
+            live.name,
+            session.get_bind().dialect.name,
+        )
+    with seed_lock(session, live):
+        try:
+            return _sync_table(session, live, records, **options)
+        except Exception:
+            # Os lotes já gravados ficam na tabela: o cache não pode seguir servindo a versão anterior.
+            bump_table_versions([live.name])
+            raise
+
+
+def _covers_key(index: Index, key_fields: Sequence[str]) -> bool:
+    """Índice cujas primeiras colunas são a chave natural, usado nas consultas por lote."""
+    names = [column.name for column in index.columns]
+    return names[: len(key_fields)] == list(key_fields)
+
+
+def _sync_table(
+    session: Session,
+    table: Table,
+    records: Iterable[Dict[str, Any]],
+    key_fields: Sequence[str],
+    batch_size: int,
+    progress: Optional[Callable[[SyncResult], None]],
+    loader_mode: str,
+) -> SyncResult:
+    """
+    Cada lote consulta no banco só as linhas das suas chaves. As chaves já
+    lidas ficam em uma tabela auxiliar (``<tabela>__seed_keys``), que aponta
+    chaves repetidas entre lotes e, no fim, as linhas que sumiram do arquivo.
+    A memória usada é a de um lote, qualquer que seja o tamanho da tabela.
+    """
+    result = SyncResult()
+    value_fields: Optional[List[str]] = None
+    update_statement = None
+    duplicates = 0
+    started = time.perf_counter()
+    staging = _staging_table(session, table, key_fields)
+    loader = create_loader(session, table, loader_mode)
+
+    try:
+        for batch in batched(records, batch_size):
+            if value_fields is None:
+                value_fields = sorted(batch[0].keys())
+                update_statement = table.update().where(table.c.id == bindparam("_id"))
+
+            unique: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+            for record in batch:
+                key = tuple(record.get(field) for field in key_fields)
+                if key in unique:
+                    duplicates += 1
+                    continue
+                unique[key] = record
+            for key in _staged_keys(session, staging, key_fields, list(unique)):
+                duplicates += 1
+                del unique[key]
+            if not unique:
+                continue
+
+            existing, repeated_ids = _load_existing(
+                session, table, key_fields, value_fields, list(unique)
+            )
+            to_insert: List[Dict[str, Any]] = []
+            to_update: List[Dict[str, Any]] = []
+            for key, record in unique.items():
+                current = existing.get(key)
+                if current is None:
+                    to_insert.append(record)
+                    continue
+
+                row_id, current_values = current
+                if current_values == tuple(record.get(field) for field in value_fields):
+                    result.unchanged += 1
+                else:
+                    to_update.append({"_id": row_id, **record})
+
+            session.execute(
+                staging.insert(), [dict(zip(key_fields, key)) for key in unique]
+            )
+            if to_update:
+                session.execute(update_statement, to_update)
+            if repeated_ids:
+                session.execute(table.delete().where(table.c.id.in_(repeated_ids)))
+            loader.add(to_insert)
+            session.commit()
+
+            result.inserted += len(to_insert)
+            result.updated += len(to_update)
+            result.deleted += len(repeated_ids)
+            _report_progress(table, result, started)
+            if progress:
+                progress(result)
+
+        loader.finish()
+
+        if value_fields is None:
+            # Nenhum registro lido: não removemos nada com base em um arquivo vazio.
+            return result
+
+        if duplicates:
+            logger.warning(
+                "%s registros com chave natural duplicada foram ignorados em %s.",
+                duplicates,
+                table.name,
+            )
+
+        matches = and_(
+            *(staging.c[field].is_not_distinct_from(table.c[field]) for field in key_fields)
+        )
+        stale = session.execute(table.delete().where(~exists().where(matches)))
+        session.commit()
+        result.deleted += stale.rowcount
+        return result
+    finally:
+        loader.close()
+        _drop_staging(session, staging)
+
+
+def _report_progress(table: Table, result: SyncResult, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    rate = result.total / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        "%s: %s registros processados (%.0f registros/s).",
+        table.name,
+        result.total,
+        rate,
+    )
+
+
+def _key_condition(
+    table: Table, key_fields: Sequence[str], keys: Sequence[Tuple[Any, ...]]
+) -> ColumnElement:
+    """
+    ``chave IN (...)`` sobre as colunas de ``key_fields``. Chaves com algum
+    campo nulo não casam em um IN e viram comparações com ``IS NULL``.
+    """
+    columns = [table.c[field] for field in key_fields]
+    complete = [key for key in keys if None not in key]
+    conditions = [tuple_(*columns).in_(complete)] if complete else []
+    for key in keys:
+        if None in key:
+            conditions.append(
+                and_(*(column.is_(None) if value is None else column == value
+                       for column, value in zip(columns, key)))
+            )
+    return or_(*conditions)
+
+
+def _load_existing(
+    session: Session,
+    table: Table,
+    key_fields: Sequence[str],
+    value_fields: Sequence[str],
+    keys: Sequence[Tuple[Any, ...]],
+) -> Tuple[Dict[Tuple[Any, ...], Tuple[int, Tuple[Any, ...]]], List[int]]:
+    """
+    Linhas atuais com as chaves ``keys``, indexadas pela chave natural. Se a
+    tabela tem mais de uma linha com a mesma chave, fica a de menor id e os
+    ids das demais são devolvidos à parte.
+    """
+    key_count = len(key_fields)
+    columns = [table.c[field] for field in (*key_fields, *value_fields)]
+    existing: Dict[Tuple[Any, ...], Tuple[int, Tuple[Any, ...]]] = {}
+    repeated_ids: List[int] = []
+    rows = session.execute(
+        select(table.c.id, *columns)
+        .where(_key_condition(table, key_fields, keys))
+        .order_by(table.c.id)
+    )
+    for row in rows:
+        key = tuple(row[1 : key_count + 1])
+        if key in existing:
+            repeated_ids.append(row[0])
+            continue
+        existing[key] = (row[0], tuple(row[key_count + 1 :]))
+    return existing, repeated_ids
+
+
+def _staging_table(session: Session, table: Table, key_fields: Sequence[str]) -> Table:
+    """Tabela auxiliar com as chaves já lidas nesta carga, recriada vazia."""
+    name = f"{table.name}{STAGING_SUFFIX}"
+    staging = Table(
+        name,
+        MetaData(),
+        *(Column(field, table.c[field].type) for field in key_fields),
+        Index(f"ix_{name}", *key_fields),
+    )
+    connection = session.connection()
+    staging.drop(connection, checkfirst=True)
+    staging.create(connection)
+    session.commit()
+    return staging
+
+
+def _staged_keys(
+    session: Session, staging: Table, key_fields: Sequence[str], keys: Sequence[Tuple[Any, ...]]
+) -> List[Tuple[Any, ...]]:
+    if not keys:
+        return []
+    query = select(*(staging.c[field] for field in key_fields)).where(
+        _key_condition(staging, key_fields, keys)
+    )
+    return list({tuple(row) for row in session.execute(query)})
+
+
+def _drop_staging(session: Session, staging: Table) -> None:
+    session.rollback()
+    staging.drop(session.connection(), checkfirst=True)
+    session.commit()
+
+
+class _PeekableRecords:
+    """Iterador que permite verificar se há registros sem consumir o primeiro."""
+
+    def __init__(self, items: Iterable[Dict[str, Any]]) -> None:
+        self._iterator = iter(items)
+        self._head: List[Dict[str, Any]] = []
+
+    def empty(self) -> bool:
+        if not self._head:
+            self._head = list(islice(self._iterator, 1))
+        return not self._head
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        yield from self._head
+        self._head = []
+        yield from self._iterator
@@ -1,21 +1,65 @@
+import threading
+from typing import Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from ..core.config import settings
 
-# Adicionar parâmetros para garantir UTF-8
-database_url = settings.database_url
-if "mysql" in database_url or "mariadb" in database_url:
-    # Adicionar charset=utf8mb4 se não estiver presente
-    if "charset=" not in database_url:
-        separator = "&" if "?" in database_url else "?"
-        database_url = f"{database_url}{separator}charset=utf8mb4"
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def _database_url() -> str:
+    # Adicionar parâmetros para garantir UTF-8
+    database_url = settings.database_url
+    if "mysql" in database_url or "mariadb" in database_url:
+        # Adicionar charset=utf8mb4 se não estiver presente
+        if "charset=" not in database_url:
+            separator = "&" if "?" in database_url else "?"
+            database_url = f"{database_url}{separator}charset=utf8mb4"
+    return database_url
+
+
+def get_engine() -> Engine:
+    """
+    Cria o engine na primeira utilização. O driver do banco (mysql-connector)
+    só é importado aqui, fora do caminho de importação do ``app.main``.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                database_url = _database_url()
+                connect_args = {}
+                if "mysql" in database_url or "mariadb" in database_url:
+                    connect_args["charset"] = "utf8mb4"
+                    # O carregador nativo dos seeders usa LOAD DATA LOCAL INFILE
+                    if settings.seed_loader == "native":
+                        connect_args["allow_local_infile"] = True
+                _engine = create_engine(database_url, pool_pre_ping=True, connect_args=connect_args)
+                SessionLocal.configure(bind=_engine)
+    return _engine
 
-engine = create_engine(database_url, pool_pre_ping=True, connect_args={"charset": "utf8mb4"} if "mysql" in database_url or "mariadb" in database_url else {})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+class _LazySessionmaker(sessionmaker):
+    def __call__(self, **local_kw):
+        get_engine()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
 
+def __getattr__(name: str):
+    # Compatibilidade com ``from app.db.session import engine`` nos scripts.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_db():
     db = SessionLocal()
     try:
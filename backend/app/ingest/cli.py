@@ -0,0 +1,523 @@
+"""
+Linha de comando da ingestão de dados.
+
+    python -m app.ingest load [conjuntos...] [--force] [--workers N] [--file CAMINHO]
+    python -m app.ingest verify [conjuntos...]
+    python -m app.ingest rederive [conjuntos...]
+    python -m app.ingest migrate [--status]
+    python -m app.ingest tse --candidates consulta_cand_2022.zip [--results ...] [--finance ...]
+    python -m app.ingest tse-sample --out DIRETÓRIO
+    python -m app.ingest watch DIRETÓRIO [--once] [--interval 2]
+    python -m app.ingest live-sample --out DIRETÓRIO [--steps 10] [--interval 3]
+    python -m app.ingest patch TABELA CORREÇÕES.csv|.json [--key id] [--dry-run]
+    python -m app.ingest repair-encoding [tabelas...] [--dry-run]
+
+Sem conjuntos informados, o comando vale para todos os conhecidos.
+"""
+import argparse
+import hashlib
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..db.base import Base
+from ..db.derived import DERIVED_TABLES, SOURCE_TABLE, refresh_after_load, refresh_derived
+from ..db.models import SeedState
+from ..db.migrations import migration_status, run_migrations
+from ..db.seeders.candidatos_sp_22_24_seeder import DEFINITION as CANDIDATOS_SP_22_24
+from ..db.seeders.dataset import Dataset, seed_dataset
+from ..db.seeders.loaders import BATCH_LOADER, NATIVE_LOADER
+from ..db.seeders.runner import DATASETS
+from ..db.seeders.sync import (
+    file_checksum,
+    get_stored_checksum,
+    newer_source,
+    source_key,
+    store_checksum,
+    sync_records,
+)
+from ..db.session import SessionLocal, get_engine
+from .corrections import apply_corrections, read_patch_file
+from .live import FILE_PATTERN, LiveResultsWatcher
+from .live_sample import load_candidates, write_result_series
+from .mojibake import repair_encoding
+from .pipeline import ParallelCsvReader, StageStats
+from .snapshot import SnapshotWriter, default_snapshot_dir, remove_stale_snapshots, snapshot_path
+from .tse import SEED_SOURCE, read_archives
+from .tse_sample import write_sample_archives
+
+logger = logging.getLogger(__name__)
+
+
+def _selected(names: Sequence[str]) -> List[Dataset]:
+    unknown = set(names).difference(DATASETS)
+    if unknown:
+        raise SystemExit(f"Conjuntos desconhecidos: {', '.join(sorted(unknown))}")
+    return [DATASETS[name] for name in (names or DATASETS)]
+
+
+def _measure(dataset: Dataset, path: Path, workers: Optional[int], consume: Callable) -> StageStats:
+    stats = StageStats()
+    reader = ParallelCsvReader(path, dataset.schema, workers=workers, stats=stats)
+    started = time.perf_counter()
+    consume(reader)
+    stats.finish(time.perf_counter() - started, parallel=reader.workers > 0)
+    return stats
+
+
+def _print_refreshed(refreshed: Dict[str, Optional[int]]) -> None:
+    for name, rows in refreshed.items():
+        if rows is None:
+            print(f"{name}: sem linhas de origem em {SOURCE_TABLE}, mantida")
+        else:
+            print(f"{name}: recalculada a partir de {SOURCE_TABLE} ({rows} linhas)")
+
+
+def cmd_load(args: argparse.Namespace) -> int:
+    datasets = _selected(args.datasets)
+    if args.file and len(datasets) != 1:
+        raise SystemExit("--file exige exatamente um conjunto")
+
+    run_migrations(get_engine())
+    for dataset in datasets:
+        path = Path(args.file) if args.file else dataset.find_file()
+        if path is None or not path.exists():
+            print(f"{dataset.name}: arquivo não encontrado, pulando")
+            continue
+
+        results = []
+
+        def consume(reader: ParallelCsvReader) -> None:
+            results.append(
+                seed_dataset(
+                    dataset,
+                    force=args.force,
+                    batch_size=args.batch_size,
+                    loader_mode=args.loader,
+                    data_path=path,
+                    reader=lambda _path, _checksum: reader,
+                )
+            )
+
+        stats = _measure(dataset, path, args.workers, consume)
+        result = results[0]
+        if result is None:
+            print(f"{dataset.name}: inalterado desde a última carga (use --force para recarregar)")
+            continue
+        print(stats.report(dataset.name))
+        print(
+            f"  {result.inserted} inseridos, {result.updated} atualizados, "
+            f"{result.deleted} removidos, {result.unchanged} inalterados"
+        )
+    return 0
+
+
+def cmd_verify(args: argparse.Namespace) -> int:
+    run_migrations(get_engine())
+    problems = 0
+    session: Session = SessionLocal()
+    try:
+        for dataset in _selected(args.datasets):
+            derived = DERIVED_TABLES.get(dataset.name)
+            expected = derived.expected_rows(session.connection()) if derived else 0
+            if expected:
+                table_rows = session.scalar(select(func.count()).select_from(dataset.model))
+                ok = table_rows == expected
+                print(f"{dataset.name}: derivada de {SOURCE_TABLE}, {table_rows} linhas (esperadas {expected})")
+                print(f"  {'OK' if ok else 'DIVERGENTE: rode python -m app.ingest rederive'}")
+                problems += not ok
+                continue
+
+            path = dataset.find_file()
+            if path is None:
+                print(f"{dataset.name}: arquivo não encontrado, pulando")
+                continue
+            source = newer_source(session, dataset.name)
+            if source is not None:
+                print(f"{dataset.name}: carregada de {source} depois do arquivo, pulando")
+                continue
+
+            keys = [getattr(dataset.model, field) for field in dataset.natural_key]
+            file_keys = set()
+
+            def consume(reader: ParallelCsvReader) -> None:
+                for record in reader:
+                    file_keys.add(tuple(record[field] for field in dataset.natural_key))
+
+            stats = _measure(dataset, path, args.workers, consume)
+            table_keys = set(session.execute(select(*keys)).all())
+            table_rows = session.scalar(select(func.count()).select_from(dataset.model))
+            state = session.get(SeedState, dataset.name)
+
+            issues = []
+            if state is None:
+                issues.append("nenhuma carga registrada")
+            elif state.checksum != file_checksum(path):
+                issues.append("arquivo alterado desde a última carga")
+            if table_rows != len(table_keys):
+                issues.append(f"{table_rows - len(table_keys)} linhas com chave duplicada")
+            missing = len(file_keys - table_keys)
+            extra = len(table_keys - file_keys)
+            if missing:
+                issues.append(f"{missing} registros do arquivo ausentes na tabela")
+            if extra:
+                issues.append(f"{extra} registros na tabela que não estão no arquivo")
+
+            print(stats.report(dataset.name))
+            print(f"  tabela: {table_rows} linhas | arquivo: {len(file_keys)} chaves distintas")
+            print(f"  {'OK' if not issues else 'DIVERGENTE: ' + '; '.join(issues)}")
+            problems += bool(issues)
+    finally:
+        session.close()
+    return 1 if problems else 0
+
+
+def cmd_rederive(args: argparse.Namespace) -> int:
+    for dataset in _selected(args.datasets):
+        path = dataset.find_file()
+        if path is None:
+            print(f"{dataset.name}: arquivo não encontrado, pulando")
+            continue
+
+        writer = SnapshotWriter(dataset.schema)
+
+        def consume(reader: ParallelCsvReader) -> None:
+            for record in reader:
+                writer.append(record)
+
+        stats = _measure(dataset, path, args.workers, consume)
+        directory = default_snapshot_dir(path)
+        target = snapshot_path(directory, dataset.name, file_checksum(path), dataset.schema)
+        writer.save(target)
+        remove_stale_snapshots(directory, dataset.name, keep=target)
+        print(stats.report(dataset.name))
+        print(f"  snapshot: {target} ({target.stat().st_size:,} bytes)")
+
+    derived = [name for name in (args.datasets or DERIVED_TABLES) if name in DERIVED_TABLES]
+    if derived:
+        run_migrations(get_engine())
+        _print_refreshed(refresh_derived(get_engine(), derived))
+    return 0
+
+
+def cmd_migrate(args: argparse.Namespace) -> int:
+    engine = get_engine()
+    if not args.status:
+        applied = run_migrations(engine)
+        if not applied:
+            print("Esquema já atualizado.")
+        for migration in applied:
+            print(f"Aplicada {migration.version}: {migration.name}")
+    if args.status or args.verbose:
+        for item in migration_status(engine):
+            applied_at = item["applied_at"] or "pendente"
+            print(f"{item['version']:>4}  {applied_at}  {item['name']}")
+    return 0
+
+
+def cmd_tse(args: argparse.Namespace) -> int:
+    dataset = CANDIDATOS_SP_22_24
+    stats = StageStats()
+    started = time.perf_counter()
+    scope = ", ".join(args.uf) or "todas as UFs"
+
+    def read() -> Iterator[Dict[str, Any]]:
+        # Os registros são montados à medida que a sincronização os consome.
+        return read_archives(
+            [Path(path) for path in args.candidates],
+            [Path(path) for path in args.results],
+            [Path(path) for path in args.finance],
+            ufs=args.uf,
+            years=args.year,
+            workers=args.workers,
+            stats=stats,
+        )
+
+    if args.dry_run:
+        count = sum(1 for _ in read())
+        stats.elapsed = time.perf_counter() - started
+        print(f"{count} registros de candidatos ({scope})")
+        print(stats.report("tse"))
+        return 0
+
+    # Os zips informados formam o conteúdo completo da tabela: o checksum
+    # cobre todos eles e os filtros, e linhas que não vierem deles são removidas.
+    digest = hashlib.sha256()
+    for path in sorted(args.candidates + args.results + args.finance):
+        digest.update(file_checksum(Path(path)).encode())
+    digest.update(repr((sorted(args.uf), sorted(args.year))).encode())
+    checksum = digest.hexdigest()
+
+    # Estado próprio: o seeder do CSV não confunde esta carga com a do arquivo
+    # e deixa a tabela como está enquanto ela for a mais recente.
+    state_key = source_key(dataset.name, SEED_SOURCE)
+    run_migrations(get_engine())
+    session: Session = SessionLocal()
+    try:
+        unchanged = get_stored_checksum(session, state_key) == checksum
+        if not args.force and unchanged and newer_source(session, dataset.name) == SEED_SOURCE:
+            print(f"{dataset.name}: inalterado desde a última carga (use --force para recarregar)")
+            return 0
+        records = read()
+        write_started, convert = time.perf_counter(), stats.stages["convert"]
+        result = sync_records(
+            session,
+            dataset.model,
+            records,
+            dataset.natural_key,
+            batch_size=args.batch_size or settings.seed_batch_size,
+            loader_mode=args.loader or settings.seed_loader,
+            strategy=settings.seed_strategy,
+        )
+        store_checksum(session, state_key, checksum, result.total)
+        session.commit()
+        # A junção dos registros corre dentro da sincronização; ela fica em ``convert``.
+        convert = stats.stages["convert"] - convert
+        stats.add("write", time.perf_counter() - write_started - convert)
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    print(f"{result.total} registros de candidatos ({scope})")
+    stats.elapsed = time.perf_counter() - started
+    print(stats.report(dataset.name))
+    print(
+        f"  {result.inserted} inseridos, {result.updated} atualizados, "
+        f"{result.deleted} removidos, {result.unchanged} inalterados"
+    )
+    _print_refreshed(refresh_after_load(dataset.model.__tablename__))
+    return 0
+
+
+def cmd_tse_sample(args: argparse.Namespace) -> int:
+    archives = write_sample_archives(
+        Path(args.out),
+        ufs=args.ufs,
+        years=args.years,
+        candidates_per_uf=args.candidates,
+        zones=args.zones,
+        seed=args.seed,
+    )
+    for kind, paths in archives.items():
+        for path in paths:
+            print(f"{kind:>11}: {path} ({path.stat().st_size:,} bytes)")
+    return 0
+
+
+def cmd_watch(args: argparse.Namespace) -> int:
+    run_migrations(get_engine())
+    watcher = LiveResultsWatcher(Path(args.directory), interval=args.interval)
+    if not args.once:
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    started = time.perf_counter()
+    applied = watcher.poll_once()
+    elapsed = time.perf_counter() - started
+    changed = sum(len(outcome.changed) for outcome in applied)
+    last = applied[-1].sequence if applied else None
+    print(f"{len(applied)} arquivos aplicados em {elapsed:.2f}s, {changed} candidatos alterados, sequência {last}")
+    return 0
+
+
+def cmd_live_sample(args: argparse.Namespace) -> int:
+    directory = Path(args.out)
+    existing = [
+        int(match.group(1))
+        for match in (FILE_PATTERN.match(path.name) for path in directory.glob("resultados_*.json"))
+        if match
+    ]
+    written = write_result_series(
+        directory,
+        load_candidates(limit_per_cargo=args.candidates),
+        ano=args.ano,
+        steps=args.steps,
+        interval=args.interval,
+        start_sequence=max(existing, default=0) + 1,
+        seed=args.seed,
+    )
+    print(f"{len(written)} arquivos gravados em {directory}")
+    return 0
+
+
+def cmd_patch(args: argparse.Namespace) -> int:
+    dataset = DATASETS.get(args.table)
+    table = dataset.model.__table__ if dataset else Base.metadata.tables.get(args.table)
+    if table is None:
+        raise SystemExit(f"Tabela desconhecida: {args.table}")
+    if dataset is None:
+        dataset = next((item for item in DATASETS.values() if item.model.__table__ is table), None)
+
+    try:
+        patches, declared = read_patch_file(Path(args.file), table)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    key = args.key or declared
+    if not key:
+        if patches and all("id" in patch for patch in patches):
+            key = ["id"]
+        elif dataset is not None:
+            key = list(dataset.natural_key)
+        else:
+            raise SystemExit(f"Informe --key: {table.name} não tem chave natural conhecida")
+
+    session: Session = SessionLocal()
+    try:
+        report = apply_corrections(
+            session,
+            table,
+            patches,
+            key,
+            batch_size=args.batch_size or settings.seed_batch_size,
+            dry_run=args.dry_run,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    finally:
+        session.close()
+
+    for change in report.changes[: args.show]:
+        print(f"  id={change.row_id} {change.column}: {change.old!r} -> {change.new!r}")
+    if len(report.changes) > args.show:
+        print(f"  ... mais {len(report.changes) - args.show} células")
+    for item in report.unmatched[: args.show]:
+        print(f"  não encontrado: {dict(zip(key, item))}")
+    print(("[simulação] " if args.dry_run else "") + report.summary())
+    return 0
+
+
+def cmd_repair_encoding(args: argparse.Namespace) -> int:
+    session: Session = SessionLocal()
+    try:
+        report = repair_encoding(
+            session,
+            args.tables,
+            chunk_size=args.chunk_size,
+            batch_size=args.batch_size or settings.seed_batch_size,
+            dry_run=args.dry_run,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    finally:
+        session.close()
+    for table, row_id, column, old, new in report.examples:
+        print(f"  {table} id={row_id} {column}: {old!r} -> {new!r}")
+    print(("[simulação] " if args.dry_run else "") + report.summary())
+    return 0
+
+
+COMMANDS: Dict[str, Callable[[argparse.Namespace], int]] = {
+    "load": cmd_load,
+    "verify": cmd_verify,
+    "rederive": cmd_rederive,
+    "migrate": cmd_migrate,
+    "tse": cmd_tse,
+    "tse-sample": cmd_tse_sample,
+    "watch": cmd_watch,
+    "live-sample": cmd_live_sample,
+    "patch": cmd_patch,
+    "repair-encoding": cmd_repair_encoding,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.ingest", description=__doc__.splitlines()[1])
+    parser.add_argument("-v", "--verbose", action="store_true", help="mostra os logs de cada lote")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add(name: str, help_text: str) -> argparse.ArgumentParser:
+        subparser = subparsers.add_parser(name, help=help_text)
+        subparser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="processos de conversão (0 converte no próprio processo)",
+        )
+        return subparser
+
+    load = add("load", "carrega os arquivos nas tabelas")
+    load.add_argument("datasets", nargs="*", metavar="conjunto", help=", ".join(DATASETS))
+    load.add_argument("--force", action="store_true", help="recarrega mesmo sem mudança no arquivo")
+    load.add_argument("--file", help="arquivo de origem no lugar do padrão (um conjunto apenas)")
+    load.add_argument("--batch-size", type=int, default=None)
+    load.add_argument("--loader", choices=(BATCH_LOADER, NATIVE_LOADER), default=None)
+
+    verify = add("verify", "compara arquivos, tabelas e o registro das cargas")
+    verify.add_argument("datasets", nargs="*", metavar="conjunto")
+
+    rederive = add("rederive", "reconstrói os dados derivados (snapshots e tabelas de não eleitos)")
+    rederive.add_argument("datasets", nargs="*", metavar="conjunto")
+
+    migrate = add("migrate", "aplica as migrações de esquema pendentes")
+    migrate.add_argument("--status", action="store_true", help="lista as migrações sem aplicar")
+
+    tse = add("tse", "carrega candidatos_sp_22_24 direto dos zips do TSE")
+    tse.add_argument("--candidates", nargs="+", required=True, help="zips consulta_cand_<ano>.zip")
+    tse.add_argument("--results", nargs="*", default=[], help="zips votacao_candidato_munzona_<ano>.zip")
+    tse.add_argument("--finance", nargs="*", default=[], help="zips de prestação de contas (receitas)")
+    tse.add_argument("--uf", nargs="*", default=["SP"], help="UFs carregadas (vazio: todas)")
+    tse.add_argument("--year", nargs="*", type=int, default=[], help="anos carregados (vazio: todos)")
+    tse.add_argument("--force", action="store_true")
+    tse.add_argument("--dry-run", action="store_true", help="só lê os zips e mostra os tempos")
+    tse.add_argument("--batch-size", type=int, default=None)
+    tse.add_argument("--loader", choices=(BATCH_LOADER, NATIVE_LOADER), default=None)
+
+    sample = subparsers.add_parser("tse-sample", help="gera zips de exemplo no formato do TSE")
+    sample.add_argument("--out", required=True)
+    sample.add_argument("--ufs", nargs="+", default=["SP", "RJ", "MG"])
+    sample.add_argument("--years", nargs="+", type=int, default=[2022, 2024])
+    sample.add_argument("--candidates", type=int, default=200, help="candidatos por UF e ano")
+    sample.add_argument("--zones", type=int, default=5, help="zonas por candidato")
+    sample.add_argument("--seed", type=int, default=0)
+
+    watch = subparsers.add_parser("watch", help="aplica os arquivos de apuração parcial de um diretório")
+    watch.add_argument("directory")
+    watch.add_argument("--interval", type=float, default=settings.live_results_interval)
+    watch.add_argument("--once", action="store_true", help="aplica o que houver e termina")
+
+    live_sample = subparsers.add_parser("live-sample", help="gera arquivos de apuração parcial de exemplo")
+    live_sample.add_argument("--out", required=True)
+    live_sample.add_argument("--ano", type=int, default=2022)
+    live_sample.add_argument("--steps", type=int, default=10)
+    live_sample.add_argument("--interval", type=float, default=0.0, help="segundos entre rodadas")
+    live_sample.add_argument("--candidates", type=int, default=50, help="candidatos por cargo")
+    live_sample.add_argument("--seed", type=int, default=0)
+
+    patch = subparsers.add_parser("patch", help="aplica um arquivo de correções (só as células alteradas)")
+    patch.add_argument("table", help="conjunto ou nome da tabela")
+    patch.add_argument("file", help="correções em CSV ou JSON")
+    patch.add_argument("--key", nargs="+", default=None, help="colunas de chave (padrão: id ou a chave natural)")
+    patch.add_argument("--dry-run", action="store_true", help="mostra as mudanças sem gravar")
+    patch.add_argument("--batch-size", type=int, default=None)
+    patch.add_argument("--show", type=int, default=20, help="células listadas no resultado")
+
+    repair = subparsers.add_parser("repair-encoding", help="repara texto com codificação dupla (\"SÃƒO PAULO\")")
+    repair.add_argument("tables", nargs="*", metavar="tabela", help="padrão: todas as tabelas dos modelos")
+    repair.add_argument("--dry-run", action="store_true", help="só conta e mostra exemplos")
+    repair.add_argument("--chunk-size", type=int, default=5000, help="linhas lidas por bloco")
+    repair.add_argument("--batch-size", type=int, default=None)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    return COMMANDS[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
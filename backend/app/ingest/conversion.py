@@ -0,0 +1,130 @@
+import csv
+import logging
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Converter = Callable[[str], Any]
+
+
+@lru_cache(maxsize=1024)
+def normalize_header(column: str) -> str:
+    """Converte o cabeçalho do CSV ("HISTÓRICO DE VOTOS") no nome do campo ("historico_de_votos")."""
+    normalized = unicodedata.normalize("NFKD", column)
+    normalized = (
+        normalized.encode("ascii", "ignore")
+        .decode("ascii")
+        .lower()
+        .replace(" ", "_")
+        .replace("/", "_")
+    )
+    while "__" in normalized:
+        normalized = normalized.replace("__", "_")
+    return normalized.strip("_")
+
+
+def text(value: str) -> Optional[str]:
+    return value.strip() or None
+
+
+def integer(value: str) -> Optional[int]:
+    """Inteiro em formato pt-BR: "1.234.567" e "1234,00" viram 1234567 e 1234."""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    cleaned = value.replace(".", "")
+    try:
+        if "," in cleaned:
+            return int(float(cleaned.replace(",", ".")))
+        return int(cleaned)
+    except ValueError:
+        logger.warning("Valor inteiro inválido: %s", value)
+        return None
+
+
+def decimal(value: str) -> Optional[float]:
+    """Decimal em formato pt-BR ("1.234,56") ou com ponto decimal ("1234.56")."""
+    value = value.strip()
+    if not value:
+        return None
+    if "," in value:
+        value = value.replace(".", "").replace(",", ".")
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Valor decimal inválido: %s", value)
+        return None
+
+
+class CompiledPlan:
+    """Plano de conversão já resolvido para a ordem de colunas de um arquivo."""
+
+    def __init__(
+        self, steps: Sequence[Tuple[int, str, Converter]], template: Dict[str, Any], width: int
+    ) -> None:
+        self.steps = tuple(steps)
+        self.template = template
+        self.width = width
+
+    def __call__(self, row: Sequence[str]) -> Dict[str, Any]:
+        if len(row) < self.width:
+            row = list(row) + [""] * (self.width - len(row))
+        record = self.template.copy()
+        for index, field, convert in self.steps:
+            record[field] = convert(row[index] or "")
+        return record
+
+
+class RecordSchema:
+    """
+    Campos esperados de uma tabela e o conversor de cada um.
+
+    ``compile`` resolve o cabeçalho do arquivo uma única vez; o plano
+    resultante converte cada linha sem normalizar nomes nem consultar tipos.
+    Campos ausentes no arquivo ficam como ``None``.
+    """
+
+    def __init__(self, fields: Mapping[str, Converter]) -> None:
+        self.fields = dict(fields)
+
+    def compile(self, header: Sequence[str]) -> CompiledPlan:
+        steps: List[Tuple[int, str, Converter]] = []
+        for index, column in enumerate(header):
+            field = normalize_header(column)
+            if field in self.fields:
+                steps.append((index, field, self.fields[field]))
+        template = dict.fromkeys(self.fields)
+        return CompiledPlan(steps, template, len(header))
+
+
+def iter_csv_records(
+    path: Path, schema: RecordSchema, encoding: str = "utf-8-sig", delimiter: str = ","
+) -> Iterator[Dict[str, Any]]:
+    """Lê o CSV linha a linha aplicando o plano compilado a partir do cabeçalho."""
+    with path.open(encoding=encoding, newline="") as csvfile:
+        reader = csv.reader(csvfile, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        plan = schema.compile(header)
+        for row in reader:
+            if row:
+                yield plan(row)
+
+
+def convert_mappings(
+    rows: Iterable[Mapping[str, str]], schema: RecordSchema
+) -> Iterator[Dict[str, Any]]:
+    """Converte linhas já lidas como dicionários (mesmas chaves em todas)."""
+    plan: Optional[CompiledPlan] = None
+    for row in rows:
+        if plan is None:
+            plan = schema.compile(list(row.keys()))
+        yield plan(list(row.values()))
@@ -0,0 +1,223 @@
+"""
+Correções declarativas de dados.
+
+Um conjunto de correções (CSV ou JSON) lista, para cada linha, a chave (``id``
+ou a chave natural da tabela) e os valores corretos de algumas colunas. As
+linhas atuais são lidas em bloco, comparadas com as correções e apenas as
+células diferentes são gravadas, com executemany em transações por lote.
+Aplicar o mesmo conjunto de novo não escreve nada.
+
+CSV: a primeira linha traz os nomes das colunas (aceita o mesmo cabeçalho dos
+arquivos de seed, como "HISTÓRICO DE VOTOS"). Célula vazia mantém o valor
+atual; ``NULL`` grava nulo.
+
+JSON: uma lista de objetos, ou ``{"key": [...], "rows": [...]}``. Chave
+ausente mantém o valor atual; ``null`` grava nulo.
+"""
+import csv
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Boolean, Float, Integer, Numeric, Table, bindparam, select, tuple_
+from sqlalchemy.orm import Session
+
+from ..core.cache import bump_table_versions
+from ..db.seeders.pipeline import batched
+from .conversion import decimal, integer, normalize_header, text
+
+logger = logging.getLogger(__name__)
+
+NULL_TOKEN = "NULL"
+LOOKUP_CHUNK = 500
+
+Key = Tuple[Any, ...]
+
+
+@dataclass
+class CellChange:
+    row_id: int
+    key: Key
+    column: str
+    old: Any
+    new: Any
+
+
+@dataclass
+class CorrectionReport:
+    patches: int = 0
+    matched: int = 0
+    rows_changed: int = 0
+    unmatched: List[Key] = field(default_factory=list)
+    cells: Counter = field(default_factory=Counter)
+    changes: List[CellChange] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"{self.patches} correções, {self.matched} linhas encontradas, "
+            f"{self.rows_changed} alteradas, {len(self.unmatched)} não encontradas ({self.elapsed:.2f}s)"
+        ]
+        for column, count in sorted(self.cells.items()):
+            lines.append(f"  {column}: {count} células")
+        return "\n".join(lines)
+
+
+def _converter(table: Table, column: str):
+    kind = table.c[column].type
+    if isinstance(kind, Boolean):
+        return lambda value: value.strip().lower() in {"1", "true", "sim", "s", "yes"}
+    if isinstance(kind, Integer):
+        return integer
+    if isinstance(kind, (Float, Numeric)):
+        return decimal
+    return text
+
+
+def _normalize_columns(table: Table, names: Iterable[str]) -> Dict[str, str]:
+    """Nome no arquivo -> coluna da tabela; colunas desconhecidas são erro."""
+    mapping = {}
+    for name in names:
+        column = name if name in table.c else normalize_header(name)
+        if column not in table.c:
+            raise ValueError(f"Coluna desconhecida em {table.name}: {name}")
+        mapping[name] = column
+    return mapping
+
+
+def read_patch_file(path: Path, table: Table) -> Tuple[List[Dict[str, Any]], Optional[List[str]]]:
+    """Lê as correções; devolve as linhas já convertidas e a chave declarada no JSON, se houver."""
+    if path.suffix.lower() == ".json":
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        key = None
+        if isinstance(payload, dict):
+            key = payload.get("key")
+            payload = payload["rows"]
+        rows = []
+        for item in payload:
+            mapping = _normalize_columns(table, item)
+            rows.append({mapping[name]: value for name, value in item.items()})
+        return rows, key
+
+    with path.open(encoding="utf-8-sig", newline="") as source:
+        reader = csv.reader(source)
+        header = next(reader, None) or []
+        mapping = _normalize_columns(table, header)
+        columns = [mapping[name] for name in header]
+        converters = [_converter(table, column) for column in columns]
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            patch = {}
+            for column, convert, value in zip(columns, converters, row):
+                if value == "":
+                    continue
+                patch[column] = None if value == NULL_TOKEN else convert(value)
+            rows.append(patch)
+    return rows, None
+
+
+def _current_rows(
+    session: Session, table: Table, key: Sequence[str], keys: List[Key], columns: Sequence[str]
+) -> Dict[Key, List[Any]]:
+    """Linhas atuais das chaves pedidas, em consultas de até ``LOOKUP_CHUNK`` chaves."""
+    selected = [table.c.id] + [table.c[name] for name in key if name != "id"] + [table.c[name] for name in columns]
+    key_columns = [table.c[name] for name in key]
+    found: Dict[Key, List[Any]] = defaultdict(list)
+    for chunk in batched(keys, LOOKUP_CHUNK):
+        if len(key_columns) == 1:
+            condition = key_columns[0].in_([item[0] for item in chunk])
+        else:
+            condition = tuple_(*key_columns).in_(chunk)
+        for row in session.execute(select(*selected).where(condition)).mappings():
+            found[tuple(row[name] for name in key)].append(row)
+    return found
+
+
+def update_cells(session: Session, table: Table, updates: Iterable[Dict[str, Any]], batch_size: int = 1000) -> int:
+    """
+    Grava ``updates`` (dicionários com ``_id`` e as colunas alteradas) com
+    executemany, um commit por lote. As linhas são agrupadas pelo conjunto de
+    colunas alteradas: cada executemany precisa dos mesmos parâmetros em todas
+    as linhas.
+    """
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+    for values in updates:
+        groups[tuple(sorted(values))].append(values)
+    (primary_key,) = table.primary_key.columns
+    statement = table.update().where(primary_key == bindparam("_id"))
+    written = 0
+    for parameters in groups.values():
+        for batch in batched(parameters, batch_size):
+            session.execute(statement, batch)
+            session.commit()
+            written += len(batch)
+    return written
+
+
+def apply_corrections(
+    session: Session,
+    table: Table,
+    patches: Sequence[Dict[str, Any]],
+    key: Sequence[str],
+    batch_size: int = 1000,
+    dry_run: bool = False,
+) -> CorrectionReport:
+    """
+    Compara ``patches`` com as linhas atuais de ``table`` pela chave ``key`` e
+    grava somente as células alteradas. Com ``dry_run`` nada é gravado e o
+    relatório lista as mudanças que seriam feitas.
+    """
+    started = time.perf_counter()
+    report = CorrectionReport(patches=len(patches))
+    key = list(key)
+    missing = [name for name in key if name not in table.c]
+    if missing:
+        raise ValueError(f"Chave desconhecida em {table.name}: {', '.join(missing)}")
+
+    by_key: Dict[Key, Dict[str, Any]] = {}
+    for patch in patches:
+        try:
+            item_key = tuple(patch[name] for name in key)
+        except KeyError as exc:
+            raise ValueError(f"Correção sem a coluna de chave {exc}: {patch}") from None
+        values = {column: value for column, value in patch.items() if column not in key}
+        by_key.setdefault(item_key, {}).update(values)
+
+    columns = sorted({column for values in by_key.values() for column in values})
+    current = _current_rows(session, table, key, list(by_key), columns)
+
+    updates: List[Dict[str, Any]] = []
+    for item_key, values in by_key.items():
+        rows = current.get(item_key)
+        if not rows:
+            report.unmatched.append(item_key)
+            continue
+        for row in rows:
+            report.matched += 1
+            changed = {column: value for column, value in values.items() if row[column] != value}
+            if not changed:
+                continue
+            report.rows_changed += 1
+            for column, value in changed.items():
+                report.cells[column] += 1
+                report.changes.append(CellChange(row["id"], item_key, column, row[column], value))
+            updates.append({"_id": row["id"], **changed})
+
+    if not dry_run and updates:
+        update_cells(session, table, updates, batch_size)
+        bump_table_versions([table.name])
+    report.elapsed = time.perf_counter() - started
+    logger.info(
+        "%s: %s linhas alteradas em %s (%s).",
+        table.name,
+        report.rows_changed,
+        ", ".join(f"{column}={count}" for column, count in sorted(report.cells.items())) or "nenhuma coluna",
+        "simulação" if dry_run else "gravado",
+    )
+    return report
@@ -0,0 +1,312 @@
+"""
+Apuração ao vivo: acompanha um diretório onde chegam arquivos JSON com os
+totais parciais de votos e aplica as mudanças em ``candidatos_sp`` e
+``candidatos_grid``.
+
+Cada arquivo traz os totais acumulados de um cargo e um número de sequência
+crescente no nome (``resultados_<sequência>_<horário>.json``)::
+
+    {
+      "sequencia": 12,
+      "gerado_em": "2026-10-04T20:15:03",
+      "ano": 2026,
+      "uf": "SÃO PAULO",
+      "cargo": "Deputado Federal",
+      "secoes_totalizadas_pct": 37.5,
+      "candidatos": [{"nome": "FULANO", "partido": "PODE", "votos": 1234}]
+    }
+
+Só as linhas cujo total mudou são escritas; o total do cargo é ajustado pela
+soma das diferenças e as projeções do grid são recalculadas apenas para os
+candidatos alterados (ou para todo o cargo, quando o percentual de seções
+totalizadas avança). A última sequência aplicada fica em ``live_result_state``
+e cada total de cargo guarda a sequência em que mudou pela última vez.
+
+Cada worker da API tem o seu observador, mas só um aplica arquivos por vez:
+a leitura roda sob o bloqueio nomeado ``live-results`` (MySQL) e os demais
+pulam a rodada. Quem obtém o bloqueio relê a sequência aplicada, então um
+arquivo nunca é somado duas vezes.
+"""
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from ..core.cache import bump_table_versions
+from ..db.locks import LockTimeout, named_lock
+from ..db.models import CandidatoGrid, CandidatoSP, LiveResultState, LiveResultTotal
+from ..db.session import SessionLocal, get_engine
+
+logger = logging.getLogger(__name__)
+
+FILE_PATTERN = re.compile(r"^resultados_(\d+)_[^/]*\.json$")
+LIVE_RESULTS_LOCK = "live-results"
+
+
+@dataclass
+class ResultFile:
+    path: Path
+    sequence: int
+    ano: int
+    uf: str
+    cargo: str
+    sections_pct: Optional[float]
+    votes: Dict[str, int]
+    parties: Dict[str, Optional[str]]
+    generated_at: Optional[str] = None
+
+
+@dataclass
+class ApplyResult:
+    sequence: int
+    cargo: str
+    updated: int = 0
+    inserted: int = 0
+    grid_updated: int = 0
+    changed: Set[str] = field(default_factory=set)
+
+
+def read_result_file(path: Path) -> ResultFile:
+    """Lê um arquivo de resultados; ``ValueError`` se estiver malformado."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        votes: Dict[str, int] = {}
+        parties: Dict[str, Optional[str]] = {}
+        for candidate in payload["candidatos"]:
+            name = str(candidate["nome"]).strip()
+            votes[name] = int(candidate["votos"])
+            parties[name] = candidate.get("partido")
+        sections = payload.get("secoes_totalizadas_pct")
+        return ResultFile(
+            path=path,
+            sequence=int(payload["sequencia"]),
+            ano=int(payload["ano"]),
+            uf=str(payload["uf"]),
+            cargo=str(payload["cargo"]),
+            sections_pct=float(sections) if sections is not None else None,
+            votes=votes,
+            parties=parties,
+            generated_at=payload.get("gerado_em"),
+        )
+    except (OSError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"Arquivo de resultados inválido {path.name}: {exc}") from exc
+
+
+def project(votes: int, sections_pct: Optional[float]) -> Tuple[int, int]:
+    """
+    Faixa projetada de votos ao fim da apuração. A extrapolação linear pelo
+    percentual de seções totalizadas dá o centro; a incerteza sobre o que falta
+    apurar encolhe na mesma proporção em que a apuração avança.
+    """
+    if not sections_pct or sections_pct <= 0:
+        return votes, votes
+    fraction = min(sections_pct / 100, 1.0)
+    remaining = votes / fraction - votes
+    uncertainty = 1.0 - fraction
+    return (
+        round(votes + remaining * (1 - uncertainty)),
+        round(votes + remaining * (1 + uncertainty)),
+    )
+
+
+def apply_result(session: Session, result: ResultFile) -> ApplyResult:
+    """Aplica um arquivo de resultados na sessão (sem commit)."""
+    outcome = ApplyResult(sequence=result.sequence, cargo=result.cargo)
+    candidatos = CandidatoSP.__table__
+    current = {
+        row.candidato: (row.id, row.historico_de_votos)
+        for row in session.execute(
+            select(candidatos.c.id, candidatos.c.candidato, candidatos.c.historico_de_votos).where(
+                candidatos.c.ano == result.ano,
+                candidatos.c.uf == result.uf,
+                candidatos.c.cargo == result.cargo,
+            )
+        )
+    }
+
+    updates, inserts = [], []
+    delta = 0
+    for name, votes in result.votes.items():
+        existing = current.get(name)
+        if existing is None:
+            inserts.append(
+                {
+                    "uf": result.uf,
+                    "candidato": name,
+                    "historico_de_votos": votes,
+                    "cargo": result.cargo,
+                    "ano": result.ano,
+                    "partido": result.parties.get(name) or "",
+                }
+            )
+            delta += votes
+        elif existing[1] != votes:
+            updates.append({"_id": existing[0], "historico_de_votos": votes})
+            delta += votes - (existing[1] or 0)
+        else:
+            continue
+        outcome.changed.add(name)
+
+    if updates:
+        session.execute(candidatos.update().where(candidatos.c.id == bindparam("_id")), updates)
+    if inserts:
+        session.execute(candidatos.insert(), inserts)
+    outcome.updated, outcome.inserted = len(updates), len(inserts)
+
+    total = session.execute(
+        select(LiveResultTotal).where(
+            LiveResultTotal.ano == result.ano,
+            LiveResultTotal.uf == result.uf,
+            LiveResultTotal.cargo == result.cargo,
+        )
+    ).scalar_one_or_none()
+    sections_changed = total is None or total.secoes_totalizadas_pct != result.sections_pct
+
+    outcome.grid_updated = _update_grid(session, result, None if sections_changed else outcome.changed)
+
+    if total is None:
+        # Primeiro arquivo do cargo: o total parte da soma completa.
+        total = LiveResultTotal(
+            ano=result.ano,
+            uf=result.uf,
+            cargo=result.cargo,
+            total_votos=sum(result.votes.values()),
+            candidatos=len(current) + len(inserts),
+        )
+        session.add(total)
+    elif outcome.changed:
+        total.total_votos += delta
+        total.candidatos += len(inserts)
+    if outcome.changed or sections_changed:
+        total.lider = max(result.votes, key=result.votes.get) if result.votes else None
+        total.secoes_totalizadas_pct = result.sections_pct
+        total.sequence = result.sequence
+    return outcome
+
+
+def _update_grid(session: Session, result: ResultFile, names: Optional[Set[str]]) -> int:
+    """Atualiza votos e projeções do grid; ``names=None`` recalcula o cargo inteiro."""
+    if names is not None and not names:
+        return 0
+    grid = CandidatoGrid.__table__
+    query = select(
+        grid.c.id, grid.c.nome_urna, grid.c.historico_votos, grid.c.voto_proj_min, grid.c.voto_proj_max
+    ).where(grid.c.cargo_disputado == result.cargo, grid.c.ano == str(result.ano))
+    if names is not None:
+        query = query.where(grid.c.nome_urna.in_(sorted(names)))
+
+    updates = []
+    for row in session.execute(query):
+        votes = result.votes.get(row.nome_urna)
+        if votes is None:
+            continue
+        minimum, maximum = project(votes, result.sections_pct)
+        values = {
+            "historico_votos": str(votes),
+            "voto_proj_min": str(minimum),
+            "voto_proj_max": str(maximum),
+        }
+        if (row.historico_votos, row.voto_proj_min, row.voto_proj_max) != tuple(values.values()):
+            updates.append({"_id": row.id, **values})
+    if updates:
+        session.execute(grid.update().where(grid.c.id == bindparam("_id")), updates)
+    return len(updates)
+
+
+class LiveResultsWatcher:
+    """Aplica, em ordem de sequência, os arquivos novos do diretório ``directory``."""
+
+    def __init__(self, directory: Path, interval: float = 2.0, source: Optional[str] = None) -> None:
+        self.directory = Path(directory)
+        self.interval = interval
+        self.source = source or str(self.directory.resolve())
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def pending(self, after: int) -> List[Tuple[int, Path]]:
+        if not self.directory.exists():
+            return []
+        files = []
+        for path in self.directory.iterdir():
+            match = FILE_PATTERN.match(path.name)
+            if match and int(match.group(1)) > after:
+                files.append((int(match.group(1)), path))
+        return sorted(files)
+
+    def poll_once(self) -> List[ApplyResult]:
+        """Aplica os arquivos pendentes; se outro processo já está aplicando, não faz nada."""
+        try:
+            with named_lock(
+                get_engine(), LIVE_RESULTS_LOCK, 0, "Resultados sendo aplicados por outro processo."
+            ):
+                return self._apply_pending()
+        except LockTimeout:
+            logger.debug("Resultados de %s sendo aplicados por outro processo.", self.directory)
+            return []
+
+    def _apply_pending(self) -> List[ApplyResult]:
+        applied: List[ApplyResult] = []
+        session: Session = SessionLocal()
+        try:
+            state = session.get(LiveResultState, self.source)
+            if state is None:
+                state = LiveResultState(source=self.source, sequence=0)
+                session.add(state)
+            for sequence, path in self.pending(state.sequence):
+                try:
+                    result = read_result_file(path)
+                except ValueError:
+                    # Os totais são acumulados: o próximo arquivo válido cobre este.
+                    logger.exception("Ignorando arquivo de resultados %s", path.name)
+                    state.sequence, state.source_file = sequence, path.name
+                    session.commit()
+                    bump_table_versions([LiveResultState.__tablename__])
+                    continue
+                outcome = apply_result(session, result)
+                state.sequence, state.source_file = sequence, path.name
+                session.commit()
+                bump_table_versions(
+                    [CandidatoSP.__tablename__, LiveResultState.__tablename__, LiveResultTotal.__tablename__]
+                    + ([CandidatoGrid.__tablename__] if outcome.grid_updated else [])
+                )
+                applied.append(outcome)
+                logger.info(
+                    "Apuração %s (%s): %s atualizados, %s novos, %s linhas do grid.",
+                    sequence,
+                    result.cargo,
+                    outcome.updated,
+                    outcome.inserted,
+                    outcome.grid_updated,
+                )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        return applied
+
+    def run(self) -> None:
+        logger.info("Acompanhando resultados em %s a cada %.1fs.", self.directory, self.interval)
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception:  # noqa: BLE001 - a próxima leitura tenta de novo
+                logger.exception("Erro ao aplicar resultados de %s", self.directory)
+            self._stop.wait(self.interval)
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self.run, name="live-results", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
@@ -0,0 +1,93 @@
+"""
+Gera uma série de arquivos de apuração parcial (``resultados_<sequência>_<horário>.json``)
+para testar o acompanhamento ao vivo sem os arquivos do TSE.
+
+    python -m app.ingest live-sample --out /tmp/apuracao --steps 20 --interval 3
+"""
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from ..db.seeders.candidato_sp_seeder import DEFINITION as CANDIDATOS_SP
+from .conversion import iter_csv_records
+
+
+def load_candidates(limit_per_cargo: int = 50, data_path: Optional[Path] = None) -> List[Dict]:
+    """Os candidatos mais votados de cada cargo do arquivo de candidatos_sp."""
+    path = data_path or CANDIDATOS_SP.find_file()
+    if path is None:
+        raise FileNotFoundError("Arquivo de candidatos_sp não encontrado")
+    by_cargo: Dict[str, List[Dict]] = defaultdict(list)
+    for record in iter_csv_records(path, CANDIDATOS_SP.schema):
+        by_cargo[record["cargo"]].append(record)
+    selected = []
+    for records in by_cargo.values():
+        records.sort(key=lambda record: record["historico_de_votos"] or 0, reverse=True)
+        selected.extend(records[:limit_per_cargo])
+    return selected
+
+
+def write_result_series(
+    directory: Path,
+    candidates: Sequence[Dict],
+    ano: int,
+    steps: int = 10,
+    interval: float = 0.0,
+    start_sequence: int = 1,
+    changed_share: float = 0.3,
+    seed: int = 0,
+) -> List[Path]:
+    """
+    Grava ``steps`` rodadas de apuração, uma por cargo em cada rodada, com
+    totais acumulados que só crescem. Em cada rodada apenas ``changed_share``
+    dos candidatos recebe votos novos. Os arquivos são gravados com nome
+    temporário e renomeados, como faria um coletor real.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    generator = random.Random(seed)
+    by_cargo: Dict[str, List[Dict]] = defaultdict(list)
+    for candidate in candidates:
+        by_cargo[candidate["cargo"]].append(candidate)
+
+    final = {
+        candidate["candidato"]: (candidate["historico_de_votos"] or 1000) * generator.uniform(0.7, 1.3)
+        for candidate in candidates
+    }
+    current = dict.fromkeys(final, 0)
+    sequence = start_sequence
+    written: List[Path] = []
+
+    for step in range(1, steps + 1):
+        sections = round(100 * step / steps, 2)
+        for cargo, members in by_cargo.items():
+            for candidate in members:
+                name = candidate["candidato"]
+                if step == steps or generator.random() < changed_share:
+                    current[name] = max(current[name], int(final[name] * sections / 100))
+            payload = {
+                "sequencia": sequence,
+                "gerado_em": datetime.now().isoformat(timespec="seconds"),
+                "ano": ano,
+                "uf": members[0]["uf"],
+                "cargo": cargo,
+                "secoes_totalizadas_pct": sections,
+                "candidatos": [
+                    {"nome": member["candidato"], "partido": member["partido"], "votos": current[member["candidato"]]}
+                    for member in members
+                ],
+            }
+            stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+            target = directory / f"resultados_{sequence:08d}_{stamp}.json"
+            temporary = target.with_suffix(".tmp")
+            temporary.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(temporary, target)
+            written.append(target)
+            sequence += 1
+        if interval and step < steps:
+            time.sleep(interval)
+    return written
@@ -0,0 +1,162 @@
+"""
+Detecção e reparo de texto com codificação dupla ("SÃƒO PAULO", "MARÃ‡AL"):
+UTF-8 lido como latin-1/cp1252 e gravado de novo como UTF-8.
+
+Todas as colunas de texto de todas as tabelas dos modelos são varridas em
+blocos pela chave primária; cada bloco é lido com cursor no servidor
+(``stream_results``), então a memória fica limitada ao tamanho do bloco
+mesmo em tabelas grandes. Só as células reparadas são gravadas, em lotes.
+"""
+import codecs
+import logging
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import String, Table, select
+from sqlalchemy.orm import Session
+
+from ..core.cache import bump_table_versions
+from ..db.base import Base
+from .corrections import update_cells
+
+logger = logging.getLogger(__name__)
+
+# Um caractere inicial de sequência UTF-8 (C2-F4 em latin-1) seguido de um byte
+# de continuação (80-BF) como latin-1 ou como o caractere equivalente no cp1252.
+_CONTINUATION = "\u0080-¿ŒœŠšŸŽžƒˆ˜–—‘-„†-•…‰‹›€™"
+SUSPECT = re.compile(f"[Â-ô][{_CONTINUATION}]")
+MAX_LAYERS = 3
+
+
+def _latin1_fallback(error: UnicodeError):
+    """Bytes 81, 8D, 8F, 90 e 9D não existem no cp1252 e chegam como controles latin-1."""
+    chunk = error.object[error.start:error.end]
+    if all(ord(char) < 256 for char in chunk):
+        return bytes(ord(char) for char in chunk), error.end
+    raise error
+
+
+codecs.register_error("mojibake_latin1", _latin1_fallback)
+
+
+def repair(value: str) -> Optional[str]:
+    """Texto reparado, ou ``None`` quando ``value`` não parece ter codificação dupla."""
+    if not SUSPECT.search(value):
+        return None
+    current = value
+    for _ in range(MAX_LAYERS):
+        try:
+            decoded = current.encode("cp1252", "mojibake_latin1").decode("utf-8")
+        except UnicodeError:
+            break
+        current = decoded
+        if not SUSPECT.search(current):
+            break
+    return current if current != value else None
+
+
+def string_columns(table: Table) -> List[str]:
+    return [column.name for column in table.columns if isinstance(column.type, String) and not column.primary_key]
+
+
+@dataclass
+class RepairReport:
+    tables: Dict[str, int] = field(default_factory=dict)
+    rows_changed: int = 0
+    cells: Counter = field(default_factory=Counter)
+    examples: List[Tuple[str, Any, str, str, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_scanned(self) -> int:
+        return sum(self.tables.values())
+
+    def summary(self) -> str:
+        rate = self.rows_scanned / self.elapsed if self.elapsed else 0.0
+        lines = [
+            f"{self.rows_scanned} linhas lidas em {len(self.tables)} tabelas, "
+            f"{self.rows_changed} reparadas ({self.elapsed:.2f}s, {rate:,.0f} linhas/s)"
+        ]
+        for column, count in sorted(self.cells.items()):
+            lines.append(f"  {column}: {count} células")
+        return "\n".join(lines)
+
+
+def repair_table(
+    session: Session,
+    table: Table,
+    report: RepairReport,
+    chunk_size: int = 5000,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+    examples: int = 20,
+) -> None:
+    columns = string_columns(table)
+    if not columns:
+        return
+    (primary_key,) = table.primary_key.columns
+    query = select(primary_key, *(table.c[name] for name in columns)).order_by(primary_key).limit(chunk_size)
+
+    scanned = 0
+    last = None
+    while True:
+        chunk = query if last is None else query.where(primary_key > last)
+        updates: List[Dict[str, Any]] = []
+        rows = 0
+        result = session.execute(chunk.execution_options(stream_results=True, yield_per=chunk_size))
+        for row in result:
+            rows += 1
+            last = row[0]
+            changed = {}
+            for name, value in zip(columns, row[1:]):
+                if value is None:
+                    continue
+                fixed = repair(value)
+                if fixed is not None:
+                    changed[name] = fixed
+                    report.cells[f"{table.name}.{name}"] += 1
+                    if len(report.examples) < examples:
+                        report.examples.append((table.name, last, name, value, fixed))
+            if changed:
+                updates.append({"_id": last, **changed})
+        result.close()
+        scanned += rows
+        report.rows_changed += len(updates)
+        if updates and not dry_run:
+            update_cells(session, table, updates, batch_size)
+            bump_table_versions([table.name])
+        else:
+            # Encerra a transação de leitura do bloco.
+            session.rollback()
+        if rows < chunk_size:
+            break
+    report.tables[table.name] = scanned
+
+
+def repair_encoding(
+    session: Session,
+    tables: Optional[Sequence[str]] = None,
+    chunk_size: int = 5000,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+) -> RepairReport:
+    """Varre ``tables`` (todas as tabelas dos modelos por padrão) e repara o texto com codificação dupla."""
+    report = RepairReport()
+    started = time.perf_counter()
+    selected = tables or list(Base.metadata.tables)
+    unknown = set(selected).difference(Base.metadata.tables)
+    if unknown:
+        raise ValueError(f"Tabelas desconhecidas: {', '.join(sorted(unknown))}")
+    for name in selected:
+        repair_table(session, Base.metadata.tables[name], report, chunk_size, batch_size, dry_run)
+    report.elapsed = time.perf_counter() - started
+    logger.info(
+        "Reparo de codificação: %s células em %s linhas (%s).",
+        sum(report.cells.values()),
+        report.rows_changed,
+        "simulação" if dry_run else "gravado",
+    )
+    return report
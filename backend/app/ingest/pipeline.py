@@ -0,0 +1,219 @@
+import csv
+import io
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .conversion import CompiledPlan, RecordSchema
+
+logger = logging.getLogger(__name__)
+
+CHUNK_BYTES = 1024 * 1024
+
+# Plano compilado de cada processo de conversão (definido no initializer).
+_worker_plan: Optional[CompiledPlan] = None
+_worker_encoding = "utf-8"
+_worker_delimiter = ","
+
+
+@dataclass
+class StageStats:
+    """
+    Volume processado e tempo gasto em cada estágio da carga.
+
+    ``read`` e ``write`` são medidos no processo principal; ``parse`` e
+    ``convert`` somam o tempo de CPU dos processos de conversão, que correm em
+    paralelo, e ``wait`` é o tempo em que o processo principal ficou parado
+    esperando por eles.
+    """
+
+    rows: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+    stages: Dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(("read", "parse", "convert", "wait", "write"), 0.0)
+    )
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def finish(self, elapsed: float, parallel: bool = True) -> None:
+        """Fecha a medição: o que sobra do tempo total é do consumidor (escrita)."""
+        self.elapsed = elapsed
+        busy = self.stages["read"] + self.stages["wait"]
+        if not parallel:
+            busy += self.stages["parse"] + self.stages["convert"]
+        self.stages["write"] = max(elapsed - busy, 0.0)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def report(self, title: str) -> str:
+        lines = [
+            f"{title}: {self.rows:,} registros, {self.bytes / 1_048_576:,.1f} MB em {self.elapsed:.2f}s "
+            f"({self.rows_per_second:,.0f} registros/s, {self.bytes_per_second / 1_048_576:,.1f} MB/s)"
+        ]
+        for stage, seconds in self.stages.items():
+            share = seconds / self.elapsed * 100 if self.elapsed else 0.0
+            lines.append(f"  {stage:>8}: {seconds:8.2f}s ({share:5.1f}%)")
+        return "\n".join(lines)
+
+
+def split_records(data: bytes) -> int:
+    """
+    Posição logo após a última quebra de linha que encerra um registro, ou 0.
+    Quebras dentro de campos entre aspas não contam: o total de aspas antes de
+    uma quebra válida é sempre par (aspas escapadas aparecem em pares).
+    """
+    end = data.rfind(b"\n")
+    while end != -1:
+        if data.count(b'"', 0, end) % 2 == 0:
+            return end + 1
+        end = data.rfind(b"\n", 0, end)
+    return 0
+
+
+def first_record(data: bytes) -> int:
+    """Posição logo após o primeiro registro completo (o cabeçalho), ou 0."""
+    end = data.find(b"\n")
+    while end != -1:
+        if data.count(b'"', 0, end) % 2 == 0:
+            return end + 1
+        end = data.find(b"\n", end + 1)
+    return 0
+
+
+def iter_chunks(source: BinaryIO, chunk_bytes: int = CHUNK_BYTES, carry: bytes = b"") -> Iterator[bytes]:
+    """Blocos de ``chunk_bytes`` (ou pouco mais) que começam e terminam em registros inteiros."""
+    while True:
+        block = source.read(chunk_bytes)
+        if not block:
+            if carry:
+                yield carry
+            return
+        data = carry + block
+        cut = split_records(data)
+        if cut == 0:
+            carry = data
+            continue
+        carry = data[cut:]
+        yield data[:cut]
+
+
+def _init_worker(schema: RecordSchema, header: Sequence[str], encoding: str, delimiter: str) -> None:
+    global _worker_plan, _worker_encoding, _worker_delimiter
+    _worker_plan = schema.compile(header)
+    _worker_encoding = encoding
+    _worker_delimiter = delimiter
+
+
+def _convert_chunk(data: bytes) -> Tuple[List[Dict[str, Any]], float, float]:
+    started = time.perf_counter()
+    rows = list(csv.reader(io.StringIO(data.decode(_worker_encoding), newline=""), delimiter=_worker_delimiter))
+    parsed = time.perf_counter()
+    plan = _worker_plan
+    records = [plan(row) for row in rows if row]
+    return records, parsed - started, time.perf_counter() - parsed
+
+
+class ParallelCsvReader:
+    """
+    Lê um CSV em estágios encadeados: o processo principal lê blocos de bytes
+    alinhados a registros, processos auxiliares decodificam, separam os campos
+    e convertem cada bloco, e os registros voltam na ordem do arquivo para
+    quem consome o iterador (normalmente a escrita no banco).
+
+    No máximo ``2 * workers`` blocos ficam em trânsito, então a leitura não se
+    adianta demais em relação à escrita. Com ``workers=0`` tudo acontece no
+    próprio processo, útil para arquivos pequenos e para depuração.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        schema: RecordSchema,
+        workers: Optional[int] = None,
+        stats: Optional[StageStats] = None,
+        encoding: str = "utf-8-sig",
+        delimiter: str = ",",
+        chunk_bytes: int = CHUNK_BYTES,
+    ) -> None:
+        self.path = path
+        self.schema = schema
+        self.workers = min(os.cpu_count() or 1, 4) if workers is None else workers
+        self.stats = stats if stats is not None else StageStats()
+        self.encoding = encoding
+        self.delimiter = delimiter
+        self.chunk_bytes = chunk_bytes
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with self.path.open("rb") as source:
+            started = time.perf_counter()
+            head = source.read(self.chunk_bytes)
+            while head and first_record(head) == 0:
+                block = source.read(self.chunk_bytes)
+                if not block:
+                    break
+                head += block
+            self.stats.add("read", time.perf_counter() - started)
+            if not head:
+                return
+
+            cut = first_record(head) or len(head)
+            header = next(csv.reader([head[:cut].decode(self.encoding)], delimiter=self.delimiter), [])
+            self.stats.bytes += cut
+            # Os blocos seguintes não têm BOM; utf-8-sig decodifica normalmente.
+            chunks = self._timed_chunks(source, head[cut:])
+
+            if self.workers <= 0:
+                _init_worker(self.schema, header, self.encoding, self.delimiter)
+                for chunk in chunks:
+                    yield from self._collect(_convert_chunk(chunk))
+                return
+
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.schema, header, self.encoding, self.delimiter),
+            ) as executor:
+                pending: Deque[Future] = deque()
+                for chunk in chunks:
+                    pending.append(executor.submit(_convert_chunk, chunk))
+                    if len(pending) >= self.workers * 2:
+                        yield from self._collect(self._wait(pending.popleft()))
+                while pending:
+                    yield from self._collect(self._wait(pending.popleft()))
+
+    def _timed_chunks(self, source: BinaryIO, carry: bytes) -> Iterator[bytes]:
+        chunks = iter_chunks(source, self.chunk_bytes, carry)
+        while True:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            self.stats.add("read", time.perf_counter() - started)
+            if chunk is None:
+                return
+            self.stats.bytes += len(chunk)
+            yield chunk
+
+    def _wait(self, future: Future) -> Tuple[List[Dict[str, Any]], float, float]:
+        started = time.perf_counter()
+        result = future.result()
+        self.stats.add("wait", time.perf_counter() - started)
+        return result
+
+    def _collect(self, result: Tuple[List[Dict[str, Any]], float, float]) -> List[Dict[str, Any]]:
+        records, parse_seconds, convert_seconds = result
+        self.stats.add("parse", parse_seconds)
+        self.stats.add("convert", convert_seconds)
+        self.stats.rows += len(records)
+        return records
@@ -0,0 +1,384 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ..core.config import settings
+from .conversion import RecordSchema, decimal, integer, iter_csv_records, text
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PWASNAP1"
+SUFFIX = ".snap"
+CHUNK_ROWS = 16384
+VOCABULARY_LIMIT = 65536
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+_HEADER_SIZE = struct.Struct("<I")
+_ALIGNMENT = 8
+
+# Tipo de cada conversor no snapshot: inteiros e decimais viram arrays de 8
+# bytes; textos viram códigos de dicionário ou, se quase todos distintos, um
+# bloco UTF-8 único com offsets.
+COLUMN_KINDS = {text: "str", integer: "int", decimal: "float"}
+
+
+def schema_fingerprint(schema: RecordSchema) -> str:
+    """
+    Identifica os campos e os conversores de ``schema``. Um snapshot gravado
+    com outro esquema (campo novo, conversor trocado ou alterado) não serve
+    para o atual, mesmo que o CSV seja o mesmo.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for field, converter in schema.fields.items():
+        name = f"{getattr(converter, '__module__', '')}.{getattr(converter, '__qualname__', '')}"
+        code = getattr(converter, "__code__", None)
+        digest.update(f"{field}\0{name}\0{COLUMN_KINDS.get(converter, 'str')}\0".encode("utf-8"))
+        digest.update(code.co_code if code is not None else repr(converter).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SnapshotWriter:
+    """
+    Grava registros em colunas tipadas. A cada ``CHUNK_ROWS`` registros os
+    blocos de cada coluna vão para um arquivo temporário; em memória ficam o
+    bloco corrente e os dicionários das colunas de texto, que são descartados
+    ao passar de ``VOCABULARY_LIMIT`` valores (a coluna é gravada como texto).
+    ``save`` junta os blocos no snapshot final.
+    """
+
+    def __init__(self, schema: RecordSchema) -> None:
+        self.fields: List[str] = list(schema.fields)
+        self.fingerprint = schema_fingerprint(schema)
+        self.kinds: Dict[str, str] = {
+            field: COLUMN_KINDS.get(converter, "str") for field, converter in schema.fields.items()
+        }
+        self.rows = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._spool = tempfile.TemporaryFile()
+        self._segments: Dict[Tuple[str, str], List[Tuple[int, int]]] = defaultdict(list)
+        self._has_nulls: Dict[str, bool] = dict.fromkeys(self.fields, False)
+        self._characters: Dict[str, int] = {}
+        self._vocabularies: Dict[str, Optional[Dict[Optional[str], int]]] = {}
+        for field, kind in self.kinds.items():
+            if kind == "str":
+                self._characters[field] = 0
+                self._vocabularies[field] = {None: 0}
+                self._write(field, "offsets", array("q", [0]).tobytes())
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self._pending.append(record)
+        self.rows += 1
+        if len(self._pending) >= CHUNK_ROWS:
+            self._flush()
+
+    def close(self) -> None:
+        self._spool.close()
+
+    def _write(self, field: str, block: str, data: bytes) -> None:
+        if not data:
+            return
+        offset = self._spool.seek(0, os.SEEK_END)
+        self._spool.write(data)
+        self._segments[(field, block)].append((offset, len(data)))
+
+    def _flush(self) -> None:
+        for field in self.fields:
+            values = [record.get(field) for record in self._pending]
+            nulls = bytes(value is None for value in values)
+            self._has_nulls[field] = self._has_nulls[field] or any(nulls)
+            self._write(field, "nulls", nulls)
+            if self.kinds[field] != "str":
+                numbers = array("q" if self.kinds[field] == "int" else "d")
+                numbers.extend(0 if value is None else value for value in values)
+                self._write(field, "values", numbers.tobytes())
+                continue
+
+            offsets = array("q")
+            position = self._characters[field]
+            for value in values:
+                position += len(value) if value is not None else 0
+                offsets.append(position)
+            self._characters[field] = position
+            self._write(field, "offsets", offsets.tobytes())
+            self._write(
+                field, "values", "".join(value for value in values if value is not None).encode("utf-8")
+            )
+
+            vocabulary = self._vocabularies[field]
+            if vocabulary is None:
+                continue
+            codes = array("i")
+            for value in values:
+                code = vocabulary.get(value)
+                if code is None:
+                    code = vocabulary[value] = len(vocabulary)
+                codes.append(code)
+            if len(vocabulary) > VOCABULARY_LIMIT:
+                self._vocabularies[field] = None
+            else:
+                self._write(field, "codes", codes.tobytes())
+        self._pending = []
+
+    def save(self, path: Path) -> None:
+        try:
+            self._flush()
+            self._save(path)
+        finally:
+            self.close()
+
+    def _save(self, path: Path) -> None:
+        blocks: List[Tuple[str, str]] = []
+        columns = []
+        offset = 0
+
+        def add_block(field: str, block: str) -> Dict[str, int]:
+            nonlocal offset
+            length = sum(size for _, size in self._segments[(field, block)])
+            blocks.append((field, block))
+            location = {"offset": offset, "length": length}
+            offset += length + -length % _ALIGNMENT
+            return location
+
+        for field in self.fields:
+            column: Dict[str, Any] = {"name": field}
+            if self.kinds[field] == "str":
+                vocabulary = self._vocabularies[field]
+                if vocabulary is not None and len(vocabulary) <= max(self.rows // 2, 1):
+                    column["kind"] = "dict"
+                    column["vocabulary"] = list(vocabulary)
+                    column["codes"] = add_block(field, "codes")
+                else:
+                    # Coluna quase toda distinta: texto contínuo com offsets em caracteres.
+                    column["kind"] = "str"
+                    column["nulls"] = add_block(field, "nulls")
+                    column["offsets"] = add_block(field, "offsets")
+                    column["values"] = add_block(field, "values")
+            else:
+                column["kind"] = self.kinds[field]
+                column["values"] = add_block(field, "values")
+                if self._has_nulls[field]:
+                    column["nulls"] = add_block(field, "nulls")
+            columns.append(column)
+
+        header = json.dumps(
+            {"rows": self.rows, "schema": self.fingerprint, "columns": columns}
+        ).encode("utf-8")
+        prefix = MAGIC + _HEADER_SIZE.pack(len(header)) + header
+        prefix += b"\0" * (-len(prefix) % _ALIGNMENT)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as output:
+                output.write(prefix)
+                for key in blocks:
+                    length = 0
+                    for start, size in self._segments[key]:
+                        self._spool.seek(start)
+                        output.write(self._spool.read(size))
+                        length += size
+                    output.write(b"\0" * (-length % _ALIGNMENT))
+            os.replace(temporary, path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+            raise
+
+
+class Snapshot:
+    """
+    Snapshot mapeado em memória. ``column`` devolve colunas numéricas como
+    ``memoryview`` tipada, sem cópia, e ``iter_records`` reconstrói os
+    registros em blocos, no mesmo formato produzido pela conversão do CSV.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = path.open("rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._map[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"Arquivo não é um snapshot válido: {path}")
+            (header_size,) = _HEADER_SIZE.unpack_from(self._map, len(MAGIC))
+            header_start = len(MAGIC) + _HEADER_SIZE.size
+            header = json.loads(self._map[header_start : header_start + header_size])
+        except Exception:
+            self.close()
+            raise
+        data_start = header_start + header_size
+        self._data_start = data_start + (-data_start % _ALIGNMENT)
+        self.rows: int = header["rows"]
+        self.fingerprint: Optional[str] = header.get("schema")
+        self.columns: Dict[str, Dict[str, Any]] = {
+            column["name"]: column for column in header["columns"]
+        }
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def column(self, name: str) -> Union[memoryview, List[Optional[str]]]:
+        column = self.columns[name]
+        if column["kind"] == "int":
+            return self._block(column["values"]).cast("q")
+        if column["kind"] == "float":
+            return self._block(column["values"]).cast("d")
+        return self._reader(column)(0, self.rows)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        names = list(self.columns)
+        readers = [self._reader(self.columns[name]) for name in names]
+        for start in range(0, self.rows, CHUNK_ROWS):
+            end = min(start + CHUNK_ROWS, self.rows)
+            for values in zip(*(read(start, end) for read in readers)):
+                yield dict(zip(names, values))
+
+    def close(self) -> None:
+        try:
+            self._map.close()
+        except BufferError:
+            # Ainda há colunas em uso; o mapeamento é liberado junto com elas.
+            pass
+        self._file.close()
+
+    def _block(self, location: Dict[str, int]) -> memoryview:
+        start = self._data_start + location["offset"]
+        return memoryview(self._map)[start : start + location["length"]]
+
+    def _reader(self, column: Dict[str, Any]) -> Callable[[int, int], List[Any]]:
+        kind = column["kind"]
+        nulls = self._block(column["nulls"]) if "nulls" in column else None
+
+        if kind == "dict":
+            codes = self._block(column["codes"]).cast("i")
+            lookup = column["vocabulary"].__getitem__
+            return lambda start, end: list(map(lookup, codes[start:end].tolist()))
+
+        if kind == "str":
+            offsets = self._block(column["offsets"]).cast("q")
+            content = str(self._block(column["values"]), "utf-8")
+
+            def read_strings(start: int, end: int) -> List[Optional[str]]:
+                bounds = offsets[start : end + 1].tolist()
+                flags = nulls[start:end]
+                return [
+                    None if flags[index] else content[bounds[index] : bounds[index + 1]]
+                    for index in range(end - start)
+                ]
+
+            return read_strings
+
+        values = self._block(column["values"]).cast("q" if kind == "int" else "d")
+        if nulls is None:
+            return lambda start, end: values[start:end].tolist()
+        return lambda start, end: [
+            None if flag else value
+            for value, flag in zip(values[start:end].tolist(), nulls[start:end])
+        ]
+
+
+def snapshot_path(directory: Path, dataset: str, checksum: str, schema: RecordSchema) -> Path:
+    return directory / f"{dataset}-{checksum[:16]}-{schema_fingerprint(schema)[:8]}{SUFFIX}"
+
+
+def open_snapshot(
+    directory: Path, dataset: str, checksum: str, schema: RecordSchema
+) -> Optional[Snapshot]:
+    """Snapshot do arquivo com ``checksum`` gravado com o mesmo ``schema``, ou ``None``."""
+    path = snapshot_path(directory, dataset, checksum, schema)
+    if not path.exists():
+        return None
+    try:
+        snapshot = Snapshot(path)
+    except (ValueError, KeyError, OSError, struct.error):
+        logger.warning("Snapshot inválido em %s. Ignorando.", path)
+        return None
+    if snapshot.fingerprint != schema_fingerprint(schema):
+        logger.info("Snapshot %s gravado com outro esquema. Ignorando.", path.name)
+        snapshot.close()
+        return None
+    return snapshot
+
+
+def cached_records(
+    data_path: Path,
+    schema: RecordSchema,
+    dataset: str,
+    checksum: str,
+    directory: Optional[Path] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Registros do arquivo ``data_path``, lidos do snapshot binário quando existe
+    um para o mesmo checksum e o mesmo esquema. Caso contrário o CSV é
+    convertido normalmente e o snapshot é gravado ao final da leitura
+    completa, substituindo os antigos. Durante a leitura as colunas vão para
+    um arquivo temporário, e a memória não cresce com o arquivo.
+    """
+    if not settings.snapshot_enabled:
+        yield from iter_csv_records(data_path, schema)
+        return
+
+    directory = directory or default_snapshot_dir(data_path)
+    snapshot = open_snapshot(directory, dataset, checksum, schema)
+    if snapshot is not None:
+        logger.info("Usando snapshot %s (%s registros).", snapshot.path.name, len(snapshot))
+        with snapshot:
+            yield from snapshot.iter_records()
+        return
+
+    writer = SnapshotWriter(schema)
+    try:
+        for record in iter_csv_records(data_path, schema):
+            writer.append(record)
+            yield record
+    except BaseException:
+        writer.close()
+        raise
+
+    path = snapshot_path(directory, dataset, checksum, schema)
+    try:
+        writer.save(path)
+        remove_stale_snapshots(directory, dataset, keep=path)
+        logger.info("Snapshot %s gravado com %s registros.", path.name, writer.rows)
+    except OSError:
+        logger.warning("Não foi possível gravar o snapshot em %s.", path, exc_info=True)
+
+
+def default_snapshot_dir(data_path: Optional[Path] = None) -> Path:
+    if settings.snapshot_dir:
+        return Path(settings.snapshot_dir)
+    return (data_path.parent if data_path else DATA_DIR) / ".snapshots"
+
+
+def list_snapshots(directory: Path) -> Sequence[Path]:
+    if not directory.exists():
+        return []
+    return sorted(directory.glob(f"*{SUFFIX}"))
+
+
+def snapshot_status(directory: Path) -> Dict[str, Any]:
+    snapshots = list_snapshots(directory)
+    return {
+        "enabled": settings.snapshot_enabled,
+        "directory": str(directory),
+        "files": [path.name for path in snapshots],
+        "bytes": sum(path.stat().st_size for path in snapshots),
+    }
+
+
+def remove_stale_snapshots(directory: Path, dataset: str, keep: Path) -> None:
+    for path in directory.glob(f"{dataset}-*{SUFFIX}"):
+        if path != keep:
+            path.unlink(missing_ok=True)
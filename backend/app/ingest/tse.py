@@ -0,0 +1,365 @@
+"""
+Leitura direta dos arquivos .zip publicados pelo TSE (candidatos, votação por
+município/zona e receitas de campanha).
+
+Os membros de cada zip são lidos em fluxo, sem extração para o disco:
+descompressão, decodificação latin-1 e separação por ``;`` acontecem em
+processos auxiliares, um por membro. Como o TSE publica um membro por UF
+(``consulta_cand_2022_SP.csv``), o ano e a UF do nome já descartam os membros
+que não interessam; dentro de cada membro as linhas ainda são filtradas por
+``SG_UF`` e ``ANO_ELEICAO``.
+
+O resultado segue as colunas de ``candidatos_sp_22_24``: uma linha por
+candidato e turno (``ordem`` é o turno), com os votos somados de todas as
+zonas e os valores recebidos do Fundo Especial e do Fundo Partidário.
+"""
+import csv
+import io
+import logging
+import os
+import re
+import time
+import unicodedata
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .conversion import decimal, integer
+from .pipeline import StageStats
+
+logger = logging.getLogger(__name__)
+
+# Fonte registrada em ``seed_state`` (``sync.source_key``) pelas cargas dos zips.
+SEED_SOURCE = "tse"
+
+CANDIDATES = "candidatos"
+RESULTS = "resultados"
+FINANCE = "receitas"
+
+ENCODING = "latin-1"
+DELIMITER = ";"
+
+# Prefixo dos membros de cada tipo de arquivo dentro dos zips do TSE.
+MEMBER_PREFIXES = {
+    CANDIDATES: "consulta_cand_",
+    RESULTS: "votacao_candidato_munzona_",
+    FINANCE: "receitas_candidatos_",
+}
+NATIONAL_MEMBERS = {"BRASIL", "BR"}
+_MEMBER_PATTERN = re.compile(r"_(\d{4})_([A-Za-z]{2}|BRASIL)\.(?:csv|txt)$", re.IGNORECASE)
+
+# Marcadores de campo vazio usados pelo TSE.
+NULL_MARKERS = frozenset({"", "#NULO#", "#NULO", "#NE#", "#NE", "-1", "-3"})
+
+# Coluna de candidatos_sp_22_24 <- coluna do arquivo de candidatos.
+CANDIDATE_COLUMNS = {
+    "sequencial_candidato": "SQ_CANDIDATO",
+    "titulo_eleitoral": "NR_TITULO_ELEITORAL_CANDIDATO",
+    "nome": "NM_CANDIDATO",
+    "nome_urna": "NM_URNA_CANDIDATO",
+    "raca": "DS_COR_RACA",
+    "genero": "DS_GENERO",
+    "cargo": "DS_CARGO",
+    "partido": "SG_PARTIDO",
+    "resultado": "DS_SIT_TOT_TURNO",
+}
+
+TurnKey = Tuple[int, str, int]
+CandidateKey = Tuple[int, str]
+
+
+@dataclass(frozen=True)
+class MemberTask:
+    kind: str
+    archive: str
+    member: str
+    size: int
+    ufs: FrozenSet[str]
+    years: FrozenSet[int]
+
+
+@dataclass
+class ScanResult:
+    kind: str
+    member: str
+    rows: int
+    bytes: int
+    seconds: float
+    data: Dict[Any, Any]
+
+
+def plan_members(
+    kind: str, archive: Path, ufs: Iterable[str] = (), years: Iterable[int] = ()
+) -> List[MemberTask]:
+    """
+    Membros do zip que precisam ser lidos. Membros de outras UFs ou anos são
+    descartados pelo nome; o agregado nacional (``_BRASIL``) só é usado quando
+    o zip não traz os arquivos por UF, para não contar cada linha duas vezes.
+    """
+    wanted_ufs = frozenset(uf.upper() for uf in ufs)
+    wanted_years = frozenset(years)
+    prefix = MEMBER_PREFIXES[kind]
+    members = []
+    with zipfile.ZipFile(archive) as source:
+        for info in source.infolist():
+            name = Path(info.filename).name
+            match = _MEMBER_PATTERN.search(name)
+            if info.is_dir() or match is None or not name.lower().startswith(prefix):
+                continue
+            members.append((info, int(match.group(1)), match.group(2).upper()))
+
+    has_uf_members = any(uf not in NATIONAL_MEMBERS for _, _, uf in members)
+    tasks = []
+    for info, year, uf in members:
+        if wanted_years and year not in wanted_years:
+            continue
+        if uf in NATIONAL_MEMBERS:
+            if has_uf_members:
+                continue
+        elif wanted_ufs and uf not in wanted_ufs:
+            continue
+        tasks.append(
+            MemberTask(kind, str(archive), info.filename, info.file_size, wanted_ufs, wanted_years)
+        )
+    return tasks
+
+
+def iter_member_rows(archive: str, member: str) -> Iterator[Tuple[Dict[str, int], List[str]]]:
+    """Linhas de um membro do zip, lidas em fluxo, com o índice de cada coluna."""
+    with zipfile.ZipFile(archive) as source, source.open(member) as raw:
+        stream = io.TextIOWrapper(raw, encoding=ENCODING, newline="")
+        reader = csv.reader(stream, delimiter=DELIMITER)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = {name.strip().upper(): index for index, name in enumerate(header)}
+        for row in reader:
+            if row:
+                yield columns, row
+
+
+def _value(row: List[str], index: Optional[int]) -> Optional[str]:
+    if index is None or index >= len(row):
+        return None
+    value = row[index].strip()
+    return None if value in NULL_MARKERS else value
+
+
+def _accepts(row: List[str], columns: Dict[str, int], task: MemberTask) -> Optional[int]:
+    """Ano da linha se ela passa pelos filtros de UF e ano, senão ``None``."""
+    if task.ufs and _value(row, columns.get("SG_UF")) not in task.ufs:
+        return None
+    year = integer(row[columns["ANO_ELEICAO"]])
+    if year is None or (task.years and year not in task.years):
+        return None
+    return year
+
+
+def _scan_candidates(task: MemberTask) -> Tuple[int, Dict[TurnKey, Dict[str, Any]]]:
+    found: Dict[TurnKey, Dict[str, Any]] = {}
+    rows = 0
+    indexes = None
+    for columns, row in iter_member_rows(task.archive, task.member):
+        rows += 1
+        year = _accepts(row, columns, task)
+        if year is None:
+            continue
+        if indexes is None:
+            indexes = {field: columns.get(column) for field, column in CANDIDATE_COLUMNS.items()}
+        record = {field: _value(row, index) for field, index in indexes.items()}
+        turn = integer(row[columns["NR_TURNO"]]) or 1
+        record["ano"] = year
+        record["ordem"] = turn
+        found[(year, record["sequencial_candidato"], turn)] = record
+    return rows, found
+
+
+def _scan_results(task: MemberTask) -> Tuple[int, Dict[TurnKey, List[Any]]]:
+    found: Dict[TurnKey, List[Any]] = {}
+    rows = 0
+    for columns, row in iter_member_rows(task.archive, task.member):
+        rows += 1
+        year = _accepts(row, columns, task)
+        if year is None:
+            continue
+        votes_index = columns.get("QT_VOTOS_NOMINAIS", columns.get("QT_VOTOS"))
+        key = (year, row[columns["SQ_CANDIDATO"]].strip(), integer(row[columns["NR_TURNO"]]) or 1)
+        entry = found.get(key)
+        if entry is None:
+            entry = found[key] = [0, _value(row, columns.get("DS_SIT_TOT_TURNO"))]
+        entry[0] += integer(row[votes_index]) or 0
+    return rows, found
+
+
+@lru_cache(maxsize=256)
+def _fund_kind(value: str) -> Optional[str]:
+    normalized = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode().upper()
+    if "FUNDO ESPECIAL" in normalized:
+        return "fundo_especial"
+    if "FUNDO PARTIDARIO" in normalized:
+        return "fundo_partidario"
+    return None
+
+
+def _fund(row: List[str], columns: Dict[str, int]) -> Optional[str]:
+    for column in ("DS_FONTE_RECEITA", "DS_ORIGEM_RECEITA"):
+        value = _value(row, columns.get(column))
+        kind = _fund_kind(value) if value else None
+        if kind:
+            return kind
+    return None
+
+
+def _scan_finance(task: MemberTask) -> Tuple[int, Dict[CandidateKey, Dict[str, Any]]]:
+    found: Dict[CandidateKey, Dict[str, Any]] = {}
+    rows = 0
+    for columns, row in iter_member_rows(task.archive, task.member):
+        rows += 1
+        year = _accepts(row, columns, task)
+        if year is None:
+            continue
+        fund = _fund(row, columns)
+        if fund is None:
+            continue
+        key = (year, row[columns["SQ_CANDIDATO"]].strip())
+        entry = found.get(key)
+        if entry is None:
+            entry = found[key] = {
+                "fundo_especial": 0.0,
+                "fundo_partidario": 0.0,
+                "sequencial_fundo": _value(row, columns.get("SQ_PRESTADOR_CONTAS")),
+            }
+        entry[fund] += decimal(row[columns["VR_RECEITA"]]) or 0.0
+    return rows, found
+
+
+_SCANNERS = {CANDIDATES: _scan_candidates, RESULTS: _scan_results, FINANCE: _scan_finance}
+
+
+def scan_member(task: MemberTask) -> ScanResult:
+    started = time.perf_counter()
+    rows, data = _SCANNERS[task.kind](task)
+    return ScanResult(task.kind, task.member, rows, task.size, time.perf_counter() - started, data)
+
+
+def aggregate_result(resultado: Optional[str]) -> Optional[str]:
+    """Resumo da situação no turno: "ELEITO", "NÃO ELEITO", "2º TURNO" ou vazio."""
+    if not resultado:
+        return None
+    normalized = unicodedata.normalize("NFKD", resultado).encode("ascii", "ignore").decode().upper()
+    if "2O TURNO" in normalized or "2 TURNO" in normalized:
+        return "2º TURNO"
+    if normalized.startswith("ELEITO"):
+        return "ELEITO"
+    return "NÃO ELEITO"
+
+
+def merge(
+    candidates: Dict[TurnKey, Dict[str, Any]],
+    results: Dict[TurnKey, List[Any]],
+    finance: Dict[CandidateKey, Dict[str, Any]],
+    stats: Optional[StageStats] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Registros de candidatos_sp_22_24 em ordem de ano, candidato e turno, um a
+    um: cada candidato sai de ``candidates`` e ``results`` ao ser entregue, e
+    nenhuma lista com todos os registros é montada. ``stats`` recebe o tempo
+    gasto na junção (``convert``).
+    """
+    started = time.perf_counter()
+    keys = sorted(
+        candidates,
+        key=lambda key: (
+            candidates[key]["ano"],
+            candidates[key]["sequencial_candidato"] or "",
+            candidates[key]["ordem"],
+        ),
+    )
+    elapsed = time.perf_counter() - started
+    for key in keys:
+        started = time.perf_counter()
+        record = candidates.pop(key)
+        votes = results.pop(key, None)
+        record["sequencial_restultado"] = key[1] if votes else None
+        record["votos"] = votes[0] if votes else None
+        if votes and votes[1]:
+            record["resultado"] = votes[1]
+        record["resultado_agregado"] = aggregate_result(record["resultado"])
+        funds = finance.get(key[:2])
+        record["sequencial_fundo"] = funds["sequencial_fundo"] if funds else None
+        record["fundo_especial"] = funds["fundo_especial"] if funds else None
+        record["fundo_partidario"] = funds["fundo_partidario"] if funds else None
+        record["fundo_total"] = (
+            funds["fundo_especial"] + funds["fundo_partidario"] if funds else None
+        )
+        elapsed += time.perf_counter() - started
+        yield record
+    if stats is not None:
+        stats.add("convert", elapsed)
+
+
+def read_archives(
+    candidates: Sequence[Path],
+    results: Sequence[Path] = (),
+    finance: Sequence[Path] = (),
+    ufs: Iterable[str] = ("SP",),
+    years: Iterable[int] = (),
+    workers: Optional[int] = None,
+    stats: Optional[StageStats] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lê os zips do TSE e devolve os registros no formato de candidatos_sp_22_24,
+    montados à medida que são consumidos (``merge``).
+    Cada membro é lido por um processo; ``workers=0`` lê tudo no próprio
+    processo. ``stats`` recebe o volume descomprimido lido e os tempos de
+    leitura (soma dos processos), espera e junção.
+    """
+    ufs, years = tuple(ufs), tuple(years)
+    stats = stats if stats is not None else StageStats()
+    tasks = [
+        task
+        for kind, archives in ((CANDIDATES, candidates), (RESULTS, results), (FINANCE, finance))
+        for archive in archives
+        for task in plan_members(kind, Path(archive), ufs, years)
+    ]
+    # Maiores primeiro: os processos terminam mais perto um do outro.
+    tasks.sort(key=lambda task: task.size, reverse=True)
+    logger.info("TSE: %s membros a ler (%s bytes descomprimidos).", len(tasks), sum(t.size for t in tasks))
+
+    collected: Dict[str, Dict[Any, Any]] = {CANDIDATES: {}, RESULTS: {}, FINANCE: {}}
+
+    def collect(result: ScanResult) -> None:
+        stats.rows += result.rows
+        stats.bytes += result.bytes
+        stats.add("parse", result.seconds)
+        target = collected[result.kind]
+        if result.kind == RESULTS:
+            for key, (votes, situation) in result.data.items():
+                entry = target.setdefault(key, [0, situation])
+                entry[0] += votes
+        elif result.kind == FINANCE:
+            for key, funds in result.data.items():
+                entry = target.setdefault(key, dict(funds, fundo_especial=0.0, fundo_partidario=0.0))
+                entry["fundo_especial"] += funds["fundo_especial"]
+                entry["fundo_partidario"] += funds["fundo_partidario"]
+        else:
+            target.update(result.data)
+        logger.info("TSE: %s lido (%s linhas em %.2fs).", result.member, result.rows, result.seconds)
+
+    workers = min(os.cpu_count() or 1, 4) if workers is None else workers
+    if workers <= 0 or len(tasks) <= 1:
+        for task in tasks:
+            collect(scan_member(task))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            futures = [executor.submit(scan_member, task) for task in tasks]
+            for future in futures:
+                started = time.perf_counter()
+                result = future.result()
+                stats.add("wait", time.perf_counter() - started)
+                collect(result)
+
+    return merge(collected[CANDIDATES], collected[RESULTS], collected[FINANCE], stats)
@@ -0,0 +1,142 @@
+"""
+Gera zips de exemplo no mesmo formato dos arquivos do TSE (latin-1, ``;``,
+campos entre aspas, um membro por UF mais o agregado ``_BRASIL``), para testar
+a ingestão sem baixar os arquivos oficiais.
+
+    python -m app.ingest tse-sample --out /tmp/tse --ufs SP RJ --candidates 500
+"""
+import csv
+import io
+import random
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence
+
+from .tse import CANDIDATES, ENCODING, FINANCE, RESULTS
+
+CANDIDATE_HEADER = [
+    "DT_GERACAO", "HH_GERACAO", "ANO_ELEICAO", "CD_TIPO_ELEICAO", "NM_TIPO_ELEICAO", "NR_TURNO",
+    "CD_ELEICAO", "DS_ELEICAO", "SG_UF", "SG_UE", "NM_UE", "CD_CARGO", "DS_CARGO", "SQ_CANDIDATO",
+    "NR_CANDIDATO", "NM_CANDIDATO", "NM_URNA_CANDIDATO", "NM_SOCIAL_CANDIDATO", "NR_PARTIDO",
+    "SG_PARTIDO", "NM_PARTIDO", "NR_TITULO_ELEITORAL_CANDIDATO", "CD_GENERO", "DS_GENERO",
+    "CD_COR_RACA", "DS_COR_RACA", "CD_SIT_TOT_TURNO", "DS_SIT_TOT_TURNO",
+]
+RESULT_HEADER = [
+    "DT_GERACAO", "HH_GERACAO", "ANO_ELEICAO", "NR_TURNO", "SG_UF", "SG_UE", "CD_MUNICIPIO",
+    "NM_MUNICIPIO", "NR_ZONA", "CD_CARGO", "DS_CARGO", "SQ_CANDIDATO", "NR_CANDIDATO",
+    "NM_CANDIDATO", "SG_PARTIDO", "QT_VOTOS_NOMINAIS", "DS_SIT_TOT_TURNO",
+]
+FINANCE_HEADER = [
+    "DT_GERACAO", "HH_GERACAO", "ANO_ELEICAO", "NR_TURNO", "SG_UF", "SQ_PRESTADOR_CONTAS",
+    "SQ_CANDIDATO", "NR_CANDIDATO", "NM_CANDIDATO", "DS_FONTE_RECEITA", "DS_ORIGEM_RECEITA",
+    "DT_RECEITA", "VR_RECEITA",
+]
+
+FIRST_NAMES = ["JOSÉ", "MARIA", "JOÃO", "CONCEIÇÃO", "ANTÔNIO", "LUÍS", "ÂNGELA", "SEBASTIÃO", "INÊS"]
+LAST_NAMES = ["SILVA", "CONCEIÇÃO", "ARAÚJO", "GONÇALVES", "LOURENÇO", "SIMÕES", "BRAGANÇA"]
+PARTIES = ["PODE", "PT", "PL", "PSDB", "MDB", "UNIÃO", "PSD", "REPUBLICANOS", "PSOL", "PC do B"]
+GENDERS = ["MASCULINO", "FEMININO"]
+RACES = ["BRANCA", "PARDA", "PRETA", "AMARELA", "INDÍGENA", "#NULO#"]
+OFFICES = {
+    2022: ["DEPUTADO FEDERAL", "DEPUTADO ESTADUAL", "GOVERNADOR"],
+    2024: ["VEREADOR", "PREFEITO"],
+}
+SITUATIONS = ["ELEITO POR QP", "ELEITO POR MÉDIA", "SUPLENTE", "NÃO ELEITO"]
+FUNDS = ["Fundo Especial", "Fundo Partidário", "Outros Recursos"]
+
+
+def _csv_bytes(header: Sequence[str], rows: Iterable[Sequence]) -> bytes:
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer, delimiter=";", quoting=csv.QUOTE_ALL, lineterminator="\r\n")
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue().encode(ENCODING)
+
+
+def _write_zip(path: Path, members: Dict[str, bytes]) -> Path:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("leiame.pdf", b"%PDF-1.4 exemplo")
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return path
+
+
+def write_sample_archives(
+    directory: Path,
+    ufs: Sequence[str] = ("SP", "RJ", "MG"),
+    years: Sequence[int] = (2022, 2024),
+    candidates_per_uf: int = 200,
+    zones: int = 5,
+    seed: int = 0,
+) -> Dict[str, List[Path]]:
+    """
+    Grava, para cada ano, os zips de candidatos, votação por zona e receitas.
+    Candidatos a governador e prefeito com sequencial par também disputam o
+    segundo turno. Devolve os caminhos agrupados por tipo de arquivo.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    generator = random.Random(seed)
+    archives: Dict[str, List[Path]] = {CANDIDATES: [], RESULTS: [], FINANCE: []}
+
+    for year in years:
+        candidates: Dict[str, List[List]] = {}
+        results: Dict[str, List[List]] = {}
+        finance: Dict[str, List[List]] = {}
+        for uf_index, uf in enumerate(ufs):
+            candidate_rows, result_rows, finance_rows = [], [], []
+            for number in range(candidates_per_uf):
+                sequential = f"{250000000000 + year * 1000000 + uf_index * 100000 + number}"
+                office = generator.choice(OFFICES[year])
+                name = f"{generator.choice(FIRST_NAMES)} {generator.choice(LAST_NAMES)} {number}"
+                party = generator.choice(PARTIES)
+                turns = [1, 2] if office in {"GOVERNADOR", "PREFEITO"} and number % 2 == 0 else [1]
+                for turn in turns:
+                    situation = "2º TURNO" if len(turns) == 2 and turn == 1 else generator.choice(SITUATIONS)
+                    candidate_rows.append([
+                        "01/10/2024", "10:00:00", year, 2, "ELEIÇÃO ORDINÁRIA", turn, 500 + turn,
+                        f"Eleições Gerais {year}", uf, uf, uf, 6, office, sequential, 10000 + number,
+                        name, name.split()[0], "#NULO#", 10, party, party,
+                        f"{generator.randrange(10**11, 10**12):012d}", 2, generator.choice(GENDERS),
+                        1, generator.choice(RACES), 5, situation,
+                    ])
+                    for zone in range(1, zones + 1):
+                        result_rows.append([
+                            "01/10/2024", "10:00:00", year, turn, uf, uf, 7000 + zone,
+                            f"MUNICÍPIO {zone}", zone, 6, office, sequential, 10000 + number, name,
+                            party, generator.randrange(0, 5000), situation,
+                        ])
+                for _ in range(generator.randrange(0, 4)):
+                    value = generator.randrange(1000, 500000) + generator.randrange(100) / 100
+                    finance_rows.append([
+                        "01/10/2024", "10:00:00", year, 1, uf, 900000 + number, sequential,
+                        10000 + number, name, generator.choice(FUNDS), "Recursos de partido político",
+                        "15/09/2022", f"{value:.2f}".replace(".", ","),
+                    ])
+            candidates[uf], results[uf], finance[uf] = candidate_rows, result_rows, finance_rows
+
+        everything = [row for rows in candidates.values() for row in rows]
+        archives[CANDIDATES].append(
+            _write_zip(
+                directory / f"consulta_cand_{year}.zip",
+                {
+                    **{f"consulta_cand_{year}_{uf}.csv": _csv_bytes(CANDIDATE_HEADER, rows) for uf, rows in candidates.items()},
+                    f"consulta_cand_{year}_BRASIL.csv": _csv_bytes(CANDIDATE_HEADER, everything),
+                },
+            )
+        )
+        archives[RESULTS].append(
+            _write_zip(
+                directory / f"votacao_candidato_munzona_{year}.zip",
+                {f"votacao_candidato_munzona_{year}_{uf}.csv": _csv_bytes(RESULT_HEADER, rows) for uf, rows in results.items()},
+            )
+        )
+        archives[FINANCE].append(
+            _write_zip(
+                directory / f"prestacao_de_contas_eleitorais_candidatos_{year}.zip",
+                {
+                    **{f"receitas_candidatos_{year}_{uf}.csv": _csv_bytes(FINANCE_HEADER, rows) for uf, rows in finance.items()},
+                    f"despesas_contratadas_candidatos_{year}_BRASIL.csv": _csv_bytes(["ANO_ELEICAO"], []),
+                },
+            )
+        )
+    return archives
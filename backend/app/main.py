@@ -1,15 +1,14 @@
 import logging
-import time
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.exc import OperationalError
 
 from .api.v1.api import api_router
-from .api.v1.endpoints import candidato_grid
-from .db.base import Base
-from .db.seeders.candidato_sp_seeder import seed_candidatos_sp
-from .db.session import engine
+from .api.v1.endpoints import candidato_grid, health
+from .core.compression import CompressionMiddleware
+from .core.config import settings
+from .core.pagination import NEXT_CURSOR_HEADER
+from .core.startup import start_background_startup
 
 logger = logging.getLogger(__name__)
 
@@ -28,34 +27,21 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
+)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compress_min_size,
+    level=settings.compress_level,
 )
-
-
-def create_tables_with_retry(max_attempts: int = 10, delay: int = 3) -> None:
-    attempt = 1
-    while attempt <= max_attempts:
-        try:
-            Base.metadata.create_all(bind=engine)
-            return
-        except OperationalError:
-            if attempt == max_attempts:
-                logger.exception("Falha ao conectar ao banco de dados após %s tentativas.", attempt)
-                raise
-            logger.warning(
-                "Banco de dados indisponível. Tentando novamente em %s segundos (%s/%s).",
-                delay,
-                attempt,
-                max_attempts,
-            )
-            time.sleep(delay)
-            attempt += 1
 
 
 @app.on_event("startup")
 def on_startup() -> None:
-    create_tables_with_retry()
-    seed_candidatos_sp(force=True)
+    # Banco e seeds ficam em segundo plano; /health/ready indica quando terminarem.
+    start_background_startup()
 
 
 app.include_router(api_router, prefix="/api/v1")
 app.include_router(candidato_grid.router, prefix="/api")
+app.include_router(health.router)
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ApuracaoTotalRead(BaseModel):
+    ano: int
+    uf: str
+    cargo: str
+    total_votos: int
+    candidatos: int
+    lider: Optional[str] = None
+    secoes_totalizadas_pct: Optional[float] = None
+    sequence: int
+    updated_at: Optional[datetime] = None
+
+    model_config = {
+        "from_attributes": True,
+    }
+
+
+class ApuracaoStatusRead(BaseModel):
+    sequence: int
+    source_file: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    totais: List[ApuracaoTotalRead] = []
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from ..db.models import LiveResultState, LiveResultTotal
+from ..db.repositories.apuracao_repository import ApuracaoRepository
+from ..schemas.apuracao import ApuracaoStatusRead, ApuracaoTotalRead
+
+
+class ApuracaoService:
+    TABLES = (LiveResultState.__tablename__, LiveResultTotal.__tablename__)
+
+    def __init__(self, db: Session) -> None:
+        self.repository = ApuracaoRepository(db)
+
+    def get_status(self, desde: Optional[int] = None) -> ApuracaoStatusRead:
+        state = self.repository.get_latest_state()
+        if state is None:
+            return ApuracaoStatusRead(sequence=0)
+        totais = self.repository.list_totals(desde=desde)
+        return ApuracaoStatusRead(
+            sequence=state.sequence,
+            source_file=state.source_file,
+            updated_at=state.updated_at,
+            totais=[ApuracaoTotalRead.model_validate(total) for total in totais],
+        )
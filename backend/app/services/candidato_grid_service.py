@@ -1,7 +1,11 @@
-from typing import List
+from typing import Optional, Sequence
 
 from sqlalchemy.orm import Session
 
+from ..core.cache import get_cache
+from ..core.pagination import Page
+from ..core.serialization import JSON, list_kind
+from ..db.models import CandidatoGrid
 from ..db.repositories.candidato_grid_repository import CandidatoGridRepository
 from ..schemas.candidato_grid import (
     CandidatoGridCreate,
@@ -11,6 +15,9 @@ from ..schemas.candidato_grid import (
 
 
 class CandidatoGridService:
+    TABLES = (CandidatoGrid.__tablename__,)
+    DICTIONARY_FIELDS = ("cargo_disputado", "partido", "genero", "raca", "status")
+
     def __init__(self, db: Session) -> None:
         self.repository = CandidatoGridRepository(db)
 
@@ -18,9 +25,32 @@ class CandidatoGridService:
         candidato = self.repository.create(candidato_data.model_dump())
         return CandidatoGridRead.model_validate(candidato)
 
-    def list_candidatos(self) -> List[CandidatoGridRead]:
-        candidatos = self.repository.list_all()
-        return [CandidatoGridRead.model_validate(candidato) for candidato in candidatos]
+    def list_candidatos(
+        self,
+        formato: str = JSON,
+        campos: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Sem ``limit``, o grid inteiro, como antes da paginação."""
+        keyset = self.repository.KEYSET
+        filtros = dict(columns=campos, limit=limit, after=keyset.decode(cursor) if cursor else None)
+
+        def load_page():
+            rows = self.repository.list_all(
+                **dict(filtros, limit=None if limit is None else limit + 1)
+            )
+            return keyset.page(rows, limit)
+
+        return get_cache().fetch_page(
+            "candidatos_grid.list",
+            self.TABLES,
+            filtros,
+            load_page,
+            list_kind(CandidatoGridRead, campos),
+            formato,
+            self.DICTIONARY_FIELDS,
+        )
 
     def update_candidato(
         self, candidato_id: int, candidato_data: CandidatoGridUpdate
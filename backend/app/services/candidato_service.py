@@ -1,20 +1,41 @@
-from typing import List, Optional
+from typing import Optional, Sequence
 
 from sqlalchemy.orm import Session
 
+from ..core.pagination import Page
+from ..core.serialization import JSON, encode_rows, list_kind
+from ..db.models import CandidatoSP
 from ..db.repositories.candidato_sp_repository import CandidatoSPRepository
 from ..schemas.candidato import CandidatoSPRead, CandidatoSPUpdate
 
 
 class CandidatoService:
+    TABLES = (CandidatoSP.__tablename__,)
+    DICTIONARY_FIELDS = ("uf", "cargo", "partido", "genero", "raca_cor", "situacao")
+
     def __init__(self, db: Session) -> None:
         self.repository = CandidatoSPRepository(db)
 
     def list_candidatos_sp(
-        self, nome_candidato: Optional[str] = None, limit: int = 10
-    ) -> List[CandidatoSPRead]:
-        candidatos = self.repository.list_all(nome_candidato=nome_candidato, limit=limit)
-        return [CandidatoSPRead.model_validate(candidato) for candidato in candidatos]
+        self,
+        nome_candidato: Optional[str] = None,
+        limit: int = 10,
+        formato: str = JSON,
+        campos: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        keyset = self.repository.KEYSET
+        candidatos = self.repository.list_all(
+            nome_candidato=nome_candidato,
+            limit=limit + 1,
+            columns=campos,
+            after=keyset.decode(cursor) if cursor else None,
+        )
+        candidatos, next_cursor = keyset.page(candidatos, limit)
+        body = encode_rows(
+            list_kind(CandidatoSPRead, campos), candidatos, formato, self.DICTIONARY_FIELDS
+        )
+        return Page(body, next_cursor)
 
     def get_candidato_sp(self, candidato_id: int) -> CandidatoSPRead:
         candidato = self.repository.get_by_id(candidato_id)
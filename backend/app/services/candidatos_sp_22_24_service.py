@@ -1,12 +1,20 @@
-from typing import List, Optional
+from typing import Optional, Sequence
 
 from sqlalchemy.orm import Session
 
+from ..core.cache import get_cache
+from ..core.pagination import Page
+from ..core.serialization import JSON, list_kind
+from ..db.models import CandidatosSP2224
 from ..db.repositories.candidatos_sp_22_24_repository import CandidatosSP2224Repository
 from ..schemas.candidatos_sp_22_24 import CandidatosSP2224Read
 
 
 class CandidatosSP2224Service:
+    TABLES = (CandidatosSP2224.__tablename__,)
+    # Campos de poucos valores distintos, codificados por dicionário nos formatos colunares.
+    DICTIONARY_FIELDS = ("partido", "genero", "raca", "resultado_agregado", "cargo", "resultado")
+
     def __init__(self, db: Session) -> None:
         self.repository = CandidatosSP2224Repository(db)
 
@@ -18,16 +26,35 @@ class CandidatosSP2224Service:
         ano: Optional[int] = None,
         resultado_agregado: Optional[str] = None,
         limit: int = 100,
-    ) -> List[CandidatosSP2224Read]:
-        registros = self.repository.list_all(
+        formato: str = JSON,
+        campos: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        keyset = self.repository.KEYSET
+        filtros = dict(
             nome=nome,
             partido=partido,
             genero=genero,
             ano=ano,
             resultado_agregado=resultado_agregado,
             limit=limit,
+            columns=campos,
+            after=keyset.decode(cursor) if cursor else None,
+        )
+
+        def load_page():
+            # Uma linha a mais indica se existe a página seguinte.
+            return keyset.page(self.repository.list_all(**dict(filtros, limit=limit + 1)), limit)
+
+        return get_cache().fetch_page(
+            "candidatos_sp_22_24.list",
+            self.TABLES,
+            filtros,
+            load_page,
+            list_kind(CandidatosSP2224Read, campos),
+            formato,
+            self.DICTIONARY_FIELDS,
         )
-        return [CandidatosSP2224Read.model_validate(registro) for registro in registros]
 
     def get_candidato(self, registro_id: int) -> CandidatosSP2224Read:
         registro = self.repository.get_by_id(registro_id)
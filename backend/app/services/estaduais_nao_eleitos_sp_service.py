@@ -1,7 +1,11 @@
-from typing import List, Optional
+from typing import Optional, Sequence
 
 from sqlalchemy.orm import Session
 
+from ..core.cache import get_cache
+from ..core.pagination import Page
+from ..core.serialization import JSON, list_kind
+from ..db.models import EstaduaisNaoEleitosSP
 from ..db.repositories.estaduais_nao_eleitos_sp_repository import (
     EstaduaisNaoEleitosSPRepository,
 )
@@ -9,6 +13,9 @@ from ..schemas.estaduais_nao_eleitos_sp import EstaduaisNaoEleitosSPRead
 
 
 class EstaduaisNaoEleitosSPService:
+    TABLES = (EstaduaisNaoEleitosSP.__tablename__,)
+    DICTIONARY_FIELDS = ("uf", "cargo", "partido", "genero", "situacao")
+
     def __init__(self, db: Session) -> None:
         self.repository = EstaduaisNaoEleitosSPRepository(db)
 
@@ -18,14 +25,33 @@ class EstaduaisNaoEleitosSPService:
         partido: Optional[str] = None,
         situacao: Optional[str] = None,
         limit: int = 100,
-    ) -> List[EstaduaisNaoEleitosSPRead]:
-        registros = self.repository.list_all(
+        formato: str = JSON,
+        campos: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        keyset = self.repository.KEYSET
+        filtros = dict(
             nome_candidato=nome_candidato,
             partido=partido,
             situacao=situacao,
             limit=limit,
+            columns=campos,
+            after=keyset.decode(cursor) if cursor else None,
+        )
+
+        def load_page():
+            # Uma linha a mais indica se existe a página seguinte.
+            return keyset.page(self.repository.list_all(**dict(filtros, limit=limit + 1)), limit)
+
+        return get_cache().fetch_page(
+            "estaduais_nao_eleitos_sp.list",
+            self.TABLES,
+            filtros,
+            load_page,
+            list_kind(EstaduaisNaoEleitosSPRead, campos),
+            formato,
+            self.DICTIONARY_FIELDS,
         )
-        return [EstaduaisNaoEleitosSPRead.model_validate(registro) for registro in registros]
 
     def get_estaduais_nao_eleitos_sp(self, registro_id: int) -> EstaduaisNaoEleitosSPRead:
         registro = self.repository.get_by_id(registro_id)
@@ -1,12 +1,19 @@
-from typing import List, Optional
+from typing import Optional, Sequence
 
 from sqlalchemy.orm import Session
 
+from ..core.cache import get_cache
+from ..core.pagination import Page
+from ..core.serialization import JSON, list_kind
+from ..db.models import FederaisNaoEleitosSP
 from ..db.repositories.federais_nao_eleitos_sp_repository import FederaisNaoEleitosSPRepository
 from ..schemas.federais_nao_eleitos_sp import FederaisNaoEleitosSPRead
 
 
 class FederaisNaoEleitosSPService:
+    TABLES = (FederaisNaoEleitosSP.__tablename__,)
+    DICTIONARY_FIELDS = ("uf", "cargo", "partido", "genero", "situacao")
+
     def __init__(self, db: Session) -> None:
         self.repository = FederaisNaoEleitosSPRepository(db)
 
@@ -15,15 +22,34 @@ class FederaisNaoEleitosSPService:
         nome_candidato: Optional[str] = None,
         partido: Optional[str] = None,
         situacao: Optional[str] = None,
-        limit: int = 100
-    ) -> List[FederaisNaoEleitosSPRead]:
-        registros = self.repository.list_all(
+        limit: int = 100,
+        formato: str = JSON,
+        campos: Optional[Sequence[str]] = None,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        keyset = self.repository.KEYSET
+        filtros = dict(
             nome_candidato=nome_candidato,
             partido=partido,
             situacao=situacao,
-            limit=limit
+            limit=limit,
+            columns=campos,
+            after=keyset.decode(cursor) if cursor else None,
+        )
+
+        def load_page():
+            # Uma linha a mais indica se existe a página seguinte.
+            return keyset.page(self.repository.list_all(**dict(filtros, limit=limit + 1)), limit)
+
+        return get_cache().fetch_page(
+            "federais_nao_eleitos_sp.list",
+            self.TABLES,
+            filtros,
+            load_page,
+            list_kind(FederaisNaoEleitosSPRead, campos),
+            formato,
+            self.DICTIONARY_FIELDS,
         )
-        return [FederaisNaoEleitosSPRead.model_validate(registro) for registro in registros]
 
     def get_federais_nao_eleitos_sp(self, registro_id: int) -> FederaisNaoEleitosSPRead:
         registro = self.repository.get_by_id(registro_id)
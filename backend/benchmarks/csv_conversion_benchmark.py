@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark da conversão de CSV: conversão antiga por linha x plano compilado
+x leitura do snapshot binário.
+
+A versão antiga (DictReader, normalização do cabeçalho a cada célula e
+despacho de tipo por conjunto) é reproduzida aqui apenas para comparação.
+
+    python benchmarks/csv_conversion_benchmark.py --repeat 20
+"""
+import argparse
+import csv
+import sys
+import tempfile
+import time
+import unicodedata
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.db.seeders.candidato_sp_seeder import SCHEMA  # noqa: E402
+from app.ingest.conversion import iter_csv_records  # noqa: E402
+from app.ingest.snapshot import Snapshot, SnapshotWriter  # noqa: E402
+
+DATA_PATH = backend_dir / "data" / "candidatos_sp_2022.csv"
+
+EXPECTED_FIELDS = set(SCHEMA.fields)
+NUMERIC_FIELDS = {"historico_de_votos", "historico_de_fefc", "ano"}
+
+
+def _legacy_normalize_column(column):
+    normalized = unicodedata.normalize("NFKD", column)
+    normalized = (
+        normalized.encode("ascii", "ignore")
+        .decode("ascii")
+        .lower()
+        .replace(" ", "_")
+        .replace("/", "_")
+    )
+    while "__" in normalized:
+        normalized = normalized.replace("__", "_")
+    return normalized.strip("_")
+
+
+def _legacy_parse_value(field, value):
+    value = value.strip()
+    if value == "":
+        return None
+    if field in NUMERIC_FIELDS:
+        try:
+            return int(value.replace(".", ""))
+        except ValueError:
+            return None
+    return value
+
+
+def _legacy_build_record(row):
+    record = {}
+    for column, value in row.items():
+        field = _legacy_normalize_column(column)
+        if field not in EXPECTED_FIELDS:
+            continue
+        record[field] = _legacy_parse_value(field, value or "")
+    for field in EXPECTED_FIELDS.difference(record.keys()):
+        record[field] = None
+    return record
+
+
+def legacy(path):
+    with path.open(encoding="utf-8-sig", newline="") as csvfile:
+        return [_legacy_build_record(row) for row in csv.DictReader(csvfile)]
+
+
+def compiled(path):
+    return list(iter_csv_records(path, SCHEMA))
+
+
+def snapshot_reader(snapshot_path):
+    def read(path):
+        with Snapshot(snapshot_path) as snapshot:
+            return list(snapshot.iter_records())
+
+    return read
+
+
+def measure(function, repeat):
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(function(DATA_PATH))
+        best = min(best, time.perf_counter() - started)
+    return rows / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    records = compiled(DATA_PATH)
+    assert legacy(DATA_PATH) == records, "As duas conversões divergem"
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = Path(directory) / "candidatos_sp.snap"
+        writer = SnapshotWriter(SCHEMA)
+        for record in records:
+            writer.append(record)
+        writer.save(snapshot_path)
+        read_snapshot = snapshot_reader(snapshot_path)
+        assert read_snapshot(DATA_PATH) == records, "O snapshot diverge do CSV"
+
+        results = [
+            ("antiga", measure(legacy, args.repeat)),
+            ("compilada", measure(compiled, args.repeat)),
+            ("snapshot", measure(read_snapshot, args.repeat)),
+        ]
+
+    baseline = results[0][1]
+    print(f"arquivo: {DATA_PATH.name}")
+    for name, rate in results:
+        print(f"{name:>10}: {rate:>12,.0f} registros/s ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark da serialização da listagem /api/v1/candidatos-sp-22-24.
+
+Compara, sobre as mesmas linhas lidas de candidatos_sp_22_24 (mapeamentos,
+como os repositórios devolvem):
+
+* antigo: ``model_validate`` linha a linha, validação do ``response_model``
+  pelo FastAPI e ``json.dumps`` do JSONResponse;
+* pydantic: validação e JSON em uma passagem pelo ``TypeAdapter``;
+* dump_rows: dicionários com os campos do schema e orjson (caminho atual);
+* columnar / msgpack: os formatos colunares, com codificação por dicionário;
+* cache: acerto no cache de respostas, que devolve os bytes guardados.
+
+O tamanho é mostrado sem compressão e com gzip no nível padrão.
+
+Usa o banco de DATABASE_URL; com menos linhas que ``--rows`` na tabela, as
+existentes são repetidas.
+
+    python benchmarks/json_response_benchmark.py --rows 1000
+"""
+import argparse
+import asyncio
+import gzip
+import logging
+import sys
+import time
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Callable, List
+
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from app.core.cache import MemoryBackend, ResponseCache  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from app.core.serialization import COLUMNAR, MSGPACK, dump_rows, encode_rows  # noqa: E402
+from app.db.models import CandidatosSP2224  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.schemas.candidatos_sp_22_24 import CandidatosSP2224Read  # noqa: E402
+from app.services.candidatos_sp_22_24_service import CandidatosSP2224Service  # noqa: E402
+
+KIND = List[CandidatosSP2224Read]
+
+
+def load_rows(total: int) -> list:
+    session = SessionLocal()
+    try:
+        table = CandidatosSP2224.__table__
+        rows = session.execute(select(table).order_by(table.c.id).limit(total)).mappings().all()
+    finally:
+        session.close()
+    if not rows:
+        raise SystemExit("candidatos_sp_22_24 está vazia; carregue o seed antes do benchmark.")
+    return list(islice(cycle(rows), total))
+
+
+def previous_path(rows: list) -> Callable[[], bytes]:
+    field = create_response_field(name="response", type_=KIND)
+    loop = asyncio.new_event_loop()
+
+    def run() -> bytes:
+        content = [CandidatosSP2224Read.model_validate(dict(row)) for row in rows]
+        encoded = loop.run_until_complete(
+            serialize_response(field=field, response_content=content, is_coroutine=False)
+        )
+        return JSONResponse(encoded).body
+
+    return run
+
+
+def pydantic_path(rows: list) -> Callable[[], bytes]:
+    adapter = TypeAdapter(KIND)
+    return lambda: adapter.dump_json(adapter.validate_python(rows))
+
+
+def cached_path(rows: list) -> Callable[[], bytes]:
+    cache = ResponseCache(MemoryBackend())
+    params = {"limit": len(rows)}
+    cache.fetch_body("bench", ("candidatos_sp_22_24",), params, lambda: rows, KIND)
+    return lambda: cache.fetch_body("bench", ("candidatos_sp_22_24",), params, lambda: rows, KIND)
+
+
+def measure(function: Callable[[], bytes], repeat: int) -> float:
+    function()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    rows = load_rows(args.rows)
+
+    paths = {
+        "antigo": previous_path(rows),
+        "pydantic": pydantic_path(rows),
+        "dump_rows": lambda: dump_rows(KIND, rows),
+    }
+    for fmt in (COLUMNAR, MSGPACK):
+        paths[fmt] = lambda fmt=fmt: encode_rows(KIND, rows, fmt, CandidatosSP2224Service.DICTIONARY_FIELDS)
+    paths["cache"] = cached_path(rows)
+
+    print(f"Banco: {engine.dialect.name} | linhas: {len(rows)} | repetições: {args.repeat}")
+    baseline = None
+    for name, function in paths.items():
+        body = function()
+        elapsed = measure(function, args.repeat)
+        baseline = baseline or elapsed
+        print(
+            f"{name:>10}: {elapsed * 1000:8.2f} ms/resposta "
+            f"({elapsed / len(rows) * 1e6:6.2f} µs/linha, {baseline / elapsed:6.1f}x) | "
+            f"{len(body):>9,} bytes, {len(gzip.compress(body)):>8,} com gzip"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark da paginação de candidatos_sp_22_24: OFFSET x cursor (keyset).
+
+Percorre a listagem página a página e, para algumas profundidades, mede o
+tempo de ler a página com ``LIMIT/OFFSET`` e com o cursor da página anterior
+(``core/pagination.py``, o caminho dos endpoints). Com o cursor, o tempo deve
+ficar estável da primeira à última página.
+
+Usa o banco de DATABASE_URL.
+
+    python benchmarks/pagination_benchmark.py --page-size 100 --repeat 20
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.db.repositories.candidatos_sp_22_24_repository import CandidatosSP2224Repository  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+
+KEYSET = CandidatosSP2224Repository.KEYSET
+
+
+def offset_reader(session, page_size: int, offset: int) -> Callable[[], Any]:
+    table = KEYSET.table
+    query = (
+        select(*table.columns)
+        .where(table.c.ordem == 1, table.c.fundo_partidario.isnot(None))
+        .order_by(*KEYSET.order_by())
+        .limit(page_size)
+        .offset(offset)
+    )
+    return lambda: session.execute(query).mappings().all()
+
+
+def cursor_positions(repository: CandidatosSP2224Repository, page_size: int) -> Dict[int, Any]:
+    """Posição de início de cada página, seguindo os cursores desde a primeira."""
+    positions: Dict[int, Any] = {0: None}
+    after, page = None, 0
+    while True:
+        _, cursor = KEYSET.page(repository.list_all(limit=page_size + 1, after=after), page_size)
+        if cursor is None:
+            return positions
+        page += 1
+        after = KEYSET.decode(cursor)
+        positions[page] = after
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    function()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    session = SessionLocal()
+    try:
+        repository = CandidatosSP2224Repository(session)
+        positions = cursor_positions(repository, args.page_size)
+        last = max(positions)
+        pages = sorted({0, last // 4, last // 2, last})
+        print(
+            f"Banco: {engine.dialect.name} | páginas: {last + 1} de {args.page_size} | "
+            f"repetições: {args.repeat}"
+        )
+        for page in pages:
+            offset_time = timed(offset_reader(session, args.page_size, page * args.page_size), args.repeat)
+            cursor_time = timed(
+                lambda: repository.list_all(limit=args.page_size, after=positions[page]), args.repeat
+            )
+            print(
+                f"página {page:>5}: offset {offset_time * 1000:7.2f} ms | "
+                f"cursor {cursor_time * 1000:7.2f} ms ({offset_time / cursor_time:5.1f}x)"
+            )
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
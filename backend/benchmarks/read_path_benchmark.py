@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark das leituras das listagens: ORM (``query().all()``) x Core.
+
+Para cada tabela listada, executa a consulta da listagem dos dois jeitos e
+mede o tempo por linha (leitura e leitura + serialização com ``dump_rows``)
+e o pico de memória alocada durante a leitura (tracemalloc). O caminho ORM
+reproduz o repositório antigo: objetos no identity map da sessão; o Core é o
+que os repositórios usam hoje: ``select`` sobre as colunas, linhas como
+``RowMapping``.
+
+Usa o banco de DATABASE_URL.
+
+    python benchmarks/read_path_benchmark.py --limit 1000 --repeat 30
+"""
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Sequence, Tuple
+
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.core.serialization import dump_rows  # noqa: E402
+from app.db.models import (  # noqa: E402
+    CandidatoGrid,
+    CandidatosSP2224,
+    EstaduaisNaoEleitosSP,
+    FederaisNaoEleitosSP,
+)
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.schemas.candidato_grid import CandidatoGridRead  # noqa: E402
+from app.schemas.candidatos_sp_22_24 import CandidatosSP2224Read  # noqa: E402
+from app.schemas.estaduais_nao_eleitos_sp import EstaduaisNaoEleitosSPRead  # noqa: E402
+from app.schemas.federais_nao_eleitos_sp import FederaisNaoEleitosSPRead  # noqa: E402
+
+# (modelo, ordenação da listagem, schema de leitura)
+LISTS: Sequence[Tuple[Any, Callable[[Any], Any], Any]] = (
+    (CandidatosSP2224, lambda c: c.votos.desc(), CandidatosSP2224Read),
+    (FederaisNaoEleitosSP, lambda c: c.historico_de_votos.desc(), FederaisNaoEleitosSPRead),
+    (EstaduaisNaoEleitosSP, lambda c: c.historico_de_votos.desc(), EstaduaisNaoEleitosSPRead),
+    (CandidatoGrid, lambda c: c.posicao_candidato.asc(), CandidatoGridRead),
+)
+
+
+def orm_reader(session, model, order, limit: int) -> Callable[[], list]:
+    return lambda: session.query(model).order_by(order(model)).limit(limit).all()
+
+
+def core_reader(session, model, order, limit: int) -> Callable[[], list]:
+    table = model.__table__
+    query = select(*table.columns).order_by(order(table.c)).limit(limit)
+    return lambda: session.execute(query).mappings().all()
+
+
+def timed(function: Callable[[], Any], session, repeat: int) -> float:
+    function()
+    session.expunge_all()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+        # Sem isso o ORM reaproveitaria os objetos do identity map.
+        session.expunge_all()
+    return (time.perf_counter() - started) / repeat
+
+
+def peak_memory(function: Callable[[], list], session) -> int:
+    session.expunge_all()
+    tracemalloc.start()
+    rows = function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    session.expunge_all()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    session = SessionLocal()
+    print(f"Banco: {engine.dialect.name} | limite: {args.limit} | repetições: {args.repeat}")
+    try:
+        for model, order, schema in LISTS:
+            kind = List[schema]
+            readers = {
+                "orm": orm_reader(session, model, order, args.limit),
+                "core": core_reader(session, model, order, args.limit),
+            }
+            count = len(readers["core"]())
+            if not count:
+                print(f"{model.__tablename__}: vazia, ignorada")
+                continue
+            print(f"{model.__tablename__} ({count} linhas)")
+            for name, read in readers.items():
+                read_time = timed(read, session, args.repeat)
+                full_time = timed(lambda: dump_rows(kind, read()), session, args.repeat)
+                memory = peak_memory(read, session)
+                print(
+                    f"  {name:>4}: leitura {read_time / count * 1e6:7.2f} µs/linha | "
+                    f"com JSON {full_time / count * 1e6:7.2f} µs/linha | "
+                    f"memória {memory / count:8,.0f} B/linha"
+                )
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
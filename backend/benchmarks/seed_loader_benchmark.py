@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos modos de carga dos seeders (executemany em lotes x LOAD DATA).
+
+Replica as linhas de data/candidatos_sp_2022.csv até o volume pedido e mede
+registros/s de uma carga completa da tabela candidatos_sp em cada modo.
+Usa o banco de DATABASE_URL; no SQLite o modo nativo cai para executemany.
+
+    python benchmarks/seed_loader_benchmark.py --rows 200000
+"""
+import argparse
+import logging
+import sys
+import time
+from itertools import cycle, islice
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+
+from app.db.base import Base  # noqa: E402
+from app.db.models import CandidatoSP  # noqa: E402
+from app.db.seeders.candidato_sp_seeder import NATURAL_KEY, SCHEMA  # noqa: E402
+from app.db.seeders.loaders import BATCH_LOADER, NATIVE_LOADER  # noqa: E402
+from app.db.seeders.sync import sync_records  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.ingest.conversion import iter_csv_records  # noqa: E402
+
+DATA_PATH = backend_dir / "data" / "candidatos_sp_2022.csv"
+
+
+def generate_records(total: int):
+    base = list(iter_csv_records(DATA_PATH, SCHEMA))
+    for index, record in enumerate(islice(cycle(base), total)):
+        copy = dict(record)
+        copy["candidato"] = f"{record['candidato']} #{index // len(base)}"
+        yield copy
+
+
+def run(mode: str, rows: int, batch_size: int) -> float:
+    session = SessionLocal()
+    try:
+        session.query(CandidatoSP).delete()
+        session.commit()
+        started = time.perf_counter()
+        result = sync_records(
+            session,
+            CandidatoSP,
+            generate_records(rows),
+            NATURAL_KEY,
+            batch_size=batch_size,
+            loader_mode=mode,
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        session.close()
+    assert result.inserted == rows, result
+    return rows / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    Base.metadata.create_all(bind=engine, tables=[CandidatoSP.__table__])
+
+    print(f"Banco: {engine.dialect.name} | linhas: {args.rows} | lote: {args.batch_size}")
+    for mode in (BATCH_LOADER, NATIVE_LOADER):
+        rate = run(mode, args.rows, args.batch_size)
+        print(f"{mode:>8}: {rate:>12,.0f} registros/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark de inicialização: tempo de importação do app.main e tempo até a primeira resposta.
+
+Mede, em processos novos, o tempo acumulado de ``import app.main`` segundo
+``python -X importtime`` (mediana de várias execuções), confere que os módulos
+pesados carregados sob demanda não entram na importação e sobe o uvicorn para
+medir o tempo até o primeiro 200 em /health/live. Termina com código 1 se
+algum orçamento for ultrapassado, para ser usado na CI.
+
+    python benchmarks/startup_benchmark.py --import-budget-ms 2500 --first-response-budget-ms 5000
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[1]
+
+# Módulos que só podem ser importados quando usados (autenticação, driver do
+# banco, seeders e ingestão).
+LAZY_MODULES = (
+    "jose",
+    "passlib",
+    "bcrypt",
+    "mysql.connector",
+    "app.db.seeders",
+    "app.db.seeders.runner",
+    "app.ingest.conversion",
+)
+
+
+def _environment() -> dict:
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite:////tmp/startup_benchmark.db")
+    env["PYTHONPATH"] = str(backend_dir)
+    return env
+
+
+def measure_import(runs: int) -> float:
+    """Mediana, em ms, do tempo acumulado de ``app.main`` no -X importtime."""
+    samples = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import app.main"],
+            cwd=backend_dir,
+            env=_environment(),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in completed.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == "app.main":
+                samples.append(int(parts[1]) / 1000)
+                break
+    return statistics.median(samples)
+
+
+def eagerly_loaded() -> list:
+    code = (
+        "import sys, app.main; "
+        f"print('\\n'.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=backend_dir,
+        env=_environment(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [line for line in completed.stdout.splitlines() if line]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_first_response(timeout: float) -> float:
+    """Tempo, em ms, entre disparar o uvicorn e o primeiro 200 em /health/live."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health/live"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=backend_dir,
+        env=_environment(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError("O uvicorn encerrou antes de responder")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise RuntimeError(f"Sem resposta de {url} em {timeout:.0f} segundos")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=2500)
+    parser.add_argument("--first-response-budget-ms", type=float, default=5000)
+    parser.add_argument("--skip-server", action="store_true", help="não mede a primeira resposta")
+    args = parser.parse_args()
+
+    failures = []
+
+    import_ms = measure_import(args.runs)
+    print(f"import app.main: {import_ms:>8.0f} ms (orçamento {args.import_budget_ms:.0f} ms)")
+    if import_ms > args.import_budget_ms:
+        failures.append("tempo de importação acima do orçamento")
+
+    loaded = eagerly_loaded()
+    print(f"módulos sob demanda carregados na importação: {', '.join(loaded) or 'nenhum'}")
+    if loaded:
+        failures.append("módulos pesados importados junto com app.main")
+
+    if not args.skip_server:
+        first_ms = measure_first_response(args.first_response_budget_ms / 1000 * 4)
+        print(
+            f"primeira resposta: {first_ms:>8.0f} ms (orçamento {args.first_response_budget_ms:.0f} ms)"
+        )
+        if first_ms > args.first_response_budget_ms:
+            failures.append("tempo até a primeira resposta acima do orçamento")
+
+    if failures:
+        print("FALHOU: " + "; ".join(failures))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +0,0 @@
-# Scripts de migração e utilitários
-
@@ -1,72 +0,0 @@
-import sys
-import os
-sys.path.insert(0, '/app')
-
-# Criar diretório
-os.makedirs('/app/data', exist_ok=True)
-
-# CSV content
-csv_lines = [
-    "UF,CANDIDATO,HISTÓRICO DE VOTOS,CARGO,HISTÓRICO DE FEFC,PARTIDO,GÊNERO,SITUAÇÃO",
-    "SÃO PAULO,PABLO MARÇAL,243037,Deputado Federal,1439254,PROS,MASCULINO,NÃO ELEITO",
-    "SÃO PAULO,ORLANDO SILVA,108059,Deputado Federal,2575274,PC do B,MASCULINO,SUPLENTE",
-    'SÃO PAULO,"PROFESSOR HOC, HENI OZI CUKIER",98720,Deputado Federal,1541100,PODE,MASCULINO,SUPLENTE',
-    "SÃO PAULO,DEPUTADO ALFREDINHO,97063,Deputado Federal,1807512,PT,MASCULINO,SUPLENTE",
-    "SÃO PAULO,PROF. MARCO ANTONIO VILLA,95745,Deputado Federal,2001975,CIDADANIA,MASCULINO,SUPLENTE",
-    "SÃO PAULO,ELY SANTOS,93305,Deputado Federal,2513831,REPUBLICANOS,FEMININO,SUPLENTE",
-    "SÃO PAULO,ROBERTO ALVES,92566,Deputado Federal,1509713,REPUBLICANOS,MASCULINO,SUPLENTE",
-    "SÃO PAULO,EDUARDO CURY,92225,Deputado Federal,1968455,PSDB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,ADRILLES JORGE,91485,Deputado Federal,1558445,PTB,MASCULINO,NÃO ELEITO",
-    "SÃO PAULO,JOSÉ SERRA,88926,Deputado Federal,3175000,PSDB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,VANDERLEI MACRIS,87502,Deputado Federal,3096834,PSDB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,VICENTINHO,82912,Deputado Federal,2339990,PT,MASCULINO,SUPLENTE",
-    "SÃO PAULO,SAULO PEDROSO,80186,Deputado Federal,1251056,PSD,MASCULINO,SUPLENTE",
-    "SÃO PAULO,JOÃO CURY,80085,Deputado Federal,2734346,MDB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,SAMUEL MOREIRA,79633,Deputado Federal,2226867,PSDB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,FRED MACHADO,79041,Deputado Federal,2996590,PSDB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,ENRICO MISASI,77949,Deputado Federal,2542750,MDB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,DOUGLAS VIEGAS,76149,Deputado Federal,1747983,UNIÃO,MASCULINO,SUPLENTE",
-    "SÃO PAULO,DENIS ANDIA,75082,Deputado Federal,1292500,MDB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,PEDRO TOURINHO,74729,Deputado Federal,1401717,PT,MASCULINO,SUPLENTE",
-    "SÃO PAULO,RICARDO IZAR,70142,Deputado Federal,1870839,REPUBLICANOS,MASCULINO,SUPLENTE",
-    "SÃO PAULO,CORONEL TELHADA,69945,Deputado Federal,2361600,PP,MASCULINO,SUPLENTE",
-    "SÃO PAULO,ROBERTO DE LUCENA,69341,Deputado Federal,1954850,REPUBLICANOS,MASCULINO,SUPLENTE",
-    "SÃO PAULO,RODRIGO AGOSTINHO,65506,Deputado Federal,2621086,PSB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,RIBAMAR SILVA,65219,Deputado Federal,1583909,PSD,MASCULINO,SUPLENTE",
-    "SÃO PAULO,PAULINHO DA FORÇA,64137,Deputado Federal,1916290,SOLIDARIEDADE,MASCULINO,SUPLENTE",
-    "SÃO PAULO,GUILHERME PIAI,63190,Deputado Federal,858606,REPUBLICANOS,MASCULINO,SUPLENTE",
-    "SÃO PAULO,REINALDO ALGUZ,62666,Deputado Federal,2225075,UNIÃO,MASCULINO,SUPLENTE",
-    "SÃO PAULO,ADILSON BARROSO,62445,Deputado Federal,3003432,PL,MASCULINO,SUPLENTE",
-    "SÃO PAULO,MISSIONÁRIO JOSÉ OLÍMPIO,61938,Deputado Federal,520842,PL,MASCULINO,SUPLENTE",
-    "SÃO PAULO,CORONEL TADEU,61546,Deputado Federal,575036,PL,MASCULINO,SUPLENTE",
-    "SÃO PAULO,POLICIAL KATIA SASTRE,60330,Deputado Federal,2621292,PL,FEMININO,SUPLENTE",
-    "SÃO PAULO,ELI CORRÊA FILHO,59959,Deputado Federal,2655939,UNIÃO,MASCULINO,SUPLENTE",
-    "SÃO PAULO,MARCELO HERCOLIN,58419,Deputado Federal,2742227,UNIÃO,MASCULINO,SUPLENTE",
-    "SÃO PAULO,RITA PASSOS,57800,Deputado Federal,2517573,REPUBLICANOS,FEMININO,SUPLENTE",
-    "SÃO PAULO,WALTER IHOSHI,55027,Deputado Federal,1775961,PSD,MASCULINO,SUPLENTE",
-    "SÃO PAULO,GUIGA PEIXOTO,54849,Deputado Federal,256250,PSC,MASCULINO,SUPLENTE",
-    "SÃO PAULO,ORLANDO VITORIANO,54243,Deputado Federal,769108,PT,MASCULINO,SUPLENTE",
-    "SÃO PAULO,MARLON DO UBER,53845,Deputado Federal,610120,MDB,MASCULINO,SUPLENTE",
-    "SÃO PAULO,ELIEL MIRANDA,50875,Deputado Federal,171986,PSD,MASCULINO,SUPLENTE",
-]
-
-# Escrever arquivo
-with open('/app/data/federais.csv', 'w', encoding='utf-8-sig') as f:
-    f.write('\n'.join(csv_lines))
-
-print('Arquivo CSV criado em /app/data/federais.csv')
-
-# Executar seeder
-import logging
-logging.basicConfig(level=logging.INFO)
-from app.db.seeders.federais_nao_eleitos_sp_seeder import seed_federais_nao_eleitos_sp
-seed_federais_nao_eleitos_sp(force=True)
-print('Seed concluído com sucesso!')
-
-
-
-
-
-
-
-
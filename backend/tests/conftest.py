@@ -0,0 +1,38 @@
+"""
+Configuração dos testes: banco SQLite temporário e cache em memória, sem o
+barramento de invalidação. As variáveis de ambiente são definidas antes de
+qualquer importação de ``app``, que lê as configurações na importação.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+backend_dir = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(backend_dir))
+# As configurações leem o .env do diretório atual; o da raiz é o do frontend.
+os.chdir(backend_dir)
+
+_database = Path(tempfile.mkdtemp(prefix="painel-tests-")) / "tests.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{_database}"
+os.environ["CACHE_BACKEND"] = "memory"
+os.environ["CACHE_BUS"] = "none"
+os.environ["SNAPSHOT_ENABLED"] = "false"
+
+import pytest  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, get_engine  # noqa: E402
+
+
+@pytest.fixture
+def session():
+    """Sessão em um banco com as tabelas dos modelos, recriadas vazias a cada teste."""
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,20 @@
+from app.core.cache import normalize_params
+
+
+def test_normalize_params_ignores_order_empty_values_and_case():
+    first = normalize_params({"partido": "PODE", "limit": 10, "nome": None, "genero": ""})
+    second = normalize_params({"limit": 10, "partido": "pode"})
+    assert first == second == "limit=10&partido='pode'"
+
+
+def test_normalize_params_keeps_whitespace():
+    # Espaços mudam o ILIKE da consulta, então mudam a chave.
+    assert normalize_params({"nome": " ana"}) != normalize_params({"nome": "ana"})
+
+
+def test_normalize_params_does_not_confuse_separators():
+    assert normalize_params({"nome": "a&partido=b"}) != normalize_params({"nome": "a", "partido": "b"})
+
+
+def test_normalize_params_distinguishes_types():
+    assert normalize_params({"ano": 2022}) != normalize_params({"ano": "2022"})
@@ -0,0 +1,46 @@
+import pytest
+
+from app.ingest.conversion import decimal, integer, normalize_header, text
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1234", 1234),
+        ("1.234.567", 1234567),
+        ("1234,00", 1234),
+        ("1.234,99", 1234),
+        ("-3", -3),
+        ("  42 ", 42),
+        ("", None),
+        ("   ", None),
+        ("abc", None),
+    ],
+)
+def test_integer(value, expected):
+    assert integer(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1.234,56", 1234.56),
+        ("1234.56", 1234.56),
+        ("0,5", 0.5),
+        ("1234", 1234.0),
+        ("", None),
+        ("R$ 10", None),
+    ],
+)
+def test_decimal(value, expected):
+    assert decimal(value) == expected
+
+
+def test_text_strips_and_nulls_empty_values():
+    assert text("  PODE ") == "PODE"
+    assert text("   ") is None
+
+
+def test_normalize_header():
+    assert normalize_header("HISTÓRICO DE VOTOS") == "historico_de_votos"
+    assert normalize_header("RAÇA/COR") == "raca_cor"
@@ -0,0 +1,27 @@
+import pytest
+
+from app.ingest.mojibake import repair
+
+
+@pytest.mark.parametrize(
+    "broken, fixed",
+    [
+        ("SÃƒO PAULO", "SÃO PAULO"),
+        ("MARÃ‡AL", "MARÇAL"),
+        ("JOÃƒO", "JOÃO"),
+        ("JOSÃ‰", "JOSÉ"),
+        ("CONCEIÃ‡ÃƒO", "CONCEIÇÃO"),
+    ],
+)
+def test_repair_double_encoded_text(broken, fixed):
+    assert repair(broken) == fixed
+
+
+def test_repair_undoes_more_than_one_layer():
+    twice = "SÃO PAULO".encode("utf-8").decode("cp1252").encode("utf-8").decode("cp1252")
+    assert repair(twice) == "SÃO PAULO"
+
+
+@pytest.mark.parametrize("value", ["SÃO PAULO", "JOSÉ", "ÂNGELA", "PODE", ""])
+def test_repair_leaves_correct_text_alone(value):
+    assert repair(value) is None
@@ -0,0 +1,74 @@
+import pytest
+
+from app.core.pagination import Keyset, pack_page, unpack_page
+from app.db.models import CandidatoGrid, FederaisNaoEleitosSP
+from app.db.repositories.federais_nao_eleitos_sp_repository import FederaisNaoEleitosSPRepository
+
+VOTES = Keyset(FederaisNaoEleitosSP.__table__, "historico_de_votos", descending=True)
+POSITION = Keyset(CandidatoGrid.__table__, "posicao_candidato")
+
+
+@pytest.mark.parametrize("row", [{"historico_de_votos": 1234, "id": 7}, {"historico_de_votos": None, "id": 3}])
+def test_cursor_round_trip(row):
+    assert VOTES.decode(VOTES.encode(row)) == (row["historico_de_votos"], row["id"])
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "zzz",
+        VOTES.encode({"historico_de_votos": "10", "id": 1}),
+        VOTES.encode({"historico_de_votos": True, "id": 1}),
+        VOTES.encode({"historico_de_votos": 10, "id": "1"}),
+    ],
+)
+def test_decode_rejects_foreign_cursors(cursor):
+    with pytest.raises(ValueError):
+        VOTES.decode(cursor)
+
+
+def test_decode_rejects_null_for_required_column():
+    with pytest.raises(ValueError):
+        POSITION.decode(POSITION.encode({"posicao_candidato": None, "id": 1}))
+
+
+def test_page_cuts_the_extra_row():
+    rows = [{"historico_de_votos": votes, "id": index} for index, votes in enumerate([30, 20, 10], 1)]
+    body, cursor = VOTES.page(rows, 2)
+    assert body == rows[:2]
+    assert VOTES.decode(cursor) == (20, 2)
+    assert VOTES.page(rows[:2], 2) == (rows[:2], None)
+
+
+def test_pack_page_round_trip():
+    assert unpack_page(pack_page(b'[{"a":1}]', "abc")) == (b'[{"a":1}]', "abc")
+    assert unpack_page(pack_page(b"\n[]", None)) == (b"\n[]", None)
+
+
+def test_cursor_walk_matches_full_listing(session):
+    """Votos decrescentes com empates e nulos; o id desempata em ordem crescente."""
+    votes = [500, 300, None, 300, 100, 300, None, 500, 0, 100, 300]
+    session.execute(
+        FederaisNaoEleitosSP.__table__.insert(),
+        [
+            {"uf": "SP", "candidato": f"C{index}", "historico_de_votos": value, "cargo": "Deputado Federal", "partido": "P"}
+            for index, value in enumerate(votes)
+        ],
+    )
+    session.commit()
+    repository = FederaisNaoEleitosSPRepository(session)
+    keyset = repository.KEYSET
+    expected = [row["id"] for row in repository.list_all(limit=100)]
+
+    walked, after = [], None
+    while True:
+        rows, cursor = keyset.page(repository.list_all(limit=3 + 1, after=after), 3)
+        walked += [row["id"] for row in rows]
+        if cursor is None:
+            break
+        after = keyset.decode(cursor)
+
+    assert walked == expected
+    by_id = {row["id"]: row["historico_de_votos"] for row in repository.list_all(limit=100)}
+    ordered = sorted(by_id, key=lambda key: (by_id[key] is None, -(by_id[key] or 0), key))
+    assert walked == ordered
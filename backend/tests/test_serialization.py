@@ -0,0 +1,57 @@
+from typing import List
+
+import msgpack
+import orjson
+
+from app.core.serialization import COLUMNAR, JSON, MSGPACK, encode_rows, list_kind
+from app.schemas.federais_nao_eleitos_sp import FederaisNaoEleitosSPRead
+
+ROWS = [
+    {"id": 1, "uf": "SP", "candidato": "ANA", "historico_de_votos": 10, "cargo": "Deputado Federal",
+     "historico_de_fefc": None, "partido": "PODE", "genero": "FEMININO", "situacao": None},
+    {"id": 2, "uf": "SP", "candidato": "JOSÉ", "historico_de_votos": None, "cargo": "Deputado Federal",
+     "historico_de_fefc": 5, "partido": "PODE", "genero": None, "situacao": "SUPLENTE"},
+]
+KIND = List[FederaisNaoEleitosSPRead]
+FIELDS = list(FederaisNaoEleitosSPRead.model_fields)
+
+
+def test_json_follows_schema_order():
+    body = encode_rows(KIND, ROWS, JSON)
+    assert orjson.loads(body) == [{name: row[name] for name in FIELDS} for row in ROWS]
+    assert list(orjson.loads(body)[0]) == FIELDS
+    assert "JOSÉ".encode("utf-8") in body
+
+
+def test_json_matches_pydantic_output():
+    from pydantic import TypeAdapter
+
+    adapter = TypeAdapter(KIND)
+    assert encode_rows(KIND, ROWS, JSON) == adapter.dump_json(adapter.validate_python(ROWS))
+
+
+def test_projection_drops_extra_columns():
+    # As colunas do cursor chegam na linha mesmo fora da seleção de campos.
+    body = encode_rows(list_kind(FederaisNaoEleitosSPRead, ("id", "candidato")), ROWS, JSON)
+    assert orjson.loads(body) == [{"candidato": "ANA", "id": 1}, {"candidato": "JOSÉ", "id": 2}]
+
+
+def test_columnar_uses_dictionaries():
+    payload = orjson.loads(encode_rows(KIND, ROWS, COLUMNAR, ("partido", "genero", "ausente")))
+    assert payload["count"] == 2
+    assert payload["fields"] == FIELDS
+    assert payload["columns"]["partido"] == [0, 0]
+    assert payload["dictionaries"]["partido"] == ["PODE"]
+    assert payload["columns"]["genero"] == [0, None]
+    assert payload["columns"]["candidato"] == ["ANA", "JOSÉ"]
+    assert set(payload["dictionaries"]) == {"partido", "genero"}
+
+
+def test_msgpack_carries_the_columnar_payload():
+    columnar = orjson.loads(encode_rows(KIND, ROWS, COLUMNAR, ("partido",)))
+    assert msgpack.unpackb(encode_rows(KIND, ROWS, MSGPACK, ("partido",))) == columnar
+
+
+def test_empty_listing():
+    assert encode_rows(KIND, [], JSON) == b"[]"
+    assert orjson.loads(encode_rows(KIND, [], COLUMNAR))["count"] == 0
@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import inspect, select
+
+from app.core.cache import get_cache
+from app.db.models import CandidatoSP, CandidatosSP2224
+from app.db.seeders.candidato_sp_seeder import NATURAL_KEY as KEY
+from app.db.seeders.candidatos_sp_22_24_seeder import NATURAL_KEY as SP_22_24_KEY
+from app.db.seeders.sync import SHADOW_STRATEGY, STAGING_SUFFIX, sync_records
+
+
+def candidate(name, votes, partido="PODE"):
+    return {
+        "uf": "SP",
+        "ano": 2022,
+        "cargo": "Deputado Federal",
+        "candidato": name,
+        "historico_de_votos": votes,
+        "historico_de_fefc": None,
+        "partido": partido,
+        "genero": None,
+        "raca_cor": None,
+        "situacao": None,
+    }
+
+
+def table_rows(session):
+    table = CandidatoSP.__table__
+    return {
+        row.candidato: (row.id, row.historico_de_votos, row.partido)
+        for row in session.execute(select(table.c.id, table.c.candidato, table.c.historico_de_votos, table.c.partido))
+    }
+
+
+def test_sync_inserts_updates_and_deletes(session):
+    first = [candidate(name, votes) for name, votes in [("ANA", 10), ("BIA", 20), ("CAU", 30), ("DAN", 40), ("EVA", 50)]]
+    result = sync_records(session, CandidatoSP, first, KEY, batch_size=2)
+    assert (result.inserted, result.updated, result.deleted, result.unchanged) == (5, 0, 0, 0)
+    before = table_rows(session)
+
+    second = [
+        candidate("ANA", 10),
+        candidate("BIA", 25),
+        candidate("DAN", 40, partido="NOVO"),
+        candidate("EVA", 50),
+        candidate("FEL", 60),
+        candidate("ANA", 99),  # repetida em outro lote: fica a primeira
+    ]
+    result = sync_records(session, CandidatoSP, second, KEY, batch_size=2)
+    assert (result.inserted, result.updated, result.deleted, result.unchanged) == (1, 2, 1, 2)
+
+    after = table_rows(session)
+    assert set(after) == {"ANA", "BIA", "DAN", "EVA", "FEL"}
+    assert after["ANA"] == before["ANA"]
+    assert after["BIA"] == (before["BIA"][0], 25, "PODE")
+    assert after["DAN"] == (before["DAN"][0], 40, "NOVO")
+    assert STAGING_SUFFIX not in " ".join(inspect(session.get_bind()).get_table_names())
+
+
+def test_sync_without_changes_writes_nothing(session):
+    records = [candidate("ANA", 10), candidate("BIA", 20)]
+    sync_records(session, CandidatoSP, records, KEY)
+    result = sync_records(session, CandidatoSP, records, KEY, strategy=SHADOW_STRATEGY)
+    assert (result.inserted, result.updated, result.deleted, result.unchanged) == (0, 0, 0, 2)
+
+
+def test_sync_of_empty_input_keeps_the_table(session):
+    sync_records(session, CandidatoSP, [candidate("ANA", 10)], KEY)
+    result = sync_records(session, CandidatoSP, [], KEY)
+    assert result.total == 0
+    assert set(table_rows(session)) == {"ANA"}
+
+
+def test_sync_matches_keys_with_nulls(session):
+    key = SP_22_24_KEY
+    records = [
+        {"ano": 2022, "sequencial_candidato": None, "ordem": 1, "nome": "SEM SEQUENCIAL", "votos": 1},
+        {"ano": 2022, "sequencial_candidato": "250001", "ordem": 1, "nome": "COM SEQUENCIAL", "votos": 2},
+    ]
+    sync_records(session, CandidatosSP2224, records, key)
+    records[0] = dict(records[0], votos=3)
+    result = sync_records(session, CandidatosSP2224, records, key, batch_size=1)
+    assert (result.inserted, result.updated, result.deleted, result.unchanged) == (0, 1, 0, 1)
+    assert session.scalar(select(CandidatosSP2224.votos).where(CandidatosSP2224.sequencial_candidato.is_(None))) == 3
+
+
+def test_failed_sync_bumps_the_cache_version(session):
+    def failing():
+        yield candidate("ANA", 10)
+        yield candidate("BIA", 20)
+        raise RuntimeError("arquivo truncado")
+
+    before = get_cache().backend.counters([CandidatoSP.__tablename__])
+    with pytest.raises(RuntimeError):
+        sync_records(session, CandidatoSP, failing(), KEY, batch_size=1)
+    assert get_cache().backend.counters([CandidatoSP.__tablename__]) != before
+    assert set(table_rows(session)) == {"ANA", "BIA"}
@@ -2,6 +2,9 @@ import React, { useEffect, useState, useMemo } from 'react';
 
 const API_V1_BASE_URL = process.env.REACT_APP_API_V1_BASE_URL || 'http://localhost:8000/api/v1';
 
+// Só as colunas que a tabela exibe.
+const ESTADUAIS_FIELDS = 'candidato,partido,historico_de_votos,historico_de_fefc,genero,situacao';
+
 const formatNumber = (num) => {
   if (num === null || num === undefined) return '-';
   return num.toString().replace(/\B(?=(\d{3})+(?!\d))/g, '.');
@@ -80,7 +83,9 @@ const LeadersSection = () => {
       setLoading(true);
       setError(null);
 
-      const response = await fetch(`${API_V1_BASE_URL}/estaduais-nao-eleitos-sp?limit=100`);
+      const response = await fetch(
+        `${API_V1_BASE_URL}/estaduais-nao-eleitos-sp?limit=100&fields=${ESTADUAIS_FIELDS}`
+      );
 
       if (!response.ok) {
         throw new Error(`Erro ao buscar dados: ${response.status}`);
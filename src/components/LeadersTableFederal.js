@@ -2,6 +2,10 @@ import React, { useEffect, useState, useMemo } from 'react';
 
 const API_V1_BASE_URL = process.env.REACT_APP_API_V1_BASE_URL || 'http://localhost:8000/api/v1';
 
+// Só as colunas que a tabela exibe.
+const CANDIDATOS_FIELDS =
+  'nome,nome_urna,partido,votos,fundo_total,cargo,genero,raca,ano,resultado_agregado';
+
 // Função auxiliar para formatar números com separador de milhar
 const formatNumber = (num) => {
   if (num === null || num === undefined) return '-';
@@ -97,7 +101,9 @@ const LeadersTableFederal = () => {
       setLoading(true);
       setError(null);
       
-      const response = await fetch(`${API_V1_BASE_URL}/candidatos-sp-22-24?limit=500`);
+      const response = await fetch(
+        `${API_V1_BASE_URL}/candidatos-sp-22-24?limit=500&fields=${CANDIDATOS_FIELDS}`
+      );
       
       if (!response.ok) {
         throw new Error(`Erro ao buscar dados: ${response.status}`);